@@ -0,0 +1,76 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+
+Event loop latency of an asyncio consumer taking user-agents with their headers: generated inline on the loop,
+with asyncio.to_thread() per user-agent, and from an AsyncUserAgentPool. A probe task sleeps for 1 ms over and over,
+and its lateness is the time the loop could not run it. Each worker takes a user-agent, then awaits its request.
+Usage: python benchmarks/bench_async_pool.py [count] [workers]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.ua_generator as ua_generator  # noqa: E402
+from src.ua_generator.pool import AsyncUserAgentPool  # noqa: E402
+
+PROBE_INTERVAL = 0.001
+REQUEST = 0.010  # Time each worker awaits its request, between user-agents
+
+
+async def inline():
+    return ua_generator.generate()
+
+
+async def to_thread():
+    return await asyncio.to_thread(ua_generator.generate)
+
+
+async def run(take, count: int, workers: int) -> tuple:
+    lateness = []
+    done = asyncio.Event()
+
+    async def probe():
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(PROBE_INTERVAL)
+            lateness.append(time.perf_counter() - started - PROBE_INTERVAL)
+
+    async def worker(n: int):
+        for _ in range(n):
+            ua = await take()
+            ua.headers.get()
+            await asyncio.sleep(REQUEST)  # The request it would send
+
+    probing = asyncio.ensure_future(probe())
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(count // workers) for _ in range(workers)))
+    seconds = time.perf_counter() - started
+    done.set()
+    await probing
+    return sorted(lateness), count / seconds
+
+
+def report(name: str, lateness: list, rate: float):
+    percentile = lambda ratio: lateness[int(ratio * (len(lateness) - 1))] * 1e3
+    print(f'{name:<10} {rate:>10,.0f} UA/s   loop lateness p50 {percentile(0.5):>6.2f} ms  '
+          f'p99 {percentile(0.99):>6.2f} ms  max {lateness[-1] * 1e3:>6.2f} ms')
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    report('inline', *await run(inline, count, workers))
+    report('to_thread', *await run(to_thread, count, workers))
+    async with AsyncUserAgentPool(size=4096, batch=256) as pool:
+        await asyncio.sleep(0.5)  # Filled before the load, as a long-running crawler's would be
+        report('pool', *await run(pool.get, count, workers))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
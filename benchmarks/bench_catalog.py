@@ -0,0 +1,72 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+
+Load time and resident memory of the catalog: importing the modules, compared to mapping a binary catalog file
+and decoding every entry, or only one. Each measure runs in a new interpreter, after the package is imported.
+Usage: python benchmarks/bench_catalog.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+MEASURE = '''
+import json, os, resource, sys, time
+import src.ua_generator
+from src.ua_generator.data import catalog
+
+
+def rss() -> int:
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+before = rss()
+started = time.perf_counter()
+{load}
+seconds = time.perf_counter() - started
+print(json.dumps({{'seconds': seconds, 'rss': rss() - before}}))
+'''
+
+LOADS = {
+    'modules': 'catalog.Catalog.from_modules()',
+    'binary, every entry': 'loaded = catalog.load(sys.argv[1]); [loaded.get(name) for name in loaded.names()]',
+    'binary, one entry': 'catalog.load(sys.argv[1]).get("chrome")',
+}
+
+
+def measure(load: str, path: str) -> dict:
+    result = subprocess.run([sys.executable, '-c', MEASURE.format(load=load), path],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    sys.path.insert(0, ROOT)
+    from src.ua_generator.data import catalog
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'catalog.bin')
+        catalog.dump(path)
+        print(f'Catalog file: {os.path.getsize(path):,} bytes')
+
+        print(f'{"load":<22} {"ms":>8} {"RSS KiB":>10}')
+        for name, load in LOADS.items():
+            results = [measure(load, path) for _ in range(runs)]
+            seconds = statistics.median(result['seconds'] for result in results)
+            rss = statistics.median(result['rss'] for result in results)
+            print(f'{name:<22} {seconds * 1000:>8.2f} {rss / 1024:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+
+Cold start: the time to import the package, as reported by "python -X importtime", and the time to the first
+user-agent of each platform, which loads its catalog. Each measure runs in a new interpreter.
+Usage: python benchmarks/bench_import.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+PACKAGE = 'src.ua_generator'
+
+
+def import_time() -> float:
+    """
+    The cumulative import time of the package in seconds, in a new interpreter.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {PACKAGE}'],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == PACKAGE:
+            return int(parts[1]) / 1e6
+    raise RuntimeError(f'No import time of {PACKAGE} in: {result.stderr[-200:]}')
+
+
+def first_generation(platform: str) -> float:
+    code = (f'import time; import {PACKAGE} as ua_generator; started = time.perf_counter(); '
+            f'ua_generator.generate(platform="{platform}"); print(time.perf_counter() - started)')
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f'{"import":<24} {statistics.median(import_time() for _ in range(runs)) * 1000:>8.1f} ms')
+    for platform in ('windows', 'macos', 'ios', 'linux', 'android'):
+        seconds = statistics.median(first_generation(platform) for _ in range(runs))
+        print(f'{"first " + platform:<24} {seconds * 1000:>8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+
+Scaling of generate_parallel() with the number of workers, against generate_many() in the same process.
+The efficiency is the speedup divided by the number of workers: close to 1.0 while there are as many CPUs as workers.
+With more workers than CPUs, the speedup stays near 1.0x and the efficiency shows what the processes cost.
+Usage: python benchmarks/bench_parallel.py [count] [workers ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.ua_generator as ua_generator  # noqa: E402
+from src.ua_generator.options import Options  # noqa: E402
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    cpus = os.cpu_count() or 1
+    workers = [int(arg) for arg in sys.argv[2:]] or sorted({1, 2, 4, 8, 16, cpus} & set(range(1, cpus + 1)))
+
+    print(f'{count} user-agents, {cpus} CPUs')
+    start = time.perf_counter()
+    ua_generator.generate_many(count, options=Options(seed=1))
+    baseline = time.perf_counter() - start
+    print(f'generate_many {count / baseline:>12,.0f} ops/sec')
+
+    for worker_count in workers:
+        start = time.perf_counter()
+        ua_generator.generate_parallel(count, workers=worker_count, seed=1)
+        seconds = time.perf_counter() - start
+        speedup = baseline / seconds
+        print(f'{worker_count:>3} workers {count / seconds:>12,.0f} ops/sec {speedup:>6.2f}x '
+              f'{speedup / min(worker_count, cpus):>6.2f} efficiency')
+
+
+if __name__ == '__main__':
+    main()
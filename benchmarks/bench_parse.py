@@ -0,0 +1,46 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+
+Throughput of parse(), in lines per minute, over generated user-agents.
+The versions are only matched, or the client hints and headers are rebuilt too.
+Usage: python benchmarks/bench_parse.py [count]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.ua_generator as ua_generator  # noqa: E402
+from src.ua_generator.data import parser  # noqa: E402
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    texts = ua_generator.generate_many(count)
+
+    started = time.perf_counter()
+    for text in texts:
+        parser.parser().parse(text)
+    print(f'{"first pass":<14} {time.perf_counter() - started:>12.2f} s (compiling the patterns and indexes)')
+
+    def match():
+        parse = parser.parser().parse
+        for text in texts:
+            parse(text)
+
+    def headers():
+        for text in texts:
+            ua_generator.parse(text).headers.get()
+
+    for name, function in (('match', match), ('headers', headers)):
+        started = time.perf_counter()
+        function()
+        seconds = time.perf_counter() - started
+        print(f'{name:<14} {count / seconds * 60:>12,.0f} lines/min')
+
+
+if __name__ == '__main__':
+    main()
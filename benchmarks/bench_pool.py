@@ -0,0 +1,47 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+
+Latency of taking a user-agent with its headers: generated inline, compared to taken from a UserAgentPool
+which its thread refills. The consumer takes one every "interval" seconds, like a request path.
+Usage: python benchmarks/bench_pool.py [count] [interval]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.ua_generator as ua_generator  # noqa: E402
+from src.ua_generator.pool import UserAgentPool  # noqa: E402
+
+
+def latencies(take, count: int, interval: float) -> list:
+    found = []
+    for _ in range(count):
+        started = time.perf_counter()
+        take()
+        found.append(time.perf_counter() - started)
+        while time.perf_counter() - started < interval:
+            pass
+    return sorted(found)
+
+
+def report(name: str, found: list, misses: int = 0):
+    percentile = lambda ratio: found[int(ratio * (len(found) - 1))] * 1e6
+    print(f'{name:<10} p50 {percentile(0.5):>7.2f} us  p99 {percentile(0.99):>7.2f} us  '
+          f'p99.9 {percentile(0.999):>8.2f} us  misses {misses}')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    interval = float(sys.argv[2]) if len(sys.argv) > 2 else 100e-6
+
+    report('inline', latencies(lambda: ua_generator.generate().headers.get(), count, interval))
+    with UserAgentPool(size=4096, batch=64) as pool:
+        report('pool', latencies(lambda: pool.next().headers.get(), count, interval), pool.misses)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+
+Latency of generate() while catalogs are reloaded by another thread, compared to no reload.
+A reload builds and prepares its catalog off the generating thread, so the median should stay the same; the tail
+grows only as much as the reloading thread holds the interpreter lock, as a generation never waits for the reload.
+Usage: python benchmarks/bench_reload.py [generations]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.ua_generator as ua_generator  # noqa: E402
+from src.ua_generator.data import catalog  # noqa: E402
+from src.ua_generator.options import Options  # noqa: E402
+
+
+def latencies(count: int) -> list:
+    options = Options(seed=1234, weighted_versions=True)
+    found = []
+    for _ in range(count):
+        started = time.perf_counter()
+        ua_generator.generate(options=options)
+        found.append(time.perf_counter() - started)
+    return sorted(found)
+
+
+def report(name: str, found: list, reloads: int = 0):
+    percentile = lambda ratio: found[int(ratio * (len(found) - 1))] * 1e6
+    print(f'{name:<24} p50 {percentile(0.5):>7.1f} us  p99 {percentile(0.99):>7.1f} us  '
+          f'max {found[-1] * 1e6:>8.1f} us  reloads {reloads}')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'catalog.bin')
+        catalog.dump(path)
+        catalog.reload(path)
+        latencies(1000)  # Warm up
+
+        report('no reload', latencies(count))
+
+        reloads = 0
+        stop = threading.Event()
+
+        def reload():
+            nonlocal reloads
+            while not stop.is_set():
+                catalog.reload(path)
+                reloads += 1
+
+        thread = threading.Thread(target=reload)
+        thread.start()
+        try:
+            found = latencies(count)
+        finally:
+            stop.set()
+            thread.join()
+        report('reloading', found, reloads)
+        catalog.install(None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+
+Operations per second and peak bytes allocated per operation of every generation path:
+generate() for each platform and browser, with and without weighted versions, with version ranges,
+the rendering alone of drawn versions for each platform and browser, generate_many() by batches of 100
+beside 100 calls of generate(), the client hints, Headers.get(), Headers.accept_ch() and for_key().
+The results are written as JSON, and compared to a baseline to flag regressions.
+
+Usage: python benchmarks/bench_suite.py [--output results.json] [--compare baseline.json] [--threshold 0.15]
+                                        [--number 2000] [--filter generate/windows]
+The exit status is 1 if a case is slower, or allocates more, than the baseline by more than the threshold.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform as _platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.ua_generator as ua_generator  # noqa: E402
+from src.ua_generator.data import registry  # noqa: E402
+from src.ua_generator.data.version import VersionRange  # noqa: E402
+from src.ua_generator.options import Options  # noqa: E402
+from src.ua_generator.plan import Plan  # noqa: E402
+
+ACCEPT_CH = 'Sec-CH-UA-Platform-Version, Sec-CH-UA-Full-Version-List, Sec-CH-UA-Model'
+BATCH = 100
+VERSION_RANGES = {
+    'chrome': VersionRange(125, 129),
+    'edge': VersionRange(min_version=120),
+    'firefox': VersionRange(115, 128),
+    'safari': VersionRange(16, 17),
+}
+
+
+def cases() -> List[Tuple[str, Callable[[], Callable[[], object]]]]:
+    """
+    (name, setup) of every case. The setup returns the operation to measure, so nothing it builds is counted.
+    """
+    found = []
+
+    def generate(platform, browser, **options):
+        def setup():
+            case_options = Options(seed=1234, **options)
+            return lambda: ua_generator.generate(platform=platform, browser=browser, options=case_options)
+        return setup
+
+    def render(platform, browser):
+        # The versions are drawn beforehand, so only the renderer is measured
+        def setup():
+            plan = Plan(platform=platform, browser=browser, options=Options(seed=1234))
+            drawn = itertools.cycle([(generator.platform_provider, generator.platform_version,
+                                      generator.browser_version) for generator in (plan.generate() for _ in range(1000))])
+            renderer = registry.browsers[browser].renderer(platform)
+            rng = plan.options.rng
+            return lambda: renderer.render(*next(drawn), rng)
+        return setup
+
+    for platform in registry.platforms.names():
+        for browser in registry.browsers.names():
+            if registry.browsers[browser].renderer(platform) is None:
+                continue
+            found.append((f'generate/{platform}/{browser}', generate(platform, browser)))
+            found.append((f'generate/{platform}/{browser}/weighted', generate(platform, browser, weighted_versions=True)))
+            found.append((f'generate/{platform}/{browser}/version_ranges',
+                          generate(platform, browser, version_ranges=VERSION_RANGES)))
+            found.append((f'render/{platform}/{browser}', render(platform, browser)))
+
+    def batch(many: bool, **arguments):
+        # 100 user-agents per operation, drawn by generate_many() or by as many calls of generate()
+        def setup():
+            options = Options(seed=1234)
+            if many:
+                return lambda: ua_generator.generate_many(BATCH, options=options, **arguments)
+            return lambda: [ua_generator.generate(options=options, **arguments).text for _ in range(BATCH)]
+        return setup
+
+    for suffix, arguments in (('windows/chrome', {'platform': 'windows', 'browser': 'chrome'}), ('any', {})):
+        found.append((f'generate_many/{suffix}', batch(True, **arguments)))
+        found.append((f'generate/batch/{suffix}', batch(False, **arguments)))
+
+    def fresh(operation):
+        # Each operation generates a new user-agent too, since the client hints and headers are cached by it
+        def setup():
+            options = Options(seed=1234)
+            return lambda: operation(ua_generator.generate(options=options))
+        return setup
+
+    def same(operation):
+        def setup():
+            ua = ua_generator.generate(browser='chrome', options=Options(seed=1234))
+            operation(ua)
+            return lambda: operation(ua)
+        return setup
+
+    found.append(('generate/text', fresh(lambda ua: ua.text)))
+    found.append(('client_hints/low_entropy', fresh(lambda ua: (ua.ch.brands, ua.ch.mobile, ua.ch.platform))))
+    found.append(('client_hints/all', fresh(lambda ua: [getattr(ua.ch, name) for name in ua.ch._attributes])))
+    found.append(('headers/get', fresh(lambda ua: ua.headers.get())))
+    found.append(('headers/accept_ch', fresh(lambda ua: ua.headers.accept_ch(ACCEPT_CH))))
+    found.append(('headers/accept_ch/repeated', same(lambda ua: ua.headers.accept_ch(ACCEPT_CH))))
+    found.append(('headers/get/repeated', same(lambda ua: ua.headers.get())))
+
+    def keyed(hot: bool):
+        def setup():
+            keys = itertools.cycle(range(100)) if hot else itertools.count()
+            return lambda: ua_generator.for_key(next(keys)).headers.get()
+        return setup
+
+    found.append(('for_key/hot', keyed(True)))
+    found.append(('for_key/new', keyed(False)))
+    return found
+
+
+def measure(operation: Callable[[], object], number: int, repeat: int = 3, sampled: int = 100) -> dict:
+    operation()  # Import the modules and build the caches before measuring
+    best = min(_time(operation, number) for _ in range(repeat))
+
+    tracemalloc.start()
+    peaks = 0
+    for _ in range(sampled):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        operation()
+        peaks += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+
+    return {'ops_per_sec': round(number / best, 1), 'peak_bytes': round(peaks / sampled, 1)}
+
+
+def _time(operation: Callable[[], object], number: int) -> float:
+    started = time.perf_counter()
+    for _ in range(number):
+        operation()
+    return time.perf_counter() - started
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """
+    The cases which are slower, or allocate more, than the baseline by more than the threshold (a ratio).
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        speed = result['ops_per_sec'] / base['ops_per_sec']
+        memory = result['peak_bytes'] / base['peak_bytes'] if base['peak_bytes'] > 0 else 1.0
+        flags = []
+        if speed < 1.0 - threshold:
+            flags.append(f'{(1.0 - speed) * 100:.0f}% slower')
+        if memory > 1.0 + threshold:
+            flags.append(f'{(memory - 1.0) * 100:.0f}% more bytes')
+        if flags:
+            regressions.append(f'{name}: {", ".join(flags)}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks of every generation path.')
+    parser.add_argument('--output', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='Compare the results to this JSON file of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.15, help='The tolerated ratio of slowdown (default: 0.15)')
+    parser.add_argument('--number', type=int, default=2000, help='Operations per timing (default: 2000)')
+    parser.add_argument('--filter', default='', help='Run only the cases whose name starts with this')
+    args = parser.parse_args()
+
+    results = {}
+    for name, setup in cases():
+        if not name.startswith(args.filter):
+            continue
+        results[name] = measure(setup(), args.number)
+        print(f'{name:<48} {results[name]["ops_per_sec"]:>12,.0f} ops/sec {results[name]["peak_bytes"]:>10,.0f} bytes')
+
+    report = {
+        'python': sys.version.split()[0],
+        'implementation': _platform.python_implementation(),
+        'machine': _platform.machine(),
+        'number': args.number,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline['results'], args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        if regressions:
+            sys.exit(1)
+        print(f'No regression beyond {args.threshold:.0%} against {args.compare}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+
+Throughput of generate() when only the text is read, compared to reading the client hints and headers too.
+Usage: python benchmarks/bench_user_agent.py [count]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.ua_generator as ua_generator  # noqa: E402
+
+
+def text_only():
+    return ua_generator.generate().text
+
+
+def full_headers():
+    ua = ua_generator.generate()
+    ua.headers.accept_ch('Sec-CH-UA-Platform-Version, Sec-CH-UA-Full-Version-List')
+    return ua.headers.get()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for name, function in (('text only', text_only), ('full headers', full_headers)):
+        function()  # Import the modules before timing
+        seconds = min(timeit.repeat(function, number=count, repeat=3))
+        print(f'{name:<14} {count / seconds:>12,.0f} ops/sec')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+
+Memory per version instance, and allocations of version comparisons.
+Usage: python benchmarks/bench_version_memory.py [count]
+"""
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.ua_generator.data.version import Version, ChromiumVersion, WindowsVersion, AndroidVersion  # noqa: E402
+
+
+def measure(factory, count: int, compared: bool = False) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    if compared:
+        for instance in instances:
+            _ = instance == instance
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list itself is not part of an instance
+    return (after - before - sys.getsizeof(instances)) / count
+
+
+def comparisons(versions: list) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(1, len(versions)):
+        _ = versions[i - 1] < versions[i], versions[i - 1] == versions[i], versions[i - 1] >= versions[i]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(1)
+
+    version = Version(major=(100, 130), minor=0, build=(1000, 9000), patch=(0, 250))
+    chromium = ChromiumVersion(Version(major=130, minor=0, build=(6723, 6778), patch=(0, 250)))
+    windows = WindowsVersion(Version(major=10, minor=0), ch_platform=Version(major=(13, 15)))
+    android = AndroidVersion(Version(major=14, minor=0), build_numbers=('UP1A.231005.007',), rng=rng)
+    factories = {
+        'Version': lambda: version.sample(rng),
+        'ChromiumVersion': lambda: chromium.sample(rng),
+        'WindowsVersion': lambda: windows.sample(rng),
+        'AndroidVersion': lambda: AndroidVersion(android, build_numbers=('UP1A.231005.007',), rng=rng),
+    }
+
+    print(f'{"type":<16} {"bytes/instance":>15} {"after comparing":>16}')
+    for name, factory in factories.items():
+        print(f'{name:<16} {measure(factory, count):>15.1f} {measure(factory, count, compared=True):>16.1f}')
+
+    versions = [factories['Version']() for _ in range(count)]
+    print(f'Bytes allocated by {3 * (count - 1)} comparisons: {comparisons(versions)}')
+
+
+if __name__ == '__main__':
+    main()
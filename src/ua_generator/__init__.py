@@ -3,9 +3,19 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-from typing import Union
+import copy
+import functools
+import itertools
+import os
+import random
+from typing import Iterator, Sequence, Union, List
 
-from . import user_agent, options as _options, data as _data
+from . import user_agent, exceptions, instrumentation, pool, plan as _plan, options as _options, data as _data
+from .client_hints import ClientHints as _ClientHints
+from .headers import Headers as _Headers
+from .data import catalog as _catalog, registry as _registry
+from .data.generator import Generator as _Generator
+from .data.version import VersionRange as _VersionRange
 
 
 def generate(device: Union[_data.T_DEVICES, tuple, list, None] = None,
@@ -13,3 +23,240 @@ def generate(device: Union[_data.T_DEVICES, tuple, list, None] = None,
              browser: Union[_data.T_BROWSERS, tuple, list, None] = None,
              options: Union[_options.Options, None] = None) -> user_agent.UserAgent:
     return user_agent.UserAgent(device, platform, browser, options)
+
+
+def generate_many(n: int,
+                  device: Union[_data.T_DEVICES, tuple, list, None] = None,
+                  platform: Union[_data.T_PLATFORMS, tuple, list, None] = None,
+                  browser: Union[_data.T_BROWSERS, tuple, list, None] = None,
+                  options: Union[_options.Options, None] = None,
+                  unique: bool = False) -> List[str]:
+    plan = _plan.Plan(device, platform, browser, options)
+    if unique:
+        return _generate_unique(plan, n)
+    return plan.user_agents(n)
+
+
+def _generate_unique(plan: _plan.Plan, n: int) -> List[str]:
+    # Draw as usual, by batches of the user-agents still missing, while the collisions are rare.
+    # The index of every user-agent is built only once they pile up: n is then close to what the plan can generate.
+    issued = {}
+    collisions = 0
+    while len(issued) < n and collisions <= len(issued):
+        for text in plan.user_agents(n - len(issued)):
+            if text in issued:
+                collisions += 1
+            issued[text] = None
+
+    if len(issued) < n:
+        space = plan.space
+        if n > len(space):
+            raise exceptions.CannotGenerateError(
+                f'Cannot generate {n} unique user-agents, only {len(space)} can be generated with {plan}')
+
+        # Among any n + len(issued) distinct indexes, at most len(issued) are issued already
+        for index in plan.options.rng.sample(range(len(space)), min(len(space), n + len(issued))):
+            issued[space[index]] = None
+            if len(issued) == n:
+                break
+
+    return list(issued)
+
+
+def generate_parallel(n: int,
+                      device: Union[_data.T_DEVICES, tuple, list, None] = None,
+                      platform: Union[_data.T_PLATFORMS, tuple, list, None] = None,
+                      browser: Union[_data.T_BROWSERS, tuple, list, None] = None,
+                      options: Union[_options.Options, None] = None,
+                      workers: Union[int, None] = None,
+                      seed: Union[int, float, str, bytes, None] = None) -> List[str]:
+    """
+    Generates n user-agent strings in a pool of processes, one contiguous chunk per worker.
+    Each chunk has its own generator, seeded by the seed and the chunk index, so the same seed and
+    the same number of workers always give the same list. Without a seed, the seed of the options is used,
+    or a random one is drawn from their generator.
+    The hook is not sent to the workers: each one adds up its own timings and counters, which the hook then receives.
+    """
+    plan = _plan.Plan(device, platform, browser, options)
+    workers = max(1, min(workers or os.cpu_count() or 1, n))
+    if seed is None:
+        seed = plan.options.seed if plan.options.seed is not None else plan.options.rng.getrandbits(64)
+
+    chunks = []
+    for index in range(workers):
+        chunk_options = copy.copy(plan.options)
+        chunk_options.seed = f'{seed}/{index}'
+        chunk_options.rng = random.Random(chunk_options.seed)
+        count = n // workers + (1 if index < n % workers else 0)
+        chunks.append((count, plan.device, plan.platform, plan.browser, chunk_options))
+
+    if workers == 1:
+        return _generate_chunk(chunks[0]) if n > 0 else []
+
+    from concurrent.futures import ProcessPoolExecutor  # Imported on use, it weighs more than the package itself
+
+    hook = plan.options.hook or instrumentation.installed
+    for chunk in chunks:
+        chunk[4].hook = None  # A hook may hold what cannot be pickled, e.g. a lock
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if hook is None:
+            return list(itertools.chain.from_iterable(executor.map(_generate_chunk, chunks)))
+        results = list(executor.map(_generate_chunk_stats, chunks))
+
+    for _, stats in results:
+        if isinstance(hook, instrumentation.Stats):
+            hook.merge(stats)
+            continue
+        for stage, seconds in stats.seconds.items():
+            hook.timing(stage, seconds)
+        for counter, value in stats.counters.items():
+            hook.count(counter, value)
+    return list(itertools.chain.from_iterable(texts for texts, _ in results))
+
+
+def _generate_chunk(chunk: tuple) -> List[str]:
+    return generate_many(*chunk)
+
+
+def _generate_chunk_stats(chunk: tuple) -> tuple:
+    stats = chunk[4].hook = instrumentation.Stats()
+    return generate_many(*chunk), stats
+
+
+def for_key(key: Union[int, str, bytes],
+            device: Union[_data.T_DEVICES, tuple, list, None] = None,
+            platform: Union[_data.T_PLATFORMS, tuple, list, None] = None,
+            browser: Union[_data.T_BROWSERS, tuple, list, None] = None,
+            options: Union[_options.Options, None] = None) -> user_agent.UserAgent:
+    """
+    The user-agent of a key, e.g. a session or a tenant ID: the same key with the same arguments always gives the same
+    user-agent, client hints and headers, in any process, without the assignment being stored.
+    It is generated with a generator seeded by the key, and by the seed of the options if they have one, so that
+    a new seed reassigns every key. The most recent keys are kept, and not generated again; each call gets its own
+    headers, which can be changed without affecting the other calls.
+    """
+    if type(key) not in (int, str, bytes):
+        raise exceptions.InvalidArgumentError(f'A key must be an int, a str or bytes, not {type(key).__name__}')
+
+    generator, ch, headers = _for_key(key, _hashable(device), _hashable(platform), _hashable(browser),
+                                      _OptionsKey(options),
+                                      (_registry.platforms.revision, _registry.browsers.revision, _catalog.revision))
+    return user_agent.UserAgent.from_generator(generator, ch, headers)
+
+
+@functools.lru_cache(maxsize=4096)
+def _for_key(key, device, platform, browser, options: '_OptionsKey', revisions) -> tuple:
+    key_options = copy.copy(options.options) if options.options is not None else _options.Options()
+    # With the type of the key, so that 1 and '1' are different keys with a seed too, as they are without one
+    key_options.seed = key if key_options.seed is None else f'{key_options.seed}/{type(key).__name__}/{key}'
+    key_options.rng = random.Random(key_options.seed)
+    generator = _plan.Plan(device, platform, browser, key_options).generate()
+    ch = _ClientHints(generator)
+    # Generated once, with their block() encoding, and copied by each call
+    headers = _Headers(generator, ch)
+    headers.block()
+    return generator, ch, headers
+
+
+def _hashable(value: Union[str, tuple, list, None]) -> Union[str, tuple, None]:
+    return tuple(value) if isinstance(value, list) else value
+
+
+class _OptionsKey:
+    """
+    The options of for_key(), compared by the values that change what is generated, so that equal options
+    share the cached user-agents. The generator and the hook of the options do not change it.
+    """
+    __slots__ = ('options', 'values')
+
+    def __init__(self, options: Union[_options.Options, None]):
+        self.options = options
+        values = options if options is not None else _options.Options  # The defaults are class attributes
+        self.values = (
+            values.weighted_versions,
+            values.seed,
+            tuple(sorted((name, version_range.keys() if isinstance(version_range, _VersionRange) else None)
+                         for name, version_range in (values.version_ranges or {}).items())),
+            tuple(sorted((values.market_share or {}).items())),
+        )
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _OptionsKey) and self.values == other.values
+
+    def __hash__(self) -> int:
+        return hash(self.values)
+
+
+def cardinality(device: Union[_data.T_DEVICES, tuple, list, None] = None,
+                platform: Union[_data.T_PLATFORMS, tuple, list, None] = None,
+                browser: Union[_data.T_BROWSERS, tuple, list, None] = None,
+                options: Union[_options.Options, None] = None) -> int:
+    """
+    The number of distinct user-agent strings that can be generated with the arguments.
+    """
+    return len(_plan.Plan(device, platform, browser, options).space)
+
+
+def _enumerate(device: Union[_data.T_DEVICES, tuple, list, None] = None,
+               platform: Union[_data.T_PLATFORMS, tuple, list, None] = None,
+               browser: Union[_data.T_BROWSERS, tuple, list, None] = None,
+               options: Union[_options.Options, None] = None) -> Sequence[str]:
+    """
+    Every distinct user-agent string that can be generated with the arguments, in a fixed order, without duplicates.
+    The result is a lazy sequence: len() is the cardinality, [k] renders the k-th user-agent
+    from its mixed-radix index, and iterating walks all of them.
+    """
+    return _plan.Plan(device, platform, browser, options).space
+
+
+_enumerate.__name__ = _enumerate.__qualname__ = 'enumerate'
+
+
+def __getattr__(name: str):
+    # ua_generator.enumerate, which is not a global so that the builtin stays usable in this module
+    if name == 'enumerate':
+        return _enumerate
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def stream(device: Union[_data.T_DEVICES, tuple, list, None] = None,
+           platform: Union[_data.T_PLATFORMS, tuple, list, None] = None,
+           browser: Union[_data.T_BROWSERS, tuple, list, None] = None,
+           options: Union[_options.Options, None] = None,
+           limit: Union[int, None] = None,
+           records: bool = False) -> Iterator[Union[str, user_agent.UserAgent]]:
+    """
+    Yields user-agent strings, or UserAgent objects if "records" is set, forever or until the limit.
+    The arguments are validated once, on the call; nothing is kept between the items.
+    """
+    plan = _plan.Plan(device, platform, browser, options)
+    return _stream(plan, limit, records)
+
+
+def _stream(plan: _plan.Plan, limit: Union[int, None], records: bool):
+    counter = itertools.repeat(None) if limit is None else itertools.repeat(None, limit)
+    if records:
+        for _ in counter:
+            yield user_agent.UserAgent.from_plan(plan)
+    else:
+        for _ in counter:
+            yield plan.generate().user_agent
+
+
+def parse(text: str) -> Union[user_agent.UserAgent, None]:
+    """
+    The user-agent a text was generated as: the device, platform, browser, their versions and the Android model,
+    with the client hints and headers rebuilt from them. None if the text was not generated from the templates.
+    A text which several versions may render (e.g. "Windows NT 10.0" is Windows 10 and 11) gets the first of them.
+    """
+    from .data import parser  # Imported on use, the patterns are compiled on the first call
+
+    parsed = parser.parser().parse(text)
+    if parsed is None:
+        return None
+
+    platform, browser, platform_version, browser_version = parsed
+    return user_agent.UserAgent.from_generator(_Generator(
+        _registry.platforms[platform].device, platform, browser, _options.Options(),
+        platform_version=platform_version, browser_version=browser_version, user_agent=text))
@@ -5,8 +5,8 @@ License: Apache License 2.0
 """
 from random import Random
 
-from . import serialization
-from .data import generator, PLATFORMS_MOBILE
+from . import instrumentation, serialization
+from .data import generator
 from .data.version import AndroidVersion, WindowsVersion
 from .exceptions import InvalidArgumentError
 
@@ -30,19 +30,10 @@ class ClientHints:
         self.__cache = {}
 
     def get_mobile(self) -> bool:
-        return self.__generator.platform in PLATFORMS_MOBILE
+        return self.__generator.platform_provider.device == 'mobile'
 
     def get_platform(self) -> str:
-        platform = self.__generator.platform
-
-        if platform == 'ios':
-            platform = 'iOS'
-        elif platform == 'macos':
-            platform = 'macOS'
-        else:
-            platform = platform.title()
-
-        return platform
+        return self.__generator.platform_provider.ch_platform
 
     def get_platform_version(self) -> str:
         if type(self.__generator.platform_version) is WindowsVersion:
@@ -53,14 +44,11 @@ class ClientHints:
     def get_brands(self, full_version_list: bool = False) -> list:
         brand_list = [{'brand': 'Not A(Brand', 'version': '99.0.0.0' if full_version_list else '99'}]
 
-        if self.__generator.browser == 'chrome':
+        brands = self.__generator.browser_provider.brands
+        if brands:
             browser_version = self.get_browser_version(full_version=full_version_list)
-            brand_list.append({'brand': 'Chromium', 'version': browser_version})
-            brand_list.append({'brand': 'Google Chrome', 'version': browser_version})
-        elif self.__generator.browser == 'edge':
-            browser_version = self.get_browser_version(full_version=full_version_list)
-            brand_list.append({'brand': 'Chromium', 'version': browser_version})
-            brand_list.append({'brand': 'Microsoft Edge', 'version': browser_version})
+            for brand in brands:
+                brand_list.append({'brand': brand, 'version': browser_version})
 
         return brand_list
 
@@ -71,20 +59,10 @@ class ClientHints:
             return str(self.__generator.browser_version.major)
 
     def get_bitness(self) -> str:
-        if self.__generator.platform == 'android':
-            _random = Random(self.__generator.user_agent)
-            return _random.choice(('32', '64', '32', '32'))
-
-        return '64'
+        return self.__choice(self.__generator.platform_provider.bitness)
 
     def get_architecture(self) -> str:
-        if self.__generator.platform == 'android' or self.__generator.platform == 'ios':
-            return 'arm'
-        elif self.__generator.platform == 'macos':
-            _random = Random(self.__generator.user_agent)
-            return _random.choice(('arm', 'x86', 'arm', 'arm'))
-
-        return 'x86'
+        return self.__choice(self.__generator.platform_provider.architectures)
 
     def get_model(self) -> str:
         if type(self.__generator.platform_version) is AndroidVersion:
@@ -93,35 +71,46 @@ class ClientHints:
         return ''
 
     def get_wow64(self) -> bool:
-        return self.__generator.platform == 'windows'
+        return self.__generator.platform_provider.wow64
+
+    def __choice(self, values: tuple) -> str:
+        if len(values) == 1:
+            return values[0]
+
+        # Seeded by the user-agent, so the same user-agent always has the same value
+        _random = Random(self.__generator.user_agent)
+        return _random.choice(values)
 
     def __getattr__(self, name) -> str:
         if name in self.__cache:
             return self.__cache[name]
 
-        if name == 'mobile':
-            self.__cache[name] = serialization.ch_bool(self.get_mobile())
-        elif name == 'platform':
-            self.__cache[name] = serialization.ch_string(self.get_platform())
-        elif name == 'platform_version':
-            self.__cache[name] = serialization.ch_string(self.get_platform_version())
-        elif name == 'brands':
-            self.__cache[name] = serialization.ch_brand_list(self.get_brands())
-        elif name == 'brands_full_version_list':
-            self.__cache[name] = serialization.ch_brand_list(self.get_brands(full_version_list=True))
-        elif name == 'bitness':
-            self.__cache[name] = serialization.ch_string(self.get_bitness())
-        elif name == 'architecture':
-            self.__cache[name] = serialization.ch_string(self.get_architecture())
-        elif name == 'model':
-            self.__cache[name] = serialization.ch_string(self.get_model())
-        elif name == 'wow64':
-            self.__cache[name] = serialization.ch_bool(self.get_wow64())
-        else:
+        attribute = self._attributes.get(name)
+        if attribute is None:
             raise InvalidArgumentError('Invalid attribute: {}'.format(name))
 
+        getter, serializer = attribute
+        hook = self.__generator.options.hook or instrumentation.installed
+        if hook is None:
+            self.__cache[name] = serializer(getter(self))
+        else:
+            self.__cache[name] = instrumentation.timed(hook, instrumentation.CLIENT_HINTS,
+                                                       lambda: serializer(getter(self)))
         return self.__cache[name]
 
+    # Serialized attributes: name -> (getter, serializer)
+    _attributes = {
+        'mobile': (get_mobile, serialization.ch_bool),
+        'platform': (get_platform, serialization.ch_string),
+        'platform_version': (get_platform_version, serialization.ch_string),
+        'brands': (get_brands, serialization.ch_brand_list),
+        'brands_full_version_list': (lambda self: self.get_brands(full_version_list=True), serialization.ch_brand_list),
+        'bitness': (get_bitness, serialization.ch_string),
+        'architecture': (get_architecture, serialization.ch_string),
+        'model': (get_model, serialization.ch_string),
+        'wow64': (get_wow64, serialization.ch_bool),
+    }
+
     def __str__(self):
         return self.brands
 
@@ -3,9 +3,10 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-import random
 from typing import List
 
+from ..renderer import Renderer, chromium_fields
+from ..table import VersionTable
 from ..version import Version, ChromiumVersion, VersionRange
 from ...options import Options
 
@@ -48,20 +49,35 @@ versions: List[ChromiumVersion] = [
     ChromiumVersion(Version(major=134, minor=0, build=3124, patch=(0, 99))),
 ]
 
+table = VersionTable(weights=(8.0, 9.0, 10.0))
+
 
 def get_version(options: Options) -> ChromiumVersion:
+    rng = options.rng
     if options.version_ranges is not None and 'edge' in options.version_ranges:
         if type(options.version_ranges['edge']) == VersionRange:
-            filtered = options.version_ranges['edge'].filter(versions)
+            filtered = table.filter(versions, options.version_ranges['edge'])
             if type(filtered) == list and len(filtered) > 0:
-                return random.choice(filtered)
+                return rng.choice(filtered).sample(rng)
+
+    choice: ChromiumVersion = table.choice(versions, rng, weighted=options.weighted_versions)
+    return choice.sample(rng)
 
-    weights = None
-    if options.weighted_versions:
-        weights = [1.0] * len(versions)
-        weights[-1] = 10.0
-        weights[-2] = 9.0
-        weights[-3] = 8.0
 
-    choice: List[ChromiumVersion] = random.choices(versions, weights=weights, k=1)
-    return choice[0]
+renderers = {
+    'windows': Renderer((
+        'Mozilla/5.0 (Windows NT {windows}; Win64; x64) AppleWebKit/{webkit} (KHTML, like Gecko) Chrome/{chrome} Safari/{webkit} Edg/{chrome}',
+    ), chromium_fields),
+    'linux': Renderer((
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/{webkit} (KHTML, like Gecko) Chrome/{chrome} Safari/{webkit} Edg/{chrome}',
+    ), chromium_fields),
+    'android': Renderer((
+        'Mozilla/5.0 (Linux; Android {android}{model}{build}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{chrome} Mobile Safari/{webkit} EdgA/{chrome}',
+    ), chromium_fields),
+    'macos': Renderer((
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X {macos}) AppleWebKit/{webkit} (KHTML, like Gecko) Chrome/{chrome} Safari/{webkit} Edg/{chrome}',
+    ), chromium_fields),
+    'ios': Renderer((
+        'Mozilla/5.0 (iPhone; CPU iPhone OS {ios} like Mac OS X) AppleWebKit/{webkit} (KHTML, like Gecko) Version/15.0 EdgiOS/{chrome} Mobile/15E148 Safari/{webkit}',
+    ), chromium_fields),
+}
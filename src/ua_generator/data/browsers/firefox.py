@@ -3,9 +3,10 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-import random
 from typing import List
 
+from ..renderer import Renderer
+from ..table import VersionTable
 from ..version import Version, VersionRange
 from ...options import Options
 
@@ -56,20 +57,53 @@ versions: List[Version] = [
     Version(major=136, minor=0, build=0),
 ]
 
+table = VersionTable(weights=(8.0, 9.0, 10.0))
+
 
 def get_version(options: Options) -> Version:
+    rng = options.rng
     if options.version_ranges is not None and 'firefox' in options.version_ranges:
         if type(options.version_ranges['firefox']) == VersionRange:
-            filtered = options.version_ranges['firefox'].filter(versions)
+            filtered = table.filter(versions, options.version_ranges['firefox'])
             if type(filtered) == list and len(filtered) > 0:
-                return random.choice(filtered)
+                return rng.choice(filtered).sample(rng)
+
+    choice: Version = table.choice(versions, rng, weighted=options.weighted_versions)
+    return choice.sample(rng)
+
+
+def _fields(platform_version, browser_version) -> dict:
+    return {'firefox': str(browser_version)}
+
+
+def _apple_fields(platform_version, browser_version) -> dict:
+    return {'firefox': browser_version.format(partitions=2)}
+
+
+def _macos_fields(platform_version, browser_version) -> dict:
+    # Firefox reports the macOS version with dots and two partitions only
+    return {
+        'macos': platform_version.format(partitions=2, trim_zero=True),
+        'firefox': browser_version.format(partitions=2),
+    }
 
-    weights = None
-    if options.weighted_versions:
-        weights = [1.0] * len(versions)
-        weights[-1] = 10.0
-        weights[-2] = 9.0
-        weights[-3] = 8.0
 
-    choice: List[Version] = random.choices(versions, weights=weights, k=1)
-    return choice[0]
+renderers = {
+    'windows': Renderer((
+        'Mozilla/5.0 (Windows NT {windows}; Win64; x64; rv:{firefox}) Gecko/20100101 Firefox/{firefox}',
+        'Mozilla/5.0 (Windows NT {windows}; WOW64; rv:{firefox}) Gecko/20100101 Firefox/{firefox}',
+    ), _fields),
+    'linux': Renderer((
+        'Mozilla/5.0 (X11; Linux x86_64; rv:{firefox}) Gecko/20100101 Firefox/{firefox}',
+        'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:{firefox}) Gecko/20100101 Firefox/{firefox}',
+    ), _fields),
+    'android': Renderer((
+        'Mozilla/5.0 (Android {android}; Mobile; rv:{firefox}) Gecko/{firefox} Firefox/{firefox}',
+    ), _fields),
+    'macos': Renderer((
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X {macos}; rv:{firefox}) Gecko/20100101 Firefox/{firefox}',
+    ), _macos_fields),
+    'ios': Renderer((
+        'Mozilla/5.0 (iPhone; CPU iPhone OS {ios} like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) FxiOS/{firefox} Mobile/15E148 Safari/605.1.15',
+    ), _apple_fields),
+}
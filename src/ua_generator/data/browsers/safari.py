@@ -3,9 +3,10 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-import random
 from typing import List
 
+from ..renderer import Renderer
+from ..table import VersionTable
 from ..version import Version, ChromiumVersion, VersionRange
 from ...options import Options
 
@@ -22,19 +23,32 @@ versions: List[ChromiumVersion] = [
     ChromiumVersion(Version(major=18, minor=(0, 3)), webkit=Version(major=605, minor=1, build=15)),
 ]
 
+table = VersionTable(weights=(9.0, 10.0))
+
 
 def get_version(options: Options) -> ChromiumVersion:
+    rng = options.rng
     if options.version_ranges is not None and 'safari' in options.version_ranges:
         if type(options.version_ranges['safari']) == VersionRange:
-            filtered = options.version_ranges['safari'].filter(versions)
+            filtered = table.filter(versions, options.version_ranges['safari'])
             if type(filtered) == list and len(filtered) > 0:
-                return random.choice(filtered)
+                return rng.choice(filtered).sample(rng)
+
+    choice: ChromiumVersion = table.choice(versions, rng, weighted=options.weighted_versions)
+    return choice.sample(rng)
 
-    weights = None
-    if options.weighted_versions:
-        weights = [1.0] * len(versions)
-        weights[-1] = 10.0
-        weights[-2] = 9.0
 
-    choice: List[ChromiumVersion] = random.choices(versions, weights=weights, k=1)
-    return choice[0]
+renderers = {
+    'macos': Renderer((
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X {macos}) AppleWebKit/{webkit} (KHTML, like Gecko) Version/{safari} Safari/{webkit}',
+    ), lambda platform_version, browser_version: {
+        'safari': str(browser_version),
+        'webkit': str(browser_version.webkit),
+    }),
+    'ios': Renderer((
+        'Mozilla/5.0 (iPhone; CPU iPhone OS {ios} like Mac OS X) AppleWebKit/{webkit} (KHTML, like Gecko) Version/{safari} Mobile/15E148 Safari/{webkit}',
+    ), lambda platform_version, browser_version: {
+        'safari': browser_version.format(partitions=2),
+        'webkit': str(browser_version.webkit),
+    }),
+}
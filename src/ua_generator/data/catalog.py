@@ -0,0 +1,489 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import importlib
+import json
+import os
+import struct
+import sys
+from typing import Dict, Iterator, List, Tuple, Union
+
+from .. import exceptions
+from .table import VersionTable
+from .version import Version, ChromiumVersion, WindowsVersion, AndroidVersion, VersionRange
+
+# The version types of the binary format, and the attribute of the nested version of each
+_KINDS = (Version, ChromiumVersion, WindowsVersion, AndroidVersion)
+_NESTED = {ChromiumVersion: 'webkit', WindowsVersion: 'ch_platform'}
+
+_MAGIC = b'UACATLG1'
+_HEADER = struct.Struct('<8sIII')  # Magic, number of strings, of entries, and of integers
+_NONE, _INT, _RANGE = 0, 1, 2  # Tags of the version parts
+_RANGED = 1  # Flag of the entries whose versions are filtered by the version ranges
+
+
+class Entry:
+    """
+    The versions of a platform, a browser or an Android vendor, as a catalog provides them.
+    An entry can stand in for the module it was made from: it has the same "versions", "table" and "get_version".
+    """
+
+    def __init__(self, name: str, versions: list, weights: Tuple[float, ...] = (), ranged: bool = True,
+                 platform_models: Union[tuple, None] = None, years: Union[Tuple[int, int], None] = None):
+        self.name = name
+        self.versions = versions
+        self.table = VersionTable(weights=tuple(weights))
+        self.ranged = ranged  # Whether the version ranges of the options apply
+        self.platform_models = platform_models  # Android vendors only
+        self.years = years  # Of the build dates, Android vendors only
+
+    @classmethod
+    def from_module(cls, name: str, module) -> 'Entry':
+        return cls(name, module.versions, module.table.weights,
+                   ranged=not hasattr(module, 'reachable') and not hasattr(module, 'years'),
+                   platform_models=getattr(module, 'platform_models', None), years=getattr(module, 'years', None))
+
+    def get_version(self, options):
+        rng = options.rng
+        if self.ranged and options.version_ranges is not None:
+            version_range = options.version_ranges.get(self.name)
+            if type(version_range) == VersionRange:
+                filtered = self.table.filter(self.versions, version_range)
+                if len(filtered) > 0:
+                    return rng.choice(filtered).sample(rng)
+
+        choice = self.table.choice(self.versions, rng, weighted=options.weighted_versions)
+        if self.years is not None:
+            return choice.sample(rng, years=self.years, platform_models=self.platform_models)
+        return choice.sample(rng)
+
+    def reachable(self, options) -> list:
+        """
+        The versions get_version may draw with the options.
+        """
+        if self.ranged and options.version_ranges is not None:
+            version_range = options.version_ranges.get(self.name)
+            if type(version_range) == VersionRange:
+                filtered = self.table.filter(self.versions, version_range)
+                if len(filtered) > 0:
+                    return filtered
+        return self.versions
+
+    def prepare(self) -> 'Entry':
+        """
+        Builds the indexes of the version table, so that no draw has to.
+        """
+        if len(self.versions) > 0:
+            self.table.prepare(self.versions)
+        return self
+
+    def to_dict(self) -> dict:
+        data = {'versions': [_version_to_dict(version) for version in self.versions],
+                'weights': list(self.table.weights), 'ranged': self.ranged}
+        if self.platform_models is not None:
+            data['platform_models'] = list(self.platform_models)
+        if self.years is not None:
+            data['years'] = list(self.years)
+        return data
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict) -> 'Entry':
+        nested: Dict[tuple, Version] = {}
+        models, years = data.get('platform_models'), data.get('years')
+        return cls(name, [_version_from_dict(version, nested) for version in data['versions']],
+                   tuple(float(weight) for weight in data.get('weights', ())), ranged=data.get('ranged', True),
+                   platform_models=tuple(models) if models is not None else None,
+                   years=tuple(years) if years is not None else None)
+
+    def __repr__(self):
+        return f"Entry(name='{self.name}', versions={len(self.versions)})"
+
+
+class Catalog:
+    """
+    The entries of the platforms, the browsers and the Android vendors, by name.
+    Names without an entry are provided by their modules.
+    """
+
+    def __init__(self, entries: Dict[str, Entry]):
+        self.__entries = dict(entries)
+
+    def get(self, name: str) -> Union[Entry, None]:
+        return self.__entries.get(name)
+
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self.__entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names()
+
+    def __iter__(self) -> Iterator[Entry]:
+        return (self.get(name) for name in self.names())
+
+    def validate(self) -> 'Catalog':
+        """
+        Checks that each entry is of a platform, a browser or an Android vendor of the modules, has versions of the type
+        of theirs, and no more weights than versions. Raises InvalidArgumentError otherwise.
+        """
+        kinds = _module_kinds()
+        for item in self:
+            kind = kinds.get(item.name)
+            if kind is None:
+                raise exceptions.InvalidArgumentError(f'No platform, browser or Android vendor named {item.name} '
+                                                      f'has a version table')
+            if len(item.versions) == 0:
+                raise exceptions.InvalidArgumentError(f'The entry of {item.name} has no versions')
+            if len(item.table.weights) > len(item.versions):
+                raise exceptions.InvalidArgumentError(f'The entry of {item.name} has {len(item.table.weights)} weights '
+                                                      f'for {len(item.versions)} versions')
+            for version in item.versions:
+                if type(version) is not kind:
+                    raise exceptions.InvalidArgumentError(f'The versions of {item.name} must be {kind.__name__}, '
+                                                          f'not {type(version).__name__}')
+        return self
+
+    def prepare(self) -> 'Catalog':
+        """
+        Decodes every entry and builds the indexes of its version table.
+        """
+        for item in self:
+            item.prepare()
+        return self
+
+    def to_dict(self) -> dict:
+        """
+        The entries by name, as lists, numbers and strings that JSON can hold. A range of a version part is a list of
+        its start and its (exclusive) end.
+        """
+        return {item.name: item.to_dict() for item in self}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Catalog':
+        return cls({name: Entry.from_dict(name, item) for name, item in data.items()})
+
+    @classmethod
+    def from_modules(cls) -> 'Catalog':
+        """
+        The entries of every registered platform and browser with a version table, and of the Android vendors.
+        """
+        from . import registry
+        entries = {}
+        for provider in (*registry.platforms, *registry.browsers):
+            module = provider.load()
+            if hasattr(module, 'versions') and hasattr(module, 'table'):
+                entries[provider.name] = Entry.from_module(provider.name, module)
+            for name in getattr(module, 'vendor_names', ()):
+                entries[name] = Entry.from_module(name, module.load_vendor(name))
+        return cls(entries)
+
+
+def _module_kinds() -> Dict[str, type]:
+    # The type of the versions of each module with a version table, the vendor ones too
+    from . import registry
+    kinds = {}
+    for provider in (*registry.platforms, *registry.browsers):
+        module = provider.load()
+        if hasattr(module, 'versions') and hasattr(module, 'table'):
+            kinds[provider.name] = type(module.versions[0])
+        for name in getattr(module, 'vendor_names', ()):
+            kinds[name] = type(importlib.import_module('.' + name, module.__name__).versions[0])
+    return kinds
+
+
+installed: Union[Catalog, None] = None  # The catalog in use, or None for the modules
+revision = 0  # Bumped by install(), to key what is derived from the installed catalog without holding the catalog
+current: Tuple[Union[Catalog, None], int] = (None, 0)  # (installed, revision), read at once
+
+
+def install(catalog: Union[Catalog, None]):
+    """
+    Uses the entries of the catalog instead of the modules, or the modules again if it is None.
+    """
+    global installed, revision, current
+    current = (catalog, revision + 1)
+    installed, revision = current
+
+
+def reload(source: Union[str, os.PathLike, dict, Catalog]) -> Catalog:
+    """
+    Builds a catalog from a file written by dump(), a JSON file or a dict of Catalog.to_dict(), validates it,
+    prepares all of it, then installs it. If it is not valid, InvalidArgumentError is raised and the installed catalog
+    is kept. Each generation reads the installed catalog once, without a lock, and draws all its versions from it:
+    a generation during the swap uses either the previous catalog or the new one.
+    The catalog is returned; a previous BinaryCatalog can be closed once it is not used.
+    """
+    if isinstance(source, dict):
+        loaded = Catalog.from_dict(source)
+    elif isinstance(source, Catalog):
+        loaded = source
+    else:
+        with open(source, 'rb') as file:
+            binary = file.read(len(_MAGIC)) == _MAGIC
+        if binary:
+            loaded = load(source)
+        else:
+            with open(source, encoding='utf-8') as file:
+                loaded = Catalog.from_dict(json.load(file))
+
+    install(loaded.validate().prepare())
+    return loaded
+
+
+def entry(name: str) -> Union[Entry, None]:
+    """
+    The entry of the installed catalog for the name, or None if the module provides it.
+    """
+    catalog = installed
+    return catalog.get(name) if catalog is not None else None
+
+
+# Binary format, little-endian:
+#   header: magic, number of strings, of entries, and of integers (uint32)
+#   string offsets: number of strings + 1 (uint32), into the UTF-8 text at the end
+#   directory: (name string, offset of the first integer) of each entry (uint32)
+#   integers (int32), then the text
+# The integers of an entry: kind of its versions, flags, number of versions, number of weights, the weights
+# (strings), number of models (-1 for none) and the models (strings), the years (-1 -1 for none), then each version:
+# its 4 parts as (tag, low, high), followed by its nested version, or by its build numbers for Android.
+
+
+def dump(path: str, catalog: Union[Catalog, None] = None):
+    """
+    Writes the catalog, the one of the modules by default, to a binary file that load() maps into memory.
+    """
+    catalog = catalog if catalog is not None else Catalog.from_modules()
+    strings: Dict[str, int] = {}
+    integers: List[int] = []
+    directory: List[int] = []
+
+    def string(text: str) -> int:
+        return strings.setdefault(text, len(strings))
+
+    for item in catalog:
+        directory += (string(item.name), len(integers))
+        kind = type(item.versions[0]) if item.versions else Version
+        integers += (_KINDS.index(kind), _RANGED if item.ranged else 0, len(item.versions), len(item.table.weights))
+        integers += (string(repr(float(weight))) for weight in item.table.weights)
+        models = item.platform_models
+        integers.append(len(models) if models is not None else -1)
+        integers += (string(model) for model in models or ())
+        integers += item.years if item.years is not None else (-1, -1)
+        for version in item.versions:
+            if type(version) is not kind:
+                raise ValueError(f'The versions of {item.name} must all be of the same type')
+            integers += _encode_parts(version)
+            if kind in _NESTED:
+                integers += _encode_parts(getattr(version, _NESTED[kind]))
+            elif kind is AndroidVersion:
+                integers += _encode_build_numbers(version.build_numbers, string)
+
+    text = [item.encode('utf-8') for item in strings]
+    offsets = [0]
+    for encoded in text:
+        offsets.append(offsets[-1] + len(encoded))
+
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(_MAGIC, len(strings), len(directory) // 2, len(integers)))
+        file.write(struct.pack(f'<{len(offsets)}I', *offsets))
+        file.write(struct.pack(f'<{len(directory)}I', *directory))
+        file.write(struct.pack(f'<{len(integers)}i', *integers))
+        file.write(b''.join(text))
+
+
+def _encode_parts(version: Version) -> List[int]:
+    encoded = []
+    for part in version.spec():
+        if part is None:
+            encoded += (_NONE, 0, 0)
+        elif isinstance(part, tuple):
+            encoded += (_RANGE, part[0], part[1])
+        else:
+            encoded += (_INT, part, 0)
+    return encoded
+
+
+def _encode_build_numbers(build_numbers, string) -> List[int]:
+    # -1 for none, -2 and a string for a single template, or the number of templates and the templates
+    if build_numbers is None:
+        return [-1]
+    if type(build_numbers) is str:
+        return [-2, string(build_numbers)]
+    return [len(build_numbers), *(string(template) for template in build_numbers)]
+
+
+class BinaryCatalog(Catalog):
+    """
+    A catalog mapped into memory from a file written by dump(). The processes which load the same file share
+    its pages; an entry is decoded into versions on first use.
+    """
+
+    def __init__(self, path: str):
+        import mmap
+        super().__init__({})
+        with open(path, 'rb') as file:
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            strings, entries, integers = _check(self.__map, path)
+        except ValueError:
+            self.__map.close()
+            raise
+        start = _HEADER.size
+        self.__offsets = _array(self.__map, start, strings + 1, 'I')
+        start += (strings + 1) * 4
+        directory = _array(self.__map, start, entries * 2, 'I')
+        start += entries * 8
+        self.__integers = _array(self.__map, start, integers, 'i')
+        self.__text = start + integers * 4
+
+        self.__strings: Dict[int, str] = {}
+        self.__directory = {self.__string(directory[i]): directory[i + 1] for i in range(0, len(directory), 2)}
+        self.__decoded: Dict[str, Entry] = {}
+
+    def get(self, name: str) -> Union[Entry, None]:
+        decoded = self.__decoded.get(name)
+        if decoded is None and name in self.__directory:
+            # Decoded at most once per thread that races for it, the first one is kept
+            decoded = self.__decoded.setdefault(name, self.__decode(name, self.__directory[name]))
+        return decoded
+
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self.__directory)
+
+    def __string(self, index: int) -> str:
+        text = self.__strings.get(index)
+        if text is None:
+            start, end = self.__text + self.__offsets[index], self.__text + self.__offsets[index + 1]
+            text = self.__strings[index] = self.__map[start:end].decode('utf-8')
+        return text
+
+    def __decode(self, name: str, offset: int) -> Entry:
+        integers = self.__integers
+        kind_index, flags, count, weights = integers[offset:offset + 4]
+        kind = _KINDS[kind_index]
+        offset += 4
+        weights_ = tuple(float(self.__string(index)) for index in integers[offset:offset + weights])
+        offset += weights
+        models = integers[offset]
+        offset += 1
+        platform_models = None
+        if models >= 0:
+            platform_models = tuple(self.__string(index) for index in integers[offset:offset + models])
+            offset += models
+        years = None if integers[offset] < 0 else (integers[offset], integers[offset + 1])
+        offset += 2
+
+        nested: Dict[tuple, Version] = {}  # Nested versions are shared, like the ones of the modules
+        versions = []
+        for _ in range(count):
+            version = _decode_parts(integers, offset)
+            offset += 12
+            if kind in _NESTED:
+                spec = tuple(integers[offset:offset + 12])
+                inner = nested.get(spec)
+                if inner is None:
+                    inner = nested[spec] = _decode_parts(integers, offset)
+                offset += 12
+                version = kind(version, inner)
+            elif kind is AndroidVersion:
+                build_numbers, offset = self.__decode_build_numbers(integers, offset)
+                version = AndroidVersion(version, build_numbers=build_numbers)
+            versions.append(version)
+
+        return Entry(name, versions, weights_, ranged=bool(flags & _RANGED), platform_models=platform_models,
+                     years=years)
+
+    def __decode_build_numbers(self, integers, offset: int) -> tuple:
+        count = integers[offset]
+        if count == -1:
+            return None, offset + 1
+        if count == -2:
+            return self.__string(integers[offset + 1]), offset + 2
+        return tuple(self.__string(index) for index in integers[offset + 1:offset + 1 + count]), offset + 1 + count
+
+    def close(self):
+        for view in (self.__offsets, self.__integers):
+            if isinstance(view, memoryview):
+                view.release()
+        self.__map.close()
+
+
+def load(path: str) -> BinaryCatalog:
+    """
+    Maps a catalog file written by dump() into memory. Install it to use it instead of the modules.
+    """
+    return BinaryCatalog(path)
+
+
+def _check(buffer, path: str) -> Tuple[int, int, int]:
+    # The numbers of strings, entries and integers of the header, if the file has the size they make
+    if len(buffer) < _HEADER.size:
+        raise ValueError(f'Not a catalog file: {path}')
+    magic, strings, entries, integers = _HEADER.unpack_from(buffer, 0)
+    if magic != _MAGIC:
+        raise ValueError(f'Not a catalog file: {path}')
+
+    size = _HEADER.size + (strings + 1) * 4 + entries * 8 + integers * 4
+    if len(buffer) >= size:
+        size += struct.unpack_from('<I', buffer, _HEADER.size + strings * 4)[0]  # The end of the last string
+    if len(buffer) != size:
+        raise ValueError(f'Truncated or corrupted catalog file: {path} has {len(buffer)} bytes instead of {size}')
+    return strings, entries, integers
+
+
+def _decode_parts(integers, offset: int) -> Version:
+    parts = []
+    for i in range(offset, offset + 12, 3):
+        tag, low, high = integers[i], integers[i + 1], integers[i + 2]
+        parts.append(None if tag == _NONE else low if tag == _INT else (low, high))
+    return Version(*parts)
+
+
+def _version_to_dict(version: Version) -> dict:
+    data = {'version': _parts_to_list(version)}
+    kind = type(version)
+    if kind in _NESTED:
+        data[_NESTED[kind]] = _parts_to_list(getattr(version, _NESTED[kind]))
+    elif kind is AndroidVersion:
+        build_numbers = version.build_numbers
+        data['build_numbers'] = build_numbers if build_numbers is None or type(build_numbers) is str \
+            else list(build_numbers)
+    return data
+
+
+def _version_from_dict(data: dict, nested: Dict[tuple, Version]) -> Version:
+    # The type of the version is told by its keys; nested versions are shared, like the ones of the modules
+    version = _version_from_list(data['version'])
+    for kind, attribute in _NESTED.items():
+        if attribute in data:
+            spec = tuple(tuple(part) if isinstance(part, list) else part for part in data[attribute])
+            inner = nested.get(spec)
+            if inner is None:
+                inner = nested[spec] = _version_from_list(data[attribute])
+            return kind(version, inner)
+    if 'build_numbers' in data:
+        build_numbers = data['build_numbers']
+        return AndroidVersion(version, build_numbers=tuple(build_numbers) if isinstance(build_numbers, list)
+                              else build_numbers)
+    return version
+
+
+def _parts_to_list(version: Version) -> list:
+    return [list(part) if isinstance(part, tuple) else part for part in version.spec()]
+
+
+def _version_from_list(parts: list) -> Version:
+    return Version(*(tuple(part) if isinstance(part, (list, tuple)) else part for part in parts))
+
+
+def _array(buffer, start: int, count: int, code: str):
+    # The integers are read in place, unless the machine is big-endian
+    view = memoryview(buffer)[start:start + count * 4].cast(code)
+    if sys.byteorder == 'little':
+        return view
+    import array
+    values = array.array(code, view)
+    values.byteswap()
+    return values
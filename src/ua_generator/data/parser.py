@@ -0,0 +1,110 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import functools
+import re
+import string
+from typing import Dict, List, Tuple, Union
+
+from . import catalog, registry
+from .space import TemplateSpace, template_space
+
+# The text of a field, by name. Any other field is a version.
+_field_patterns = {
+    'model': r'(?:; [^;]+?)?',
+    'build': r'(?:; Build/[^;)]+)?',
+}
+_version_pattern = r'\d+(?:[._]\d+)*'
+
+
+class Parser:
+    """
+    Recognizes the user-agents rendered from the templates of the registry.
+    The templates are compiled into one pattern for each literal prefix, one alternative per template,
+    so a user-agent is dispatched by its first characters and matched once.
+    """
+
+    def __init__(self):
+        # (platform, browser, template index, (field, group) pairs) of each alternative
+        self.__templates: List[Tuple[str, str, int, Tuple[Tuple[str, str], ...]]] = []
+        self.__spaces: List[Union[TemplateSpace, None]] = []  # Of each alternative, built on first match
+        alternatives: Dict[str, List[str]] = {}
+
+        templates = []
+        for browser_provider in registry.browsers:
+            for platform_provider in registry.platforms:
+                renderer = browser_provider.renderer(platform_provider.name)
+                if renderer is None or not browser_provider.supports(platform_provider.name):
+                    continue
+                for index, template in enumerate(renderer.templates):
+                    templates.append((platform_provider.name, browser_provider.name, index, template))
+
+        self.prefix_length = min((len(_literal_prefix(template)) for _, _, _, template in templates), default=0)
+        for platform, browser, index, template in templates:
+            number = len(self.__templates)
+            pattern, groups = _pattern(template, number)
+            self.__templates.append((platform, browser, index, groups))
+            self.__spaces.append(None)
+            alternatives.setdefault(template[:self.prefix_length], []).append(pattern)
+
+        self.__patterns: Dict[str, re.Pattern] = {
+            prefix: re.compile('|'.join(patterns)) for prefix, patterns in alternatives.items()
+        }
+
+    def parse(self, text: str) -> Union[Tuple[str, str, object, object], None]:
+        """
+        The (platform, browser, platform version, browser version) the user-agent was rendered from,
+        or None if it was not rendered from a template of the catalog.
+        """
+        pattern = self.__patterns.get(text[:self.prefix_length])
+        if pattern is None:
+            return None
+        match = pattern.fullmatch(text)
+        if match is None:
+            return None
+
+        number = int(match.lastgroup[1:])
+        platform, browser, index, groups = self.__templates[number]
+        space = self.__spaces[number]
+        if space is None:
+            space = self.__spaces[number] = template_space(platform, browser, index)
+        versions = space.find({field: match[group] for field, group in groups})
+        if versions is None:
+            return None
+        return (platform, browser) + versions
+
+
+@functools.lru_cache(maxsize=1)
+def _parser(revisions, installed) -> Parser:
+    return Parser()
+
+
+def parser() -> Parser:
+    """
+    The parser of the current templates and catalog, rebuilt when a platform or a browser is registered,
+    or a catalog is installed.
+    """
+    return _parser((registry.platforms.revision, registry.browsers.revision), catalog.installed)
+
+
+def _literal_prefix(template: str) -> str:
+    return next(string.Formatter().parse(template), ('',))[0]
+
+
+def _pattern(template: str, number: int) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    # The whole template is the group "t<number>", so the last group of a match tells the template.
+    # The fields are the groups "f<number>_<field>", a field rendered twice must have the same text.
+    parts = []
+    groups = {}
+    for literal, field, _, _ in string.Formatter().parse(template):
+        parts.append(re.escape(literal))
+        if not field:
+            continue
+        if field in groups:
+            parts.append(f'(?P={groups[field]})')
+            continue
+        groups[field] = f'f{number}_{field}'
+        parts.append(f'(?P<{groups[field]}>{_field_patterns.get(field, _version_pattern)})')
+    return f'(?P<t{number}>{"".join(parts)})', tuple(groups.items())
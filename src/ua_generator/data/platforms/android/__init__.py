@@ -3,21 +3,155 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-import random
+import functools
+import importlib
+import itertools
+import re
+from typing import Dict, List, Sequence, Tuple, Union
 
-from . import android_samsung, android_pixel, android_xiaomi, android_oppo
+from ... import catalog
+from ...space import Concat, Mapped, Product
 from ...version import AndroidVersion
 from ....options import Options
 
+# The vendor modules, imported on first use
+vendor_names = ('android_pixel', 'android_oppo', 'android_xiaomi', 'android_samsung')
+_loaded = {}
 
-def get_version(options: Options) -> AndroidVersion:
-    choice = random.randint(0, 20)
+
+def load_vendor(name: str, current: Union[tuple, None] = None):
+    """
+    The vendor module, or its entry in the installed catalog, or in the one of current (see Provider.source).
+    """
+    installed = current[0] if current is not None else catalog.installed
+    entry = installed.get(name) if installed is not None else None
+    if entry is not None:
+        return entry
+
+    module = _loaded.get(name)
+    if module is None:
+        module = _loaded[name] = importlib.import_module('.' + name, __name__)
+    return module
+
+
+def _vendors() -> tuple:
+    return tuple(load_vendor(name) for name in vendor_names)
+
+
+def __getattr__(name: str):
+    if name == 'vendors':
+        return _vendors()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def get_version(options: Options, current: Union[tuple, None] = None) -> AndroidVersion:
+    rng = options.rng
+    choice = rng.randint(0, 20)
 
     if choice < 2:
-        return android_pixel.get_version(options=options)
+        return load_vendor('android_pixel', current).get_version(options=options)
     if choice < 4:
-        return android_oppo.get_version(options=options)
+        return load_vendor('android_oppo', current).get_version(options=options)
     if choice < 10:
-        return android_xiaomi.get_version(options=options)
+        return load_vendor('android_xiaomi', current).get_version(options=options)
+
+    return load_vendor('android_samsung', current).get_version(options=options)
+
+
+def fields(version: AndroidVersion) -> dict:
+    return {
+        'android': str(version.major),
+        'model': '; ' + version.platform_model if version.platform_model is not None else '',
+        'build': '; Build/' + version.build_number if version.build_number is not None else '',
+    }
+
+
+def space(keys: Tuple[str, ...], options: Options) -> Sequence[AndroidVersion]:
+    """
+    The Android versions which differ in the fields in keys, built on access.
+    The vendors share the build number templates, but not the models; so they are only told apart by the model.
+    """
+    vendors = _vendors()
+    groups = [(vendor,) for vendor in vendors] if 'model' in keys else [vendors]
+    sequences = []
+    for group in groups:
+        models = tuple(dict.fromkeys(model for vendor in group for model in vendor.platform_models))
+        # Major version (or None if it is not shown) -> representative version, build number template -> years
+        majors = {}
+        for vendor in group:
+            for version in vendor.versions:
+                representative, templates = majors.setdefault(version.major if 'android' in keys else None, (version, {}))
+                for template in _templates(version.build_numbers):
+                    templates.setdefault(template, set()).update(range(vendor.years[0], vendor.years[1] + 1))
+
+        for representative, templates in majors.values():
+            build_numbers = Concat(_build_numbers(template, sorted(years)) for template, years in templates.items())
+            sequences.append(Mapped(Product((build_numbers if 'build' in keys else (None,),
+                                             models if 'model' in keys else (None,))),
+                                    functools.partial(_version, representative)))
+    return Concat(sequences)
+
+
+def find(keys: Tuple[str, ...], values: dict) -> Union[AndroidVersion, None]:
+    """
+    The Android version which renders the values of the fields in keys, or None.
+    The model tells the vendor apart, then the first version of the major whose templates match the build number.
+    """
+    models, versions = _catalog()
+    vendor = model = None
+    if 'model' in keys:
+        model = values.get('model', '')[2:]
+        vendor = models.get(model)
+        if vendor is None:
+            return None
+    build_number = values.get('build', '')[8:] if 'build' in keys else None
+
+    for version, patterns in versions.get((vendor, values.get('android') if 'android' in keys else None), ()):
+        if build_number is not None and not (any(pattern.fullmatch(build_number) for pattern in patterns)
+                                             if patterns else build_number == ''):
+            continue
+
+        return version._derive(version[:4], version.build_numbers, build_number or None, model)
+    return None
+
+
+_index: Union[tuple, None] = None  # (vendors, models, versions) of the vendors it was built from
+
+
+def _catalog() -> tuple:
+    # Model -> vendor, and (vendor or None, major or None) -> [(version, build number patterns)], built on first use
+    global _index
+    vendors = _vendors()
+    index = _index
+    if index is None or index[0] != vendors:
+        models = {}
+        versions: Dict[tuple, List[tuple]] = {}
+        patterns: Dict[str, re.Pattern] = {}
+        for vendor in vendors:
+            for model in vendor.platform_models:
+                models.setdefault(model, vendor)
+            for version in vendor.versions:
+                entry = (version, tuple(patterns.setdefault(template, _build_number_pattern(template))
+                                        for template in _templates(version.build_numbers)))
+                for key in itertools.product((vendor, None), (str(version.major), None)):
+                    versions.setdefault(key, []).append(entry)
+        index = _index = (vendors, models, versions)
+    return index[1], index[2]
+
+
+def _build_number_pattern(template: str) -> re.Pattern:
+    return re.compile(re.escape(template).replace(r'\{d\}', r'\d{6}').replace(r'\{v\}', r'\d{1,3}'))
+
+
+def _templates(build_numbers) -> tuple:
+    return (build_numbers,) if type(build_numbers) is str else tuple(dict.fromkeys(build_numbers or ()))
+
+
+def _build_numbers(template: str, years: list) -> Sequence[str]:
+    dates = Product((years, range(0, 13), range(0, 30))) if '{d}' in template else (None,)
+    numbers = range(1, 256) if '{v}' in template else (None,)
+    return Mapped(Product((dates, numbers)), lambda parts: AndroidVersion.fill(template, *parts))
+
 
-    return android_samsung.get_version(options=options)
+def _version(representative: AndroidVersion, parts: tuple) -> AndroidVersion:
+    return representative._derive(representative[:4], representative.build_numbers, *parts)
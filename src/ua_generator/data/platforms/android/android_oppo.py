@@ -3,9 +3,9 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-import random
 from typing import List
 
+from ...table import VersionTable
 from ...version import Version, AndroidVersion
 from ....options import Options
 
@@ -20,26 +20,17 @@ versions: List[AndroidVersion] = [
     AndroidVersion(Version(major=15, minor=0, build=0), build_numbers=('AP4A.{d}.{v}', 'AP3A.{d}.{v}')),
 ]
 
+table = VersionTable(weights=(9.0, 10.0))
+
 platform_models = ('CH1933', 'CPH2195', 'CPH2263', 'CPH1941', 'CPH2021', 'CPH2211GDPR',
     'CPH2023', 'CPH2009', 'CPH2025', 'CPH2207', 'CPH2173', 'PEEM00',
     'CPH2307', 'CPH2305', 'CPH1917', 'Global', 'Global', 'CPH2125GDPR',
     'CPH2145', 'Global', 'PEGM10', 'CPH1951', 'CPH2089', 'CPH2065',
     'CPH2251', 'CPH2371', )
 
+years = (22, 25)  # Years of the build dates
 
-def get_version(options: Options) -> AndroidVersion:
-    weights = None
-    if options.weighted_versions:
-        weights = [1.0] * len(versions)
-        weights[-1] = 10.0
-        weights[-2] = 9.0
-
-    choice: List[AndroidVersion] = random.choices(versions, weights=weights, k=1)
 
-    build_number = choice[0].build_number
-    build_number = build_number.replace('{d}', '{:02d}{:02d}{:02d}'.format(random.randint(22, 25), random.randint(0, 12), random.randint(0, 29)))
-    build_number = build_number.replace('{v}', '{}'.format(random.randint(1, 255)))
-
-    choice[0].build_number = build_number
-    choice[0].platform_model = random.choice(platform_models)
-    return choice[0]
+def get_version(options: Options) -> AndroidVersion:
+    choice: AndroidVersion = table.choice(versions, options.rng, weighted=options.weighted_versions)
+    return choice.sample(options.rng, years=years, platform_models=platform_models)
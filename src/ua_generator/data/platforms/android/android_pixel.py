@@ -3,9 +3,9 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-import random
 from typing import List
 
+from ...table import VersionTable
 from ...version import Version, AndroidVersion
 from ....options import Options
 
@@ -24,25 +24,15 @@ versions: List[AndroidVersion] = [
     AndroidVersion(Version(major=15, minor=0, build=0), build_numbers=('AP4A.{d}.{v}', 'AP3A.{d}.{v}')),
 ]
 
+table = VersionTable(weights=(8.0, 9.0, 10.0))
+
 platform_models = ('Pixel 2', 'Pixel 2 XL', 'Pixel 3', 'Pixel 3a', 'Pixel 3a XL', 'Pixel 3 XL', 'Pixel 4',
                    'Pixel 4 XL', 'Pixel 4a (5G)', 'Pixel 5', 'Pixel 5a (5G)', 'Pixel 6', 'Pixel 6 Pro',
                    'Pixel 6a', 'Pixel 7', 'Pixel 7 Pro', 'Pixel 8', 'Pixel 8 Pro', 'Pixel 8a')
 
+years = (17, 25)  # Years of the build dates
 
-def get_version(options: Options) -> AndroidVersion:
-    weights = None
-    if options.weighted_versions:
-        weights = [1.0] * len(versions)
-        weights[-1] = 10.0
-        weights[-2] = 9.0
-        weights[-3] = 8.0
-
-    choice: List[AndroidVersion] = random.choices(versions, weights=weights, k=1)
 
-    build_number = choice[0].build_number
-    build_number = build_number.replace('{d}', '{:02d}{:02d}{:02d}'.format(random.randint(17, 25), random.randint(0, 12), random.randint(0, 29)))
-    build_number = build_number.replace('{v}', '{}'.format(random.randint(1, 255)))
-
-    choice[0].build_number = build_number
-    choice[0].platform_model = random.choice(platform_models)
-    return choice[0]
+def get_version(options: Options) -> AndroidVersion:
+    choice: AndroidVersion = table.choice(versions, options.rng, weighted=options.weighted_versions)
+    return choice.sample(options.rng, years=years, platform_models=platform_models)
@@ -3,9 +3,9 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-import random
 from typing import List
 
+from ...table import VersionTable
 from ...version import Version, AndroidVersion
 from ....options import Options
 
@@ -24,6 +24,8 @@ versions: List[AndroidVersion] = [
     AndroidVersion(Version(major=15, minor=0, build=0), build_numbers=('AP4A.{d}.{v}', 'AP3A.{d}.{v}')),
 ]
 
+table = VersionTable(weights=(9.0, 10.0))
+
 
 # https://whatmyuseragent.com/brand/xi/xiaomi
 # https://gist.github.com/iamdual/2ef10eeae2c3ce22470bb9acfa77435e
@@ -69,20 +71,9 @@ platform_models = (
     'Redmi Pad Pro 5G', 'Redmi Pad SE', 'Redmi Pad SE 8.7"', 'Redmi Turbo 3', 'Redmi Y1 Lite'
 )
 
+years = (22, 25)  # Years of the build dates
 
-def get_version(options: Options) -> AndroidVersion:
-    weights = None
-    if options.weighted_versions:
-        weights = [1.0] * len(versions)
-        weights[-1] = 10.0
-        weights[-2] = 9.0
-
-    choice: List[AndroidVersion] = random.choices(versions, weights=weights, k=1)
 
-    build_number = choice[0].build_number
-    build_number = build_number.replace('{d}', '{:02d}{:02d}{:02d}'.format(random.randint(22, 25), random.randint(0, 12), random.randint(0, 29)))
-    build_number = build_number.replace('{v}', '{}'.format(random.randint(1, 255)))
-
-    choice[0].build_number = build_number
-    choice[0].platform_model = random.choice(platform_models)
-    return choice[0]
+def get_version(options: Options) -> AndroidVersion:
+    choice: AndroidVersion = table.choice(versions, options.rng, weighted=options.weighted_versions)
+    return choice.sample(options.rng, years=years, platform_models=platform_models)
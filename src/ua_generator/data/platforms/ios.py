@@ -3,9 +3,10 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-import random
 from typing import List
 
+from ..renderer import apple_version
+from ..table import VersionTable
 from ..version import Version, VersionRange
 from ...options import Options
 
@@ -44,21 +45,20 @@ versions: List[Version] = [
     Version(major=18, minor=3, build=(0, 1)),
 ]
 
+table = VersionTable(weights=(7.0, 8.0, 9.0, 10.0))
+
 
 def get_version(options: Options) -> Version:
+    rng = options.rng
     if options.version_ranges is not None and 'ios' in options.version_ranges:
         if type(options.version_ranges['ios']) == VersionRange:
-            filtered = options.version_ranges['ios'].filter(versions)
+            filtered = table.filter(versions, options.version_ranges['ios'])
             if type(filtered) == list and len(filtered) > 0:
-                return random.choice(filtered)
+                return rng.choice(filtered).sample(rng)
+
+    choice: Version = table.choice(versions, rng, weighted=options.weighted_versions)
+    return choice.sample(rng)
 
-    weights = None
-    if options.weighted_versions:
-        weights = [1.0] * len(versions)
-        weights[-1] = 10.0
-        weights[-2] = 9.0
-        weights[-3] = 8.0
-        weights[-4] = 7.0
 
-    choice: List[Version] = random.choices(versions, weights=weights, k=1)
-    return choice[0]
+def fields(version: Version) -> dict:
+    return {'ios': apple_version(version)}
@@ -3,9 +3,9 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-import random
 from typing import List
 
+from ..table import VersionTable
 from ..version import Version
 from ...options import Options
 
@@ -41,11 +41,18 @@ versions: List[Version] = [
     Version(major=6, minor=7, build=(0, 5)),
 ]
 
+table = VersionTable()
+
 
 def get_version(options: Options) -> Version:
-    weights = None
-    if options.weighted_versions:
-        weights = [1.0] * len(versions)
+    rng = options.rng
+    choice: Version = table.choice(versions, rng, weighted=options.weighted_versions)
+    return choice.sample(rng)
+
+
+def reachable(options: Options) -> List[Version]:
+    return versions  # Version ranges are not supported
+
 
-    choice: List[Version] = random.choices(versions, weights=weights, k=1)
-    return choice[0]
+def fields(version: Version) -> dict:
+    return {}
@@ -3,9 +3,9 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
-import random
 from typing import List
 
+from ..table import VersionTable
 from ..version import Version, WindowsVersion, VersionRange
 from ...options import Options
 
@@ -19,20 +19,21 @@ versions: List[WindowsVersion] = [
     WindowsVersion(Version(major=10, minor=0), ch_platform=Version(major=(13, 15))),
 ]
 
+# https://gs.statcounter.com/os-version-market-share/windows/desktop/worldwide
+table = VersionTable(weights=(10.0, 7.0))
+
 
 def get_version(options: Options) -> WindowsVersion:
+    rng = options.rng
     if options.version_ranges is not None and 'windows' in options.version_ranges:
         if type(options.version_ranges['windows']) == VersionRange:
-            filtered = options.version_ranges['windows'].filter(versions)
+            filtered = table.filter(versions, options.version_ranges['windows'])
             if type(filtered) == list and len(filtered) > 0:
-                return random.choice(filtered)
+                return rng.choice(filtered).sample(rng)
+
+    choice: WindowsVersion = table.choice(versions, rng, weighted=options.weighted_versions)
+    return choice.sample(rng)
 
-    weights = None
-    if options.weighted_versions:
-        weights = [1.0] * len(versions)
-        # https://gs.statcounter.com/os-version-market-share/windows/desktop/worldwide
-        weights[-1] = 7.0
-        weights[-2] = 10.0
 
-    choice: List[WindowsVersion] = random.choices(versions, weights=weights, k=1)
-    return choice[0]
+def fields(version: WindowsVersion) -> dict:
+    return {'windows': str(version)}
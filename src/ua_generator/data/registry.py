@@ -0,0 +1,171 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import importlib
+from typing import Dict, Tuple, Union
+
+from . import catalog
+from .version import VersionRange
+from .. import exceptions
+
+
+class Provider:
+    """
+    A platform or a browser, backed by a module which is imported on first use.
+    The module provides the version table and "get_version(options)". A module which draws from the entries of its
+    vendors ("vendor_names") takes the catalog of the generation too: "get_version(options, current)".
+    """
+
+    def __init__(self, name: str, module: str):
+        self.name = name
+        self.module = module  # Absolute, or relative to this package
+        self.__loaded = None
+        # (revision of the catalog, source, whether the source draws from the vendor entries of the catalog),
+        # resolved once per installed catalog
+        self.__source = (-1, None, False)
+
+    def load(self):
+        if self.__loaded is None:
+            self.__loaded = importlib.import_module(self.module, __package__)
+        return self.__loaded
+
+    def source(self, current: Union[tuple, None] = None):
+        """
+        The entry of the installed catalog for the provider, or its module.
+        A generation passes the (catalog, revision) pair of catalog.current it read once, so that it uses a single
+        catalog even if another one is installed meanwhile.
+        """
+        return self.__resolve(current)[1]
+
+    def __resolve(self, current: Union[tuple, None]) -> tuple:
+        installed, revision = current if current is not None else catalog.current
+        source = self.__source
+        if source[0] != revision:
+            entry = installed.get(self.name) if installed is not None else None
+            if entry is not None:
+                source = self.__source = (revision, entry, False)
+            else:
+                module = self.load()
+                source = self.__source = (revision, module, hasattr(module, 'vendor_names'))
+        return source
+
+    def get_version(self, options, current: Union[tuple, None] = None):
+        _, source, vendors = self.__resolve(current)
+        if vendors:
+            return source.get_version(options=options, current=current)
+        return source.get_version(options=options)
+
+    def reachable(self, options) -> list:
+        """
+        The versions of the table that get_version may draw with the options.
+        A module may provide its own "reachable(options)", otherwise the range of the provider applies.
+        """
+        module = self.source()
+        if hasattr(module, 'reachable'):
+            return module.reachable(options)
+
+        version_range = options.version_ranges.get(self.name) if options.version_ranges is not None else None
+        if type(version_range) == VersionRange:
+            filtered = module.table.filter(module.versions, version_range)
+            if len(filtered) > 0:
+                return filtered
+        return module.versions
+
+    def __repr__(self):
+        return f"{type(self).__name__}(name='{self.name}', module='{self.module}')"
+
+
+class PlatformProvider(Provider):
+    """
+    The module also provides "fields(version)", which returns the template fields of a platform version.
+    Client hints that vary on a platform are chosen from the tuples, seeded by the user-agent.
+    """
+
+    def __init__(self, name: str, module: str,
+                 device: str,
+                 ch_platform: str,
+                 bitness: Tuple[str, ...] = ('64',),
+                 architectures: Tuple[str, ...] = ('x86',),
+                 wow64: bool = False):
+        super().__init__(name, module)
+        self.device = device
+        self.ch_platform = ch_platform
+        self.bitness = bitness
+        self.architectures = architectures
+        self.wow64 = wow64
+
+    def fields(self, version) -> dict:
+        return self.load().fields(version)
+
+
+class BrowserProvider(Provider):
+    """
+    The module also provides "renderers", the compiled templates of the browser on each platform.
+    """
+
+    def __init__(self, name: str, module: str,
+                 brands: Tuple[str, ...] = (),
+                 platforms: Union[Tuple[str, ...], None] = None):
+        super().__init__(name, module)
+        self.brands = brands  # Client hint brands, after "Not A(Brand". Browsers without them do not support client hints.
+        self.platforms = platforms  # None for all platforms
+
+    @property
+    def supports_ch(self) -> bool:
+        return len(self.brands) > 0
+
+    def supports(self, platform: str) -> bool:
+        return self.platforms is None or platform in self.platforms
+
+    def renderer(self, platform: str):
+        return self.load().renderers.get(platform)
+
+
+class Registry:
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.revision = 0  # Bumped on every change, to invalidate what is derived from the registry
+        self.__providers: Dict[str, Provider] = {}
+
+    def register(self, provider: Provider):
+        self.__providers[provider.name] = provider
+        self.revision += 1
+
+    def unregister(self, name: str):
+        if self.__providers.pop(name, None) is not None:
+            self.revision += 1
+
+    def names(self, device: Union[str, None] = None) -> Tuple[str, ...]:
+        if device is None:
+            return tuple(self.__providers)
+        return tuple(name for name, provider in self.__providers.items() if provider.device == device)
+
+    def __getitem__(self, name: str):
+        provider = self.__providers.get(name)
+        if provider is None:
+            raise exceptions.InvalidArgumentError('No such {} found: {}'.format(self.kind, name))
+        return provider
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__providers
+
+    def __iter__(self):
+        return iter(self.__providers.values())
+
+
+platforms = Registry('platform')
+platforms.register(PlatformProvider('windows', '.platforms.windows', device='desktop', ch_platform='Windows', wow64=True))
+platforms.register(PlatformProvider('macos', '.platforms.macos', device='desktop', ch_platform='macOS',
+                                    architectures=('arm', 'x86', 'arm', 'arm')))
+platforms.register(PlatformProvider('ios', '.platforms.ios', device='mobile', ch_platform='iOS', architectures=('arm',)))
+platforms.register(PlatformProvider('linux', '.platforms.linux', device='desktop', ch_platform='Linux'))
+platforms.register(PlatformProvider('android', '.platforms.android', device='mobile', ch_platform='Android',
+                                    bitness=('32', '64', '32', '32'), architectures=('arm',)))
+
+browsers = Registry('browser')
+browsers.register(BrowserProvider('chrome', '.browsers.chrome', brands=('Chromium', 'Google Chrome')))
+browsers.register(BrowserProvider('edge', '.browsers.edge', brands=('Chromium', 'Microsoft Edge')))
+browsers.register(BrowserProvider('firefox', '.browsers.firefox'))
+browsers.register(BrowserProvider('safari', '.browsers.safari', platforms=('macos', 'ios')))
@@ -0,0 +1,74 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import operator
+import random
+import string
+from typing import Callable, FrozenSet, List, Tuple
+
+from .. import utils
+
+
+class Renderer:
+    """
+    The template alternatives of a (platform, browser) pair, each split once into its texts and fields,
+    so that rendering joins the texts with the values of the fields instead of parsing the template.
+    The browser fields are added on top of the platform fields, and may override them.
+    They may only depend on the platform version through the platform fields they override.
+    """
+
+    def __init__(self, templates: Tuple[str, ...], fields: Callable[..., dict]):
+        self.templates = templates
+        self.fields = fields
+        parsed = [tuple(string.Formatter().parse(template)) for template in templates]
+        self.keys: Tuple[FrozenSet[str], ...] = tuple(  # The fields used by each template
+            frozenset(field for _, field, _, _ in items if field)
+            for items in parsed
+        )
+        self.__compiled = tuple(_compile(template, items) for template, items in zip(templates, parsed))
+
+    def render(self, platform_provider, platform_version, browser_version, rng: random.Random = None) -> str:
+        compiled = self.__compiled
+        return self.__render(compiled[0] if len(compiled) == 1 else utils.choice(compiled, rng),
+                             platform_provider, platform_version, browser_version)
+
+    def render_template(self, index: int, platform_provider, platform_version, browser_version) -> str:
+        return self.__render(self.__compiled[index], platform_provider, platform_version, browser_version)
+
+    def __render(self, compiled: tuple, platform_provider, platform_version, browser_version) -> str:
+        pieces, values = compiled
+        text = pieces.copy()
+        text[1::2] = values(self.__fields(platform_provider, platform_version, browser_version))
+        return ''.join(text)
+
+    def __fields(self, platform_provider, platform_version, browser_version) -> dict:
+        fields = platform_provider.fields(platform_version)
+        fields.update(self.fields(platform_version, browser_version))
+        return fields
+
+
+def _compile(template: str, parsed: tuple) -> Tuple[List[str], Callable[[dict], tuple]]:
+    # The texts of the template with the names of its fields in between, and a getter of the values of the fields
+    pieces = ['']
+    for text, field, spec, conversion in parsed:
+        pieces[-1] += text  # Escaped braces split the texts
+        if field is not None:
+            if not field or spec or conversion:
+                raise ValueError(f'Only named fields without a format are supported: {template}')
+            pieces += (field, '')
+
+    names = pieces[1::2]
+    if len(names) == 1:
+        name = names[0]
+        return pieces, lambda fields: (fields[name],)
+    return pieces, operator.itemgetter(*names) if names else lambda fields: ()
+
+
+def apple_version(version) -> str:
+    return version.format(partitions=3, separator='_', trim_zero=True)
+
+
+def chromium_fields(platform_version, browser_version) -> dict:
+    return {'chrome': str(browser_version), 'webkit': str(browser_version.webkit)}
@@ -0,0 +1,241 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import bisect
+import functools
+import itertools
+from typing import Callable, Dict, Iterable, Iterator, Sequence, Tuple, Union
+
+from . import catalog, registry
+from .version import VersionRange
+
+
+class Product:
+    """
+    The cartesian product of sequences, indexed in mixed radix: the last sequence varies the fastest.
+    """
+
+    def __init__(self, sequences: Iterable[Sequence]):
+        self.sequences = tuple(sequences)
+        self.__length = 1
+        for sequence in self.sequences:
+            self.__length *= len(sequence)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __getitem__(self, index: int) -> tuple:
+        index = _index(index, self.__length)
+        items = []
+        for sequence in reversed(self.sequences):
+            index, digit = divmod(index, len(sequence))
+            items.append(sequence[digit])
+        return tuple(reversed(items))
+
+    def __iter__(self) -> Iterator[tuple]:
+        return itertools.product(*self.sequences)
+
+
+class Concat:
+    """
+    Sequences one after another, found by bisecting their offsets.
+    """
+
+    def __init__(self, sequences: Iterable[Sequence]):
+        self.sequences = tuple(sequence for sequence in sequences if len(sequence) > 0)
+        self.__offsets = list(itertools.accumulate(len(sequence) for sequence in self.sequences))
+
+    def __len__(self) -> int:
+        return self.__offsets[-1] if self.__offsets else 0
+
+    def __getitem__(self, index: int):
+        index = _index(index, len(self))
+        i = bisect.bisect_right(self.__offsets, index)
+        return self.sequences[i][index - (self.__offsets[i - 1] if i > 0 else 0)]
+
+    def __iter__(self) -> Iterator:
+        return itertools.chain.from_iterable(self.sequences)
+
+
+class Mapped:
+    """
+    The items of a sequence, passed through a function on access.
+    """
+
+    def __init__(self, sequence: Sequence, function: Callable):
+        self.sequence = sequence
+        self.function = function
+
+    def __len__(self) -> int:
+        return len(self.sequence)
+
+    def __getitem__(self, index: int):
+        return self.function(self.sequence[index])
+
+    def __iter__(self) -> Iterator:
+        return map(self.function, self.sequence)
+
+
+def _index(index: int, length: int) -> int:
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError('Index out of range')
+    return index
+
+
+def distinct(versions: Iterable, fields: Callable[..., dict], keys: Tuple[str, ...]) -> Dict[tuple, object]:
+    """
+    Every version that may be sampled from the versions, by the values of the fields in keys.
+    The first version is kept for each value.
+    """
+    found = {}
+    for catalog_version in versions:
+        for version in catalog_version.expand():
+            values = fields(version)
+            found.setdefault(tuple(values.get(key) for key in keys), version)
+    return found
+
+
+class TemplateSpace:
+    """
+    The distinct (platform version, browser version) pairs of a template, which differ in the fields it shows,
+    and their lookup by the values of these fields.
+    A platform module may provide its own "space(keys, options)" and "find(keys, values)",
+    when its versions are too many to be listed.
+    """
+
+    def __init__(self, platform: str, browser: str, index: int, options):
+        platform_provider = registry.platforms[platform]
+        renderer = registry.browsers[browser].renderer(platform)
+        self.__module = platform_provider.load()
+        self.__find_platform_version = getattr(self.__module, 'find', None)
+        self.__platform_provider = platform_provider
+        self.__options = options
+        self.__joint = None
+        keys = renderer.keys[index]
+
+        any_platform_version = self.__platform_space(())[0]
+        browser_catalog = registry.browsers[browser].reachable(options)
+        platform_keys = set(platform_provider.fields(any_platform_version))
+        browser_keys = set(renderer.fields(any_platform_version, browser_catalog[0]))
+
+        if not platform_keys & browser_keys & keys:
+            # The browser fields do not depend on the platform version
+            self.platform_keys = tuple(sorted(keys - browser_keys))
+            self.browser_keys = tuple(sorted(keys & browser_keys))
+            self.__browsers = distinct(browser_catalog, lambda version: renderer.fields(any_platform_version, version),
+                                       self.browser_keys)
+            self.__sequence = Product((self.__platform_space(self.platform_keys), tuple(self.__browsers.values())))
+            return
+
+        # Some platform fields are overridden by the browser, both versions are listed together
+        self.keys = tuple(sorted(keys))
+        self.__joint = {}
+        for platform_version in self.__platform_space(tuple(sorted(keys & platform_keys))):
+            for catalog_version in browser_catalog:
+                for browser_version in catalog_version.expand():
+                    values = platform_provider.fields(platform_version)
+                    values.update(renderer.fields(platform_version, browser_version))
+                    self.__joint.setdefault(tuple(values.get(key) for key in self.keys),
+                                            (platform_version, browser_version))
+        self.__sequence = tuple(self.__joint.values())
+
+    def __platform_space(self, keys: Tuple[str, ...]) -> Sequence:
+        if hasattr(self.__module, 'space'):
+            return self.__module.space(keys, self.__options)
+        self.__platforms = distinct(self.__platform_provider.reachable(self.__options), self.__platform_provider.fields,
+                                    keys)
+        return tuple(self.__platforms.values())
+
+    def find(self, values: dict) -> Union[tuple, None]:
+        """
+        The (platform version, browser version) pair which renders the field values, or None.
+        """
+        if self.__joint is not None:
+            return self.__joint.get(tuple(values.get(key) for key in self.keys))
+
+        if self.__find_platform_version is not None:
+            platform_version = self.__find_platform_version(self.platform_keys, values)
+        else:
+            platform_version = self.__platforms.get(tuple(values.get(key) for key in self.platform_keys))
+        browser_version = self.__browsers.get(tuple(values.get(key) for key in self.browser_keys))
+        if platform_version is None or browser_version is None:
+            return None
+        return platform_version, browser_version
+
+    def __len__(self) -> int:
+        return len(self.__sequence)
+
+    def __getitem__(self, index: int) -> tuple:
+        return self.__sequence[index]
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self.__sequence)
+
+
+_template_spaces = {}
+_max_template_spaces = 256
+
+
+def template_space(platform: str, browser: str, index: int, version_ranges: dict = None) -> TemplateSpace:
+    version_ranges = version_ranges or {}
+    ranges = {name: version_ranges[name] for name in (platform, browser)
+              if type(version_ranges.get(name)) == VersionRange}
+    key = (platform, browser, index, registry.platforms.revision, registry.browsers.revision, catalog.installed,
+           tuple((name, version_range.keys()) for name, version_range in ranges.items()))
+    space = _template_spaces.get(key)
+    if space is None:
+        if len(_template_spaces) >= _max_template_spaces:
+            _template_spaces.clear()
+        space = _template_spaces[key] = TemplateSpace(platform, browser, index, _RangeOptions(ranges))
+    return space
+
+
+class _RangeOptions:
+    """
+    The options which change the reachable versions of a (platform, browser) pair.
+    """
+
+    def __init__(self, version_ranges: dict):
+        self.version_ranges = version_ranges or None
+
+
+class Space:
+    """
+    Every distinct user-agent of a plan, in a fixed order: by combination, template,
+    then by the platform and browser versions in mixed radix.
+    The k-th user-agent is rendered on access, nothing is listed beyond the versions of the tables.
+    """
+
+    def __init__(self, plan):
+        version_ranges = plan.options.version_ranges or {}
+
+        sequences = []
+        for _, platform, browser in plan.combinations.triples:
+            platform_provider = registry.platforms[platform]
+            renderer = registry.browsers[browser].renderer(platform)
+            if renderer is None:
+                continue
+
+            for index in range(len(renderer.templates)):
+                space = template_space(platform, browser, index, version_ranges)
+                sequences.append(Mapped(space, functools.partial(_render, renderer, index, platform_provider)))
+
+        self.__sequence = Concat(sequences)
+
+    def __len__(self) -> int:
+        return len(self.__sequence)
+
+    def __getitem__(self, index: int) -> str:
+        return self.__sequence[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__sequence)
+
+
+def _render(renderer, index: int, platform_provider, versions: tuple) -> str:
+    platform_version, browser_version = versions
+    return renderer.render_template(index, platform_provider, platform_version, browser_version)
@@ -0,0 +1,143 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import bisect
+import itertools
+import random
+from typing import Dict, List, Tuple
+
+from ..exceptions import InvalidArgumentError
+from .version import VersionRange
+
+
+class VersionTable:
+    """
+    The indexes derived from a version table: the cumulative weights, and the sorted bounds for range lookups.
+    They are built on first use, and rebuilt only when the table is replaced or its length changes.
+    """
+    max_ranges = 64  # Filtered tables to keep
+
+    def __init__(self, weights: Tuple[float, ...] = ()):
+        self.weights = weights  # Weights of the latest versions, the last one is the latest. Others weigh 1.0.
+        self.__versions: list = None
+        self.__length = 0
+        self.__cum_weights: List[float] = []
+        self.__total = 0.0
+        self.__sorted: list = None
+        self.__lowest: List[tuple] = []
+        self.__highest: List[tuple] = []
+        self.__ranges: Dict[tuple, list] = {}
+
+    def __sync(self, versions: list):
+        if versions is self.__versions and len(versions) == self.__length:
+            return
+
+        if len(versions) == 0:
+            raise InvalidArgumentError('A version table needs at least one version')
+        if len(self.weights) > len(versions):
+            raise InvalidArgumentError(
+                f'A version table has {len(self.weights)} weights but only {len(versions)} versions')
+
+        weights = [1.0] * len(versions)
+        for i, weight in enumerate(reversed(self.weights), start=1):
+            weights[-i] = weight
+
+        # The table is checked against the versions, so they are replaced last
+        self.__sorted = None
+        self.__ranges = {}
+        self.__cum_weights = list(itertools.accumulate(weights))
+        self.__total = self.__cum_weights[-1]
+        self.__length = len(versions)
+        self.__versions = versions
+
+    def __index(self):
+        bounds = sorted((version.bounds(), i) for i, version in enumerate(self.__versions))
+        self.__lowest = [lowest for (lowest, _), _ in bounds]
+        self.__highest = [highest for (_, highest), _ in bounds]
+        self.__sorted = [self.__versions[i] for _, i in bounds]
+
+    def prepare(self, versions: list):
+        """
+        Builds the indexes of the versions now, rather than on first use.
+        """
+        self.__sync(versions)
+        if self.__sorted is None:
+            self.__index()
+
+    def choice(self, versions: list, rng: random.Random, weighted: bool = False):
+        self.__sync(versions)
+
+        # Same draws as random.choices(), without rebuilding the weights
+        if weighted:
+            return versions[bisect.bisect(self.__cum_weights, rng.random() * self.__total, 0, self.__length - 1)]
+        return versions[int(rng.random() * self.__length)]
+
+    def filter(self, versions: list, version_range: VersionRange) -> list:
+        """
+        The versions within the range, found by bisecting the sorted bounds.
+        The result is cached for each range, and must not be modified.
+        """
+        self.__sync(versions)
+
+        keys = version_range.keys()
+        filtered = self.__ranges.get(keys)
+        if filtered is not None:
+            return filtered
+
+        if keys is None:
+            filtered = []
+        else:
+            if self.__sorted is None:
+                self.__index()
+
+            lowest, highest = keys
+            start = bisect.bisect_left(self.__lowest, lowest)
+            end = bisect.bisect_right(self.__lowest, highest, start)
+            # Versions that start within the range, but may be sampled beyond it, wherever they are in the slice
+            filtered = [version for version, version_highest in zip(self.__sorted[start:end], self.__highest[start:end])
+                        if version_highest <= highest]
+
+        if len(self.__ranges) >= self.max_ranges:
+            self.__ranges.clear()
+        self.__ranges[keys] = filtered
+        return filtered
+
+
+class AliasTable:
+    """
+    Draws one of the items with the given weights in constant time, with Walker's alias method.
+    https://en.wikipedia.org/wiki/Alias_method
+    """
+
+    def __init__(self, items: list, weights: List[float]):
+        if len(items) == 0 or len(items) != len(weights):
+            raise ValueError('The items and the weights must have the same, non-zero length')
+
+        total = sum(weights)
+        length = len(items)
+        scaled = [weight * length / total for weight in weights]
+        small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+
+        self.items = items
+        self.__length = length
+        self.__probabilities = [1.0] * length
+        self.__aliases = list(range(length))
+
+        # Vose's variant: each column is filled up by a large item
+        while small and large:
+            i = small.pop()
+            j = large.pop()
+            self.__probabilities[i] = scaled[i]
+            self.__aliases[i] = j
+            scaled[j] -= 1.0 - scaled[i]
+            (small if scaled[j] < 1.0 else large).append(j)
+
+    def choice(self, rng: random.Random):
+        column = rng.random() * self.__length
+        i = int(column)
+        if column - i < self.__probabilities[i]:
+            return self.items[i]
+        return self.items[self.__aliases[i]]
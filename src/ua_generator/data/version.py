@@ -3,103 +3,296 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
+import itertools
+import operator
 import random
-from typing import Union, List
+from typing import Dict, Iterator, Union, List, Tuple
 
 from .. import utils
 
-
-class Version:
-    major: int = None
-    minor: int = None
-    build: int = None
-    patch: int = None
-
-    def __init__(self,
-                 major: Union[int, tuple] = None,
-                 minor: Union[int, tuple] = None,
-                 build: Union[int, tuple] = None,
-                 patch: Union[int, tuple] = None):
-        self.major, self.minor, self.build, self.patch = map(
-            lambda x:
-            # https://docs.python.org/3/tutorial/controlflow.html#tut-unpacking-arguments
-            random.randrange(*x) if isinstance(x, tuple) else x,
-            (major, minor, build, patch)
-        )
-        self.__tuple = None
+_INFINITY = float('inf')
+_FORMATS: Dict[tuple, str] = {}  # Formatted parts, by the parts and the arguments of format()
+_MAX_FORMATS = 4096
+_SHARED: Dict[tuple, 'Version'] = {}  # Sampled versions with missing parts, there are only a few of them
+_MAX_SHARED = 4096
+
+
+def _resolve(parts: tuple, rng: random.Random) -> list:
+    return [
+        # https://docs.python.org/3/tutorial/controlflow.html#tut-unpacking-arguments
+        rng.randrange(*part) if isinstance(part, tuple) else part
+        for part in parts
+    ]
+
+
+def _item(index: int, doc: str = None) -> property:
+    # Read-only: a version is hashed, so it never changes
+    return property(operator.itemgetter(index), doc=doc)
+
+
+class Version(tuple):
+    """
+    A version, immutable. It is a single tuple: the four parts, the fields of its type, then the parts as given
+    if any of them is a range, or None. Sampled versions end with the fields: they are drawn for a single user-agent,
+    so unlike the versions built by the constructor, their formats are not cached.
+    Versions are compared and hashed by their parts, missing parts counting as zero, and nothing else of the tuple.
+    """
+    __slots__ = ()
+    _fields = ('major', 'minor', 'build', 'patch')  # The items of the tuple but the ranges, including the ones of the type
+    _size = 4
+
+    major: int = _item(0)
+    minor: int = _item(1)
+    build: int = _item(2)
+    patch: int = _item(3)
+
+    def __new__(cls,
+                major: Union[int, tuple] = None,
+                minor: Union[int, tuple] = None,
+                build: Union[int, tuple] = None,
+                patch: Union[int, tuple] = None,
+                rng: random.Random = None):
+        parts, ranges = _resolved((major, minor, build, patch), rng)
+        return tuple.__new__(cls, (*parts, *ranges))
+
+    def _derive(self, parts: Union[tuple, list], *fields) -> 'Version':
+        """
+        A version of the same type without ranges, with the given parts, and the given fields of the type or these ones.
+        """
+        if not fields and type(self) is Version and None in parts:
+            parts = tuple(parts)
+            shared = _SHARED.get(parts)
+            if shared is None:
+                if len(_SHARED) >= _MAX_SHARED:
+                    _SHARED.clear()
+                shared = _SHARED[parts] = tuple.__new__(Version, (*parts, None))
+            return shared
+        return tuple.__new__(type(self), (*parts, *(fields or self[4:self._size])))
+
+    def __reduce__(self):
+        return _restore, (type(self), tuple(self))
+
+    @property
+    def _parts(self) -> tuple:
+        return self[:4]
+
+    @property
+    def _key(self) -> tuple:
+        # We use it for comparison. See: https://docs.python.org/3/reference/expressions.html#comparisons
+        key = self[:4]
+        return key if None not in key else tuple([part or 0 for part in key])
+
+    @property
+    def ranges(self) -> Union[tuple, None]:
+        """
+        The parts as given, if any of them is a range.
+        """
+        return self[-1] if len(self) > self._size else None
+
+    def spec(self) -> tuple:
+        ranges = self[-1] if len(self) > self._size else None
+        return self[:4] if ranges is None else ranges
+
+    def sample(self, rng: random.Random) -> 'Version':
+        """
+        A version with the ranges resolved by the given generator.
+        Versions without any range are returned as they are.
+        """
+        parts = self._sampled_parts(rng)
+        return self if parts is None else self._derive(parts)
+
+    def _sampled_parts(self, rng: random.Random) -> Union[list, None]:
+        # The parts drawn from the ranges, without building a version, or None if the version has no range
+        ranges = self[-1] if len(self) > self._size else None
+        return None if ranges is None else _resolve(ranges, rng)
+
+    def expand(self) -> Iterator['Version']:
+        """
+        Every version that sample() may return, in the order of the ranges.
+        """
+        ranges = self.ranges
+        if ranges is None:
+            yield self
+            return
+
+        for parts in itertools.product(*(range(*part) if isinstance(part, tuple) else (part,) for part in ranges)):
+            yield self._derive(parts)
+
+    def bounds(self) -> Tuple[tuple, tuple]:
+        """
+        The lowest and the highest version that may be sampled, as comparison tuples.
+        """
+        lowest = tuple((part[0] if isinstance(part, tuple) else part) or 0 for part in self.spec())
+        highest = tuple((part[1] - 1 if isinstance(part, tuple) else part) or 0 for part in self.spec())
+        return lowest, highest
 
     def format(self, partitions=None, separator='.', trim_zero=False) -> str:
-        versions = [self.major, self.minor, self.build, self.patch]
-
+        if len(self) == self._size:
+            return self.__format(partitions, separator, trim_zero)  # Sampled, formatted once or twice
+
+        key = (*self[:4], partitions, separator, trim_zero)
+        text = _FORMATS.get(key)
+        if text is None:
+            text = self.__format(partitions, separator, trim_zero)
+            if len(_FORMATS) >= _MAX_FORMATS:
+                _FORMATS.clear()
+            _FORMATS[key] = text
+        return text
+
+    def __format(self, partitions, separator: str, trim_zero: bool) -> str:
+        parts = self[:4]
         if partitions is not None:
-            versions = versions[:partitions]
+            parts = parts[:partitions]
         else:
             # Stop at None
-            while versions and versions[-1] is None:
-                versions.pop()
+            end = len(parts)
+            while end and parts[end - 1] is None:
+                end -= 1
+            parts = parts[:end]
 
         # None to zero
-        versions = list(part or 0 for part in versions)
+        versions = [part or 0 for part in parts]
 
         if trim_zero:
             while versions[-1] == 0:
                 versions.pop()
 
-        return separator.join(str(part) for part in versions)
+        return separator.join(map(str, versions))
 
-    def __str__(self):
-        return self.format()
+    __str__ = format  # Without a call of format() in between
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={value!r}' for name, value in zip(self._fields, self))
+        ranges = self.ranges
+        return f"{type(self).__name__}({fields}{'' if ranges is None else f', ranges={ranges!r}'})"
 
-    # We use it for comparison. See: https://docs.python.org/3/reference/expressions.html#comparisons
     def to_tuple(self) -> tuple:
-        if self.__tuple is not None:
-            return self.__tuple
+        return self._key
 
-        self.__tuple = tuple(part or 0 for part in [self.major, self.minor, self.build, self.patch])
-        return self.__tuple
+    def __hash__(self):
+        return hash(self._key)
 
     def __eq__(self, other):
-        return self.to_tuple() == other.to_tuple()
+        # Never equal to a plain tuple, which would otherwise compare the items
+        return isinstance(other, Version) and self._key == other._key
 
     def __ne__(self, other):
-        return self.to_tuple() != other.to_tuple()
+        return not isinstance(other, Version) or self._key != other._key
 
     def __lt__(self, other):
-        return self.to_tuple() < other.to_tuple()
+        return self._key < other._key
 
     def __gt__(self, other):
-        return self.to_tuple() > other.to_tuple()
+        return self._key > other._key
 
     def __le__(self, other):
-        return self.to_tuple() <= other.to_tuple()
+        return self._key <= other._key
 
     def __ge__(self, other):
-        return self.to_tuple() >= other.to_tuple()
+        return self._key >= other._key
+
+
+def _resolved(parts: tuple, rng: Union[random.Random, None]) -> Tuple[tuple, tuple]:
+    # The parts with their ranges resolved, and what ends the version: the parts as given if any is a range, or None
+    if any(isinstance(part, tuple) for part in parts):
+        return _resolve(parts, rng if rng is not None else random), (parts,)
+    return parts, (None,)
+
+
+def _restore(cls: type, items: tuple) -> Version:
+    return tuple.__new__(cls, items)
+
+
+def _sample_nested(version: Version, rng: random.Random) -> Version:
+    # A version with a nested one (webkit, ch_platform) built once, the parts drawn first then the nested version
+    parts = version._sampled_parts(rng)
+    nested = version[4]
+    sampled = nested.sample(rng)
+    if parts is None and sampled is nested:
+        return version
+    return version._derive(version[:4] if parts is None else parts, sampled)
 
 
 class ChromiumVersion(Version):
-    webkit: Version = None
+    __slots__ = ()
+    _fields = Version._fields + ('webkit',)
+    _size = 5
 
-    def __init__(self, version: Version, webkit: Version = Version(major=537, minor=36)):
-        super().__init__(version.major, version.minor, version.build, version.patch)
-        self.webkit = webkit
+    webkit: Version = _item(4)
 
+    def __new__(cls, version: Version, webkit: Version = Version(major=537, minor=36)):
+        parts, ranges = _resolved(version.spec(), None)
+        return tuple.__new__(cls, (*parts, webkit, *ranges))
 
-class AndroidVersion(Version):
-    build_number: str = None
-    platform_model: str = None
+    def sample(self, rng: random.Random) -> 'ChromiumVersion':
+        return _sample_nested(self, rng)
 
-    def __init__(self, version: Version, build_numbers: Union[str, tuple, list, None] = None):
-        super().__init__(version.major, version.minor, version.build, version.patch)
-        self.build_number = utils.choice(build_numbers)
+    def expand(self) -> Iterator['ChromiumVersion']:
+        for version in super().expand():
+            for webkit in self.webkit.expand():
+                yield version if webkit is self.webkit else version._derive(version[:4], webkit)
+
+
+class AndroidVersion(Version):
+    __slots__ = ()
+    _fields = Version._fields + ('build_numbers', 'build_number', 'platform_model')
+    _size = 7
+
+    build_numbers: Union[str, tuple, list, None] = _item(
+        4, 'Templates of the build number, with "{d}" (date) and "{v}" placeholders')
+    build_number: Union[str, None] = _item(5)
+    platform_model: Union[str, None] = _item(6)
+
+    def __new__(cls, version: Version, build_numbers: Union[str, tuple, list, None] = None, rng: random.Random = None):
+        parts, ranges = _resolved(version.spec(), rng)
+        return tuple.__new__(cls, (*parts, build_numbers, utils.choice(build_numbers, rng), None, *ranges))
+
+    def sample(self, rng: random.Random, years: Tuple[int, int] = (17, 25),
+               platform_models: Union[tuple, list, None] = None) -> 'AndroidVersion':
+        """
+        A new version with a build number from the templates, its placeholders filled in, and a platform model.
+        """
+        parts = self._sampled_parts(rng)
+
+        build_number = utils.choice(self.build_numbers, rng)
+        if build_number is not None:
+            date = (rng.randint(*years), rng.randint(0, 12), rng.randint(0, 29)) if '{d}' in build_number else None
+            number = rng.randint(1, 255) if '{v}' in build_number else None
+            build_number = self.fill(build_number, date, number)
+
+        return self._derive(self[:4] if parts is None else parts, self.build_numbers, build_number,
+                            utils.choice(platform_models, rng))
+
+    @staticmethod
+    def fill(build_number: str, date: Union[Tuple[int, int, int], None], number: Union[int, None]) -> str:
+        """
+        The build number with its "{d}" placeholder replaced by the date (year, month, day), and "{v}" by the number.
+        """
+        if date is not None:
+            build_number = build_number.replace('{d}', '{:02d}{:02d}{:02d}'.format(*date))
+        if number is not None:
+            build_number = build_number.replace('{v}', '{}'.format(number))
+        return build_number
 
 
 class WindowsVersion(Version):
-    ch_platform: Version = None
+    __slots__ = ()
+    _fields = Version._fields + ('ch_platform',)
+    _size = 5
+
+    ch_platform: Version = _item(4)
+
+    def __new__(cls, version: Version, ch_platform: Version):
+        parts, ranges = _resolved(version.spec(), None)
+        return tuple.__new__(cls, (*parts, ch_platform, *ranges))
+
+    def sample(self, rng: random.Random) -> 'WindowsVersion':
+        return _sample_nested(self, rng)
 
-    def __init__(self, version: Version, ch_platform: Version):
-        super().__init__(version.major, version.minor, version.build, version.patch)
-        self.ch_platform = ch_platform
+    def expand(self) -> Iterator['WindowsVersion']:
+        for version in super().expand():
+            for ch_platform in self.ch_platform.expand():
+                yield version if ch_platform is self.ch_platform else version._derive(version[:4], ch_platform)
 
 
 VERSION_TYPES = (
@@ -111,6 +304,10 @@ VERSION_TYPES = (
 
 
 class VersionRange:
+    """
+    A range of versions, compared in full precision.
+    Missing parts of the maximum version match any value, so VersionRange(125, 127) includes every 127.x.y.z version.
+    """
     min_version: Version = None
     max_version: Version = None
 
@@ -118,16 +315,29 @@ class VersionRange:
         self.min_version = Version(major=min_version) if type(min_version) is int else min_version
         self.max_version = Version(major=max_version) if type(max_version) is int else max_version
 
+    def keys(self) -> Union[Tuple[tuple, tuple], None]:
+        """
+        The lowest and the highest comparison tuples in the range, or None if the range has no bounds.
+        """
+        if self.min_version is None and self.max_version is None:
+            return None
+
+        lowest = self.min_version.to_tuple() if self.min_version is not None else ()
+        highest = (_INFINITY,)
+        if self.max_version is not None:
+            highest = tuple(_INFINITY if part is None else part for part in self.max_version._parts)
+        return lowest, highest
+
     def filter(self, versions: List[Version]) -> List[Version]:
-        tmp_versions: List[Version] = []
+        keys = self.keys()
+        if keys is None:
+            return []
 
-        # TODO: Perhaps support for full version comparison, instead of just major versions
+        lowest, highest = keys
+        tmp_versions: List[Version] = []
         for version in versions:
-            if self.min_version is not None and self.max_version is not None and self.min_version.major <= version.major <= self.max_version.major:
-                tmp_versions.append(version)
-            elif self.min_version is not None and self.max_version is None and self.min_version.major <= version.major:
-                tmp_versions.append(version)
-            elif self.min_version is None and self.max_version is not None and version.major <= self.max_version.major:
+            version_lowest, version_highest = version.bounds()
+            if lowest <= version_lowest and version_highest <= highest:
                 tmp_versions.append(version)
 
         return tmp_versions
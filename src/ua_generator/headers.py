@@ -3,28 +3,58 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
+import functools
+import types
+from typing import List, Mapping, Tuple
+
 from .client_hints import ClientHints
-from .data import BROWSERS_SUPPORT_CH
 from .data.generator import Generator
 
+# Client hint headers -> attributes of ClientHints
+CLIENT_HINTS = {
+    'sec-ch-ua': 'brands',
+    'sec-ch-ua-full-version-list': 'brands_full_version_list',
+    'sec-ch-ua-platform': 'platform',
+    'sec-ch-ua-platform-version': 'platform_version',
+    'sec-ch-ua-mobile': 'mobile',
+    'sec-ch-ua-bitness': 'bitness',
+    'sec-ch-ua-arch': 'architecture',
+    'sec-ch-ua-model': 'model',
+    'sec-ch-ua-wow64': 'wow64',
+}
+
+
+@functools.lru_cache(maxsize=256)
+def accepted_hints(val: str) -> Tuple[str, ...]:
+    """
+    The client hint headers requested by a value of the Accept-CH header, lowercased, in order and without duplicates.
+    Servers send the same few values over and over, so they are parsed once.
+    """
+    hints = (hint.strip().lower() for hint in val.split(','))
+    return tuple(dict.fromkeys(hint for hint in hints if hint in CLIENT_HINTS))
+
 
 # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Accept-CH
 class Headers:
+    max_accepted = 32  # Header sets to keep, by requested hints
 
     def __init__(self, gen: Generator, ch: ClientHints):
         self.__generator = gen
         self.__client_hints = ch
         self.__is_generated = False
         self.__headers: dict[str, str] = {}
+        self.__encoded: dict = {}  # Encodings of the current headers, by name. Cleared when they may change.
+        self.__accepted: dict = {}  # Requested hints -> a private copy of their headers
 
     def reset(self):
         self.__is_generated = True
         self.__headers = {
             'user-agent': self.__generator.user_agent,
         }
+        self.__encoded = {}
 
         # https://developer.mozilla.org/en-US/docs/Web/HTTP/Client_hints#low_entropy_hints
-        if self.__generator.browser in BROWSERS_SUPPORT_CH:
+        if self.__generator.browser_provider.supports_ch:
             self.add('sec-ch-ua')
             self.add('sec-ch-ua-mobile')
             self.add('sec-ch-ua-platform')
@@ -33,43 +63,86 @@ class Headers:
         if not self.__is_generated:
             self.reset()
 
-        if key == 'sec-ch-ua':
-            self.__headers[key] = self.__client_hints.brands
-        elif key == 'sec-ch-ua-full-version-list':
-            self.__headers[key] = self.__client_hints.brands_full_version_list
-        elif key == 'sec-ch-ua-platform':
-            self.__headers[key] = self.__client_hints.platform
-        elif key == 'sec-ch-ua-platform-version':
-            self.__headers[key] = self.__client_hints.platform_version
-        elif key == 'sec-ch-ua-mobile':
-            self.__headers[key] = self.__client_hints.mobile
-        elif key == 'sec-ch-ua-bitness':
-            self.__headers[key] = self.__client_hints.bitness
-        elif key == 'sec-ch-ua-arch':
-            self.__headers[key] = self.__client_hints.architecture
-        elif key == 'sec-ch-ua-model':
-            self.__headers[key] = self.__client_hints.model
-        elif key == 'sec-ch-ua-wow64':
-            self.__headers[key] = self.__client_hints.wow64
+        attribute = CLIENT_HINTS.get(key)
+        if attribute is not None:
+            self.__headers[key] = getattr(self.__client_hints, attribute)
+            self.__encoded = {}
 
     def accept_ch(self, val: str):
+        hints = accepted_hints(val)
+        accepted = self.__accepted.get(hints)
+        if accepted is not None:
+            # A copy, so that changes to the headers of get() are not kept for the next time
+            self.__headers = dict(accepted)
+            self.__encoded = {}
+            self.__is_generated = True
+            return
+
         self.reset()
+        if self.__generator.browser_provider.supports_ch:
+            for hint in hints:
+                self.add(hint)
 
-        if self.__generator.browser not in BROWSERS_SUPPORT_CH:
-            return
+        if len(self.__accepted) >= self.max_accepted:
+            self.__accepted.clear()
+        self.__accepted[hints] = dict(self.__headers)
 
-        requested_hints = val.split(',')
-        for hint in requested_hints:
-            self.add(hint.strip().lower())
+    def copy(self) -> 'Headers':
+        """
+        Headers of the same user-agent, as these ones are now, and which change independently of them.
+        """
+        headers = Headers.__new__(Headers)
+        headers.__generator = self.__generator
+        headers.__client_hints = self.__client_hints
+        headers.__is_generated = self.__is_generated
+        headers.__headers = dict(self.__headers)
+        headers.__encoded = dict(self.__encoded)  # The encodings are not changed, only replaced
+        headers.__accepted = dict(self.__accepted)  # Its header sets are copied on use already
+        return headers
 
     def get(self) -> dict[str, str]:
+        """
+        The headers, as a dict which may be changed: the encodings of frozen(), raw() and block() are then
+        computed again on their next call.
+        """
+        if self.__encoded:
+            self.__encoded = {}
+        return self.__current()
+
+    def __current(self) -> dict[str, str]:
         if not self.__is_generated:
             self.reset()
 
         return self.__headers
 
+    def frozen(self) -> Mapping[str, str]:
+        """
+        A read-only copy of the headers, which does not change with the headers and can be shared without copying.
+        """
+        return self.__encode('frozen', lambda headers: types.MappingProxyType(dict(headers)))
+
+    def raw(self) -> List[Tuple[bytes, bytes]]:
+        """
+        The headers as (name, value) byte pairs, for low-level HTTP clients. The list must not be modified.
+        """
+        return self.__encode('raw', lambda headers: [
+            (name.encode('latin-1'), value.encode('latin-1')) for name, value in headers.items()
+        ])
+
+    def block(self) -> bytes:
+        """
+        The headers as HTTP/1.1 header lines, each one ended by CRLF, without the empty line ending the header section.
+        """
+        return self.__encode('block', lambda headers: ''.join(
+            f'{name}: {value}\r\n' for name, value in headers.items()
+        ).encode('latin-1'))
+
+    def __encode(self, name: str, encode):
+        # Computed once, and reused until the headers change
+        encoded = self.__encoded.get(name)
+        if encoded is None:
+            encoded = self.__encoded[name] = encode(self.__current())
+        return encoded
+
     def __str__(self):
-        text = ""
-        for k, v in self.get().items():
-            text += f"{k}: {v}\n"
-        return text
+        return ''.join(f"{k}: {v}\n" for k, v in self.__current().items())
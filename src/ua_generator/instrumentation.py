@@ -0,0 +1,95 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import threading
+import time
+from typing import Callable, Dict, Union
+
+# Stages of a generation, timed in this order; the client hints are serialized on access
+RESOLVE = 'resolve'  # Drawing the (device, platform, browser) triple
+PLATFORM_VERSION = 'platform_version'
+BROWSER_VERSION = 'browser_version'
+RENDER = 'render'
+CLIENT_HINTS = 'client_hints'
+
+# Counters
+GENERATIONS = 'generations'
+FALLBACKS = 'fallbacks'  # Generations with the fallback browser, as none of the requested ones supports the platforms
+
+
+class Hook:
+    """
+    Receives the timings and the counters of the generations. Both methods do nothing by default.
+    A hook is set on the options, or installed for every generation; it is called by the generating thread.
+    """
+
+    def timing(self, stage: str, seconds: float):
+        pass
+
+    def count(self, counter: str, value: int = 1):
+        pass
+
+
+class Stats(Hook):
+    """
+    A hook which adds up the timings and the counters, per stage and per counter.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+
+    def timing(self, stage: str, seconds: float):
+        with self.__lock:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+            self.calls[stage] = self.calls.get(stage, 0) + 1
+
+    def count(self, counter: str, value: int = 1):
+        with self.__lock:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def merge(self, other: 'Stats'):
+        """
+        Adds up the timings and the counters of another one, e.g. of a worker process.
+        """
+        with self.__lock:
+            for stage, seconds in other.seconds.items():
+                self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+            for stage, calls in other.calls.items():
+                self.calls[stage] = self.calls.get(stage, 0) + calls
+            for counter, value in other.counters.items():
+                self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def __getstate__(self) -> dict:
+        # Sent between processes without its lock
+        return {'seconds': self.seconds, 'calls': self.calls, 'counters': self.counters}
+
+    def __setstate__(self, state: dict):
+        self.__init__()
+        self.__dict__.update(state)
+
+    def __repr__(self):
+        return f"Stats(seconds={self.seconds}, calls={self.calls}, counters={self.counters})"
+
+
+installed: Union[Hook, None] = None  # The hook of the generations whose options have none
+
+
+def install(hook: Union[Hook, None]):
+    global installed
+    installed = hook
+
+
+def uninstall():
+    install(None)
+
+
+def timed(hook: Hook, stage: str, function: Callable):
+    started = time.perf_counter()
+    result = function()
+    hook.timing(stage, time.perf_counter() - started)
+    return result
@@ -3,19 +3,36 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
+import random
 import typing
 
 from .data.version import VersionRange
+from .instrumentation import Hook
 
 
 class Options:
     weighted_versions: bool = False
     version_ranges: typing.Dict[str, VersionRange] = None
+    seed: typing.Union[int, float, str, bytes, None] = None
+    rng: random.Random = random  # The generator of every random choice, the global one of the "random" module by default
+    market_share: typing.Dict[str, float] = None  # Weights of devices, platforms and browsers by name, others weigh 1.0
+    hook: Hook = None  # Receives the timings and counters of the generations, instead of the installed hook
 
-    def __init__(self, weighted_versions: bool = False, version_ranges: typing.Dict[str, VersionRange] = None):
+    def __init__(self, weighted_versions: bool = False, version_ranges: typing.Dict[str, VersionRange] = None,
+                 seed: typing.Union[int, float, str, bytes, None] = None, rng: random.Random = None,
+                 market_share: typing.Dict[str, float] = None, hook: Hook = None):
         self.weighted_versions = weighted_versions
         if version_ranges is not None:
             self.version_ranges = version_ranges
+        if market_share is not None:
+            self.market_share = market_share
+        if hook is not None:
+            self.hook = hook
+        if rng is not None:
+            self.rng = rng
+        elif seed is not None:
+            self.seed = seed
+            self.rng = random.Random(seed)
 
     def __repr__(self):
-        return f"Options(weighted_versions={self.weighted_versions}, version_ranges={self.version_ranges})"
+        return f"Options(weighted_versions={self.weighted_versions}, version_ranges={self.version_ranges}, seed={self.seed}, market_share={self.market_share})"
@@ -0,0 +1,187 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import functools
+from typing import List, Sequence, Union, Tuple
+
+from . import exceptions, instrumentation
+from .data import DEVICES, T_DEVICES, T_PLATFORMS, T_BROWSERS, catalog, registry
+from .data.generator import Generator
+from .data.table import AliasTable
+from .options import Options
+
+
+def _candidates(value: Union[str, tuple, list, None], allowed, message: str) -> Union[str, tuple, None]:
+    if not value:
+        return None
+
+    candidates = (value,) if type(value) is str else tuple(value)
+    for candidate in candidates:
+        if candidate not in allowed:
+            raise exceptions.InvalidArgumentError(message.format(candidate))
+
+    return value if type(value) is str else candidates
+
+
+def _tuple(value: Union[str, tuple, None]) -> Union[tuple, None]:
+    return (value,) if type(value) is str else value
+
+
+class Combinations:
+    """
+    The valid (device, platform, browser) triples of the arguments, drawn at once with the alias method.
+    A platform weighs its share among the requested platforms, or among the platforms of its device,
+    and a browser weighs its share among the requested browsers that support the platform.
+    """
+    fallback_browser = 'chrome'  # Used when none of the requested browsers supports any of the platforms
+
+    def __init__(self, devices: Union[tuple, None], platforms: Union[tuple, None], browsers: Union[tuple, None],
+                 market_share: Tuple[Tuple[str, float], ...] = ()):
+        self.fallback = False
+        share = dict(market_share)
+        triples, weights = self.__build(devices, platforms, browsers, share)
+        if not triples and browsers is not None:
+            self.fallback = True
+            triples, weights = self.__build(devices, platforms, (self.fallback_browser,), share)
+        if not triples:
+            raise exceptions.CannotGenerateError(f'No valid combination of {devices}, {platforms} and {browsers}')
+
+        self.triples: Tuple[Tuple[str, str, str], ...] = tuple(triples)
+        self.weights: Tuple[float, ...] = tuple(weights)
+        self.__table = AliasTable(self.triples, self.weights)
+
+    @staticmethod
+    def __build(devices, platforms, browsers, share: dict):
+        weight = lambda name: float(share.get(name, 1.0))
+        browsers = browsers if browsers is not None else registry.browsers.names()
+
+        supported = {}
+        for platform in (platforms if platforms is not None else registry.platforms.names()):
+            names = [browser for browser in browsers if registry.browsers[browser].supports(platform)]
+            if sum(map(weight, names)) > 0:
+                supported[platform] = names
+
+        # The device type follows the platform if the platform is specified, so the platforms form a single group
+        if platforms is not None:
+            groups = {None: [platform for platform in platforms if platform in supported]}
+        else:
+            groups = {device: [platform for platform in registry.platforms.names(device) if platform in supported]
+                      for device in (devices if devices is not None else DEVICES)}
+        groups = {key: group for key, group in groups.items() if weight(key) > 0 and sum(map(weight, group)) > 0}
+        group_total = sum(map(weight, groups))
+
+        triples, weights = [], []
+        for key, group in groups.items():
+            platform_total = sum(map(weight, group))
+            for platform in group:
+                device = registry.platforms[platform].device
+                browser_total = sum(map(weight, supported[platform]))
+                for browser in supported[platform]:
+                    probability = (weight(key) / group_total * weight(platform) / platform_total *
+                                   weight(browser) / browser_total)
+                    if probability > 0:
+                        triples.append((device, platform, browser))
+                        weights.append(probability)
+
+        return triples, weights
+
+    def choice(self, rng) -> Tuple[str, str, str]:
+        return self.__table.choice(rng)
+
+    def __len__(self):
+        return len(self.triples)
+
+
+@functools.lru_cache(maxsize=128)
+def _combinations(devices, platforms, browsers, market_share, revisions) -> Combinations:
+    return Combinations(devices, platforms, browsers, market_share)
+
+
+def _pair(platform: str, browser: str) -> tuple:
+    browser_provider = registry.browsers[browser]
+    renderer = browser_provider.renderer(platform)
+    if renderer is None:
+        raise exceptions.CannotGenerateError(f'No template of {browser} for {platform}')
+    return registry.platforms[platform], browser_provider, renderer
+
+
+class Plan:
+    """
+    The arguments of a generation, validated once.
+    Every draw only picks a valid (device, platform, browser) triple, then samples and renders.
+    """
+
+    def __init__(self,
+                 device: Union[T_DEVICES, tuple, list, None] = None,
+                 platform: Union[T_PLATFORMS, tuple, list, None] = None,
+                 browser: Union[T_BROWSERS, tuple, list, None] = None,
+                 options: Union[Options, None] = None):
+        self.device = _candidates(device, DEVICES, 'No such device type found: {}')
+        self.platform = _candidates(platform, registry.platforms, 'No such platform found: {}')
+        self.browser = _candidates(browser, registry.browsers, 'No such browser found: {}')
+        self.options: Options = options if options else Options()
+        self.__combinations: Union[Combinations, None] = None
+        self.__space: Union[Sequence[str], None] = None
+
+    @property
+    def combinations(self) -> Combinations:
+        if self.__combinations is None:
+            market_share = self.options.market_share
+            self.__combinations = _combinations(_tuple(self.device), _tuple(self.platform), _tuple(self.browser),
+                                                tuple(sorted(market_share.items())) if market_share else (),
+                                                (registry.platforms.revision, registry.browsers.revision))
+        return self.__combinations
+
+    @property
+    def space(self) -> Sequence[str]:
+        """
+        Every distinct user-agent the plan may generate, indexed.
+        """
+        if self.__space is None:
+            from .data.space import Space  # Imported on use, like the catalogs
+            self.__space = Space(self)
+        return self.__space
+
+    def resolve(self) -> Tuple[str, str, str]:
+        return self.combinations.choice(self.options.rng)
+
+    def generate(self) -> Generator:
+        hook = self.options.hook or instrumentation.installed
+        if hook is None:
+            device, platform, browser = self.resolve()
+        else:
+            device, platform, browser = instrumentation.timed(hook, instrumentation.RESOLVE, self.resolve)
+            hook.count(instrumentation.GENERATIONS)
+            if self.combinations.fallback:
+                hook.count(instrumentation.FALLBACKS)
+        return Generator(device=device, platform=platform, browser=browser, options=self.options)
+
+    def user_agents(self, n: int) -> List[str]:
+        """
+        n user-agent strings, drawn as generate() draws them, with the same random calls.
+        Without a hook, no Generator is built: the providers and the renderer of a pair are looked up once.
+        """
+        if self.options.hook or instrumentation.installed:
+            return [self.generate().user_agent for _ in range(n)]
+
+        options = self.options
+        rng = options.rng
+        choice = self.combinations.choice
+        pairs = {}
+        texts = []
+        for _ in range(n):
+            triple = choice(rng)
+            pair = pairs.get(triple)
+            if pair is None:
+                pair = pairs[triple] = _pair(triple[1], triple[2])
+            platform_provider, browser_provider, renderer = pair
+            current = catalog.current  # Read once per user-agent, as a Generator does
+            platform_version = platform_provider.get_version(options, current)
+            browser_version = browser_provider.get_version(options, current)
+            texts.append(renderer.render(platform_provider, platform_version, browser_version, rng))
+        return texts
+
+    def __repr__(self):
+        return f"Plan(device={self.device!r}, platform={self.platform!r}, browser={self.browser!r}, options={self.options})"
@@ -0,0 +1,276 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import collections
+import threading
+import time
+import weakref
+from typing import AsyncIterator, Iterator, List, Union
+
+from . import data as _data
+from .options import Options
+from .plan import Plan
+from .user_agent import UserAgent
+
+
+def _generate(plan: Plan, records: bool) -> Union[UserAgent, str]:
+    if records:
+        ua = UserAgent.from_plan(plan)
+        ua.headers.get()
+        return ua
+    return plan.generate().user_agent
+
+
+def _generate_batch(plan: Plan, records: bool, count: int) -> List[Union[UserAgent, str]]:
+    batch = []
+    for _ in range(count):
+        batch.append(_generate(plan, records))
+        # Hands the interpreter lock to the event loop between user-agents, rather than after the switch interval
+        time.sleep(0)
+    return batch
+
+
+class UserAgentPool:
+    """
+    User-agents generated ahead of use, so that taking one costs a pop from a ring of slots.
+    The pool is built with a single batch in the ring, then its thread generates the rest,
+    and refills the ring, in batches, whenever fewer than "low_water" user-agents are left in it.
+    Each user-agent is served "reuse" times before its slot is refilled. When the ring is empty,
+    next() generates one itself rather than waiting for the thread.
+    The thread stops when the pool is closed, or collected.
+    """
+
+    def __init__(self,
+                 device: Union[_data.T_DEVICES, tuple, list, None] = None,
+                 platform: Union[_data.T_PLATFORMS, tuple, list, None] = None,
+                 browser: Union[_data.T_BROWSERS, tuple, list, None] = None,
+                 options: Union[Options, None] = None,
+                 size: int = 1024,
+                 batch: int = 64,
+                 low_water: Union[int, None] = None,
+                 reuse: int = 1,
+                 records: bool = True):
+        if size < 1 or batch < 1 or reuse < 1:
+            raise ValueError('The size, the batch and the reuse of a pool must be positive')
+
+        self.plan = Plan(device, platform, browser, options)
+        self.size = size
+        self.batch = min(batch, size)
+        self.low_water = size // 2 if low_water is None else min(low_water, size)
+        self.reuse = reuse
+        self.records = records  # UserAgent objects with their headers built, or strings
+        self.misses = 0  # User-agents generated by next(), as the ring was empty
+        self.__misses_lock = threading.Lock()  # "+=" is not atomic, and misses are rare enough to take a lock
+
+        # (user-agent, times it may still be served). A deque pops and appends at either end atomically,
+        # so neither the consumers nor the thread take a lock.
+        self.__slots = collections.deque()
+        self.__wake = threading.Event()
+        self.__closed = False
+        self.__fill(self.batch)
+
+        # The thread holds the pool only while filling it: a pool which is not closed is still collected,
+        # and then the thread stops
+        self.__thread = threading.Thread(target=self.__refill, args=(weakref.ref(self), self.__wake),
+                                         name='ua-generator-pool', daemon=True)
+        self.__thread.start()
+        weakref.finalize(self, self.__wake.set)
+        if len(self.__slots) < self.size:
+            self.__wake.set()
+
+    def __generate(self) -> Union[UserAgent, str]:
+        return _generate(self.plan, self.records)
+
+    def __fill(self, size: int):
+        slots = self.__slots
+        while not self.__closed and len(slots) < size:
+            count = min(self.batch, size - len(slots))
+            slots.extend([(self.__generate(), self.reuse) for _ in range(count)])
+
+    @staticmethod
+    def __refill(reference: weakref.ref, wake: threading.Event):
+        while True:
+            wake.wait()
+            wake.clear()
+            pool = reference()
+            if pool is None or pool.__closed:
+                return
+            pool.__fill(pool.size)
+            del pool
+
+    def next(self) -> Union[UserAgent, str]:
+        slots = self.__slots
+        try:
+            ua, uses = slots.popleft()
+        except IndexError:
+            with self.__misses_lock:
+                self.misses += 1
+            self.__wake.set()
+            return self.__generate()
+
+        if uses > 1:
+            slots.append((ua, uses - 1))
+        if len(slots) < self.low_water:
+            self.__wake.set()
+        return ua
+
+    def __next__(self) -> Union[UserAgent, str]:
+        return self.next()
+
+    def __iter__(self) -> Iterator[Union[UserAgent, str]]:
+        return self
+
+    def __len__(self) -> int:
+        """
+        The number of user-agents in the ring.
+        """
+        return len(self.__slots)
+
+    def close(self):
+        """
+        Stops the thread. The user-agents left in the ring can still be taken.
+        """
+        self.__closed = True
+        self.__wake.set()
+        self.__thread.join()
+
+    def __enter__(self) -> 'UserAgentPool':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f"UserAgentPool(size={self.size}, batch={self.batch}, low_water={self.low_water}, " \
+               f"reuse={self.reuse}, available={len(self.__slots)})"
+
+
+class AsyncUserAgentPool:
+    """
+    User-agents generated ahead of use for asyncio: "await pool.get()", or "async for ua in pool".
+    The batches are generated in an executor, the default one of the loop if none is given, so the event loop
+    only takes user-agents from the pool. At most one batch is generated at a time, and at most "size" user-agents
+    are kept: when the consumers are faster than the generation, they wait for the next batch without blocking the loop.
+    The pool must be used from a single event loop.
+    """
+
+    def __init__(self,
+                 device: Union[_data.T_DEVICES, tuple, list, None] = None,
+                 platform: Union[_data.T_PLATFORMS, tuple, list, None] = None,
+                 browser: Union[_data.T_BROWSERS, tuple, list, None] = None,
+                 options: Union[Options, None] = None,
+                 size: int = 1024,
+                 batch: int = 64,
+                 low_water: Union[int, None] = None,
+                 records: bool = True,
+                 executor=None):
+        if size < 1 or batch < 1:
+            raise ValueError('The size and the batch of a pool must be positive')
+
+        self.plan = Plan(device, platform, browser, options)
+        self.size = size
+        self.batch = min(batch, size)
+        self.low_water = size // 2 if low_water is None else min(low_water, size)
+        self.records = records  # UserAgent objects with their headers built, or strings
+        self.executor = executor  # Of threads: the batches share the generator of the options
+
+        self.__items = collections.deque()
+        self.__waiters = collections.deque()  # Futures of the consumers waiting for a user-agent, in order
+        self.__batch = None  # Future of the batch being generated
+        self.__closed = False
+
+    async def get(self) -> Union[UserAgent, str]:
+        items = self.__items
+        if items and not self.__waiters:
+            ua = items.popleft()
+            if len(items) < self.low_water:
+                self.__schedule()
+            return ua
+
+        if self.__closed:
+            raise RuntimeError('The pool is closed')
+
+        import asyncio  # Imported on use, it weighs more than the package itself
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.__waiters.append(waiter)
+        self.__schedule()
+        return await waiter
+
+    def __schedule(self):
+        if self.__batch is not None or self.__closed or len(self.__items) >= self.size:
+            return
+
+        import asyncio
+
+        count = min(self.batch, self.size - len(self.__items))
+        self.__batch = asyncio.get_running_loop().run_in_executor(
+            self.executor, _generate_batch, self.plan, self.records, count)
+        self.__batch.add_done_callback(self.__generated)
+
+    def __generated(self, batch):
+        # Called by the event loop, so nothing else uses the pool meanwhile
+        self.__batch = None
+        if batch.cancelled():
+            return
+
+        error = batch.exception()
+        if error is not None:
+            while self.__waiters:
+                waiter = self.__waiters.popleft()
+                if not waiter.done():
+                    waiter.set_exception(error)
+            return
+
+        items = self.__items
+        items.extend(batch.result())
+        while items and self.__waiters:
+            waiter = self.__waiters.popleft()
+            if not waiter.done():  # Unless its consumer was cancelled
+                waiter.set_result(items.popleft())
+
+        # Filled up to the size, once below the low-water mark
+        if len(items) < self.size or self.__waiters:
+            self.__schedule()
+
+    def __aiter__(self) -> AsyncIterator[Union[UserAgent, str]]:
+        return self
+
+    async def __anext__(self) -> Union[UserAgent, str]:
+        if self.__closed and not self.__items:
+            raise StopAsyncIteration
+        return await self.get()
+
+    def __len__(self) -> int:
+        """
+        The number of user-agents ready to be taken.
+        """
+        return len(self.__items)
+
+    async def aclose(self):
+        """
+        Waits for the batch being generated, if any, and cancels the consumers still waiting.
+        The user-agents left in the pool can still be taken.
+        """
+        self.__closed = True
+        batch = self.__batch
+        if batch is not None:
+            try:
+                await batch
+            except Exception:
+                pass
+        while self.__waiters:
+            self.__waiters.popleft().cancel()
+
+    async def __aenter__(self) -> 'AsyncUserAgentPool':
+        self.__schedule()  # Starts filling the pool before the first user-agent is taken
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    def __repr__(self):
+        return f"AsyncUserAgentPool(size={self.size}, batch={self.batch}, low_water={self.low_water}, " \
+               f"available={len(self.__items)})"
@@ -5,12 +5,12 @@ License: Apache License 2.0
 """
 from typing import Union
 
-from . import utils, exceptions
 from .client_hints import ClientHints
-from .data import DEVICES, BROWSERS, PLATFORMS, PLATFORMS_DESKTOP, PLATFORMS_MOBILE, T_DEVICES, T_PLATFORMS, T_BROWSERS
+from .data import T_DEVICES, T_PLATFORMS, T_BROWSERS
 from .data.generator import Generator
 from .headers import Headers
 from .options import Options
+from .plan import Plan
 
 
 class UserAgent:
@@ -19,78 +19,72 @@ class UserAgent:
                  platform: Union[T_PLATFORMS, tuple, list, None] = None,
                  browser: Union[T_BROWSERS, tuple, list, None] = None,
                  options: Union[Options, None] = None):
-
-        self.device: Union[str, None] = utils.choice(device) if device else None
-        self.platform: Union[str, None] = utils.choice(platform) if platform else None
-        self.browser: Union[str, None] = utils.choice(browser) if browser else None
-        self.options: Options = options if options else Options()
-        self.__complete()
+        self.__complete(Plan(device, platform, browser, options).generate())
 
         # Type hinting only
+        self.device: str
+        self.platform: str
+        self.browser: str
+        self.options: Options
         self.text: str
-        self.ch: ClientHints
-        self.headers: Headers
         self.generator: Generator
 
-    def __find_device(self) -> str:
-        if self.device is not None and self.device not in DEVICES:
-            raise exceptions.InvalidArgumentError('No such device type found: {}'.format(self.device))
-
-        # Override the device type, if the platform is specified
-        if self.platform is not None:
-            if self.platform in PLATFORMS_DESKTOP:
-                self.device = 'desktop'
-            elif self.platform in PLATFORMS_MOBILE:
-                self.device = 'mobile'
-
-        if self.device is None:
-            self.device = utils.choice(DEVICES)
-
-        return self.device
-
-    def __find_platform(self) -> str:
-        if self.platform is not None and self.platform not in PLATFORMS:
-            raise exceptions.InvalidArgumentError('No such platform found: {}'.format(self.platform))
-
-        # Make the platform consistent with the device type and browser
-        if self.device == 'desktop' and self.platform not in PLATFORMS_DESKTOP:
-            # Safari only supports the macOS and iOS platforms
-            if self.browser is not None and self.browser == 'safari':
-                self.platform = utils.choice(('macos', 'ios'))
-            else:
-                self.platform = utils.choice(PLATFORMS_DESKTOP)
-        elif self.device == 'mobile' and self.platform not in PLATFORMS_MOBILE:
-            self.platform = utils.choice(PLATFORMS_MOBILE)
-
-        if self.platform is None:
-            self.platform = utils.choice(PLATFORMS)
-
-        return self.platform
-
-    def __find_browser(self) -> str:
-        if self.browser is not None and self.browser not in BROWSERS:
-            raise exceptions.InvalidArgumentError('No such browser found: {}'.format(self.browser))
-
-        if self.browser is None:
-            self.browser = utils.choice(BROWSERS)
-
-        # Safari only supports the macOS and iOS platforms
-        if self.browser == 'safari' and self.platform not in ('macos', 'ios'):
-            self.browser = 'chrome'
-
-        return self.browser
-
-    def __complete(self):
-        self.device = self.__find_device()
-        self.platform = self.__find_platform()
-        self.browser = self.__find_browser()
-
-        ua = Generator(device=self.device, platform=self.platform, browser=self.browser, options=self.options)
+    @classmethod
+    def from_plan(cls, plan: Plan) -> 'UserAgent':
+        """
+        A user-agent drawn from a plan, without validating the arguments again.
+        """
+        ua = cls.__new__(cls)
+        ua.__complete(plan.generate())
+        return ua
+
+    @classmethod
+    def from_generator(cls, generator: Generator, ch: Union[ClientHints, None] = None,
+                       headers: Union[Headers, None] = None) -> 'UserAgent':
+        """
+        A user-agent of the versions and the text of a generator, e.g. a parsed one.
+        Its client hints may be given, and headers of the same generator, which are copied on first access.
+        """
+        ua = cls.__new__(cls)
+        ua.__complete(generator)
+        ua.__ch = ch
+        ua.__headers_source = headers
+        return ua
+
+    def __complete(self, ua: Generator):
+        self.device = ua.device
+        self.platform = ua.platform
+        self.browser = ua.browser
+        self.options = ua.options
         self.text = ua.user_agent
-        self.ch = ClientHints(ua)
-        self.headers = Headers(ua, self.ch)
         self.generator = ua
 
+        self.__ch = None
+        self.__headers = None
+        self.__headers_source = None
+
+    # The client hints and headers are built on first access, most callers only read the text
+    @property
+    def ch(self) -> ClientHints:
+        if self.__ch is None:
+            self.__ch = ClientHints(self.generator)
+        return self.__ch
+
+    @ch.setter
+    def ch(self, value: ClientHints):
+        self.__ch = value
+
+    @property
+    def headers(self) -> Headers:
+        if self.__headers is None:
+            source = self.__headers_source
+            self.__headers = Headers(self.generator, self.ch) if source is None else source.copy()
+        return self.__headers
+
+    @headers.setter
+    def headers(self, value: Headers):
+        self.__headers = value
+
     def __str__(self):
         return self.text
 
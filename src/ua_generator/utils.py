@@ -7,10 +7,10 @@ import random
 from typing import Union
 
 
-def choice(t: Union[str, tuple, list, None]) -> Union[str, None]:
+def choice(t: Union[str, tuple, list, None], rng: random.Random = None) -> Union[str, None]:
     if type(t) is str:
         return t
     if type(t) is tuple or type(t) is list:
-        return random.choice(t)
+        return (rng if rng is not None else random).choice(t)
 
     return None
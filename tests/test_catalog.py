@@ -0,0 +1,209 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import src.ua_generator as ua_generator
+from src.ua_generator import exceptions, instrumentation
+from src.ua_generator.data import catalog, registry
+from src.ua_generator.data.version import Version, ChromiumVersion, VersionRange
+from src.ua_generator.options import Options
+
+
+class TestCatalog(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'catalog.bin')
+
+    def tearDown(self):
+        catalog.install(None)
+        self.directory.cleanup()
+
+    def assertSameCatalog(self, loaded: catalog.Catalog, expected_catalog: catalog.Catalog):
+        self.assertEqual(loaded.names(), expected_catalog.names())
+        for name in expected_catalog.names():
+            expected, entry = expected_catalog.get(name), loaded.get(name)
+            self.assertEqual(entry.table.weights, expected.table.weights)
+            self.assertEqual(entry.ranged, expected.ranged)
+            self.assertEqual(entry.platform_models, expected.platform_models)
+            self.assertEqual(entry.years, expected.years)
+            self.assertEqual(len(entry.versions), len(expected.versions))
+            for version, expected_version in zip(entry.versions, expected.versions):
+                self.assertIs(type(version), type(expected_version))
+                self.assertEqual(version.spec(), expected_version.spec())
+                for nested in ('webkit', 'ch_platform'):
+                    if hasattr(expected_version, nested):
+                        self.assertEqual(getattr(version, nested).spec(), getattr(expected_version, nested).spec())
+                if hasattr(expected_version, 'build_numbers'):
+                    self.assertEqual(version.build_numbers, expected_version.build_numbers)
+
+    def test_dump_load(self):
+        modules = catalog.Catalog.from_modules()
+        catalog.dump(self.path, modules)
+        loaded = catalog.load(self.path)
+        self.assertSameCatalog(loaded, modules)
+        for name in loaded.names():
+            self.assertIs(loaded.get(name), loaded.get(name))
+        loaded.close()
+
+    def test_same_generation(self):
+        options = lambda: Options(seed=1234, weighted_versions=True,
+                                  version_ranges={'chrome': VersionRange(120, 125), 'windows': VersionRange(10)})
+        expected = ua_generator.generate_many(2000, options=options())
+
+        catalog.dump(self.path)
+        catalog.install(catalog.load(self.path))
+        self.assertEqual(ua_generator.generate_many(2000, options=options()), expected)
+        self.assertIsNotNone(ua_generator.parse(expected[0]))
+
+        catalog.install(None)
+        self.assertEqual(ua_generator.generate_many(2000, options=options()), expected)
+
+    def test_custom_entry(self):
+        entries = {'chrome': catalog.Entry('chrome', [ChromiumVersion(Version(major=200, minor=0, build=1, patch=2))])}
+        catalog.install(catalog.Catalog(entries))
+        for text in ua_generator.generate_many(50, platform='linux', browser='chrome'):
+            self.assertIn('Chrome/200.0.1.2 ', text)
+        self.assertEqual(ua_generator.cardinality(platform='linux', browser='chrome'), 2)
+
+        # The other names are provided by their modules
+        self.assertIn('Firefox/', ua_generator.generate(platform='linux', browser='firefox').text)
+
+        catalog.install(None)
+        self.assertGreater(ua_generator.cardinality(platform='linux', browser='chrome'), 2)
+
+    def test_source(self):
+        # Resolved once per installed catalog
+        chrome = registry.browsers['chrome']
+        entries = {'chrome': catalog.Entry('chrome', [ChromiumVersion(Version(major=200, minor=0, build=1, patch=2))])}
+        self.assertIs(chrome.source(), chrome.load())
+        catalog.install(catalog.Catalog(entries))
+        self.assertIs(chrome.source(), entries['chrome'])
+        self.assertIs(registry.browsers['firefox'].source(), registry.browsers['firefox'].load())
+        catalog.install(catalog.Catalog(dict(entries, chrome=catalog.Entry('chrome', entries['chrome'].versions))))
+        self.assertIsNot(chrome.source(), entries['chrome'])
+        catalog.install(None)
+        self.assertIs(chrome.source(), chrome.load())
+
+    def test_one_catalog_per_generation(self):
+        chrome = lambda major: catalog.Catalog({'chrome': catalog.Entry('chrome', [
+            ChromiumVersion(Version(major=major, minor=0, build=1, patch=2))])})
+
+        class Swap(instrumentation.Hook):
+            # Installs another catalog between the platform version and the browser version
+            def timing(self, stage: str, seconds: float):
+                if stage == instrumentation.PLATFORM_VERSION:
+                    catalog.install(chrome(300))
+
+        catalog.install(chrome(200))
+        ua = ua_generator.generate(platform='linux', browser='chrome', options=Options(hook=Swap()))
+        self.assertIn('Chrome/200.0.1.2 ', ua.text)
+        self.assertIn('Chrome/300.0.1.2 ', ua_generator.generate(platform='linux', browser='chrome').text)
+
+    def test_not_a_catalog(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a catalog file, but long enough')
+        self.assertRaises(ValueError, catalog.load, self.path)
+
+        # Truncated, e.g. while being replaced
+        catalog.dump(self.path)
+        with open(self.path, 'rb') as file:
+            content = file.read()
+        for size in (0, 10, 24, 100, len(content) - 5, len(content) - 1):
+            with open(self.path, 'wb') as file:
+                file.write(content[:size])
+            self.assertRaises(ValueError, catalog.load, self.path)
+        with open(self.path, 'wb') as file:
+            file.write(content + b'\0')
+        self.assertRaises(ValueError, catalog.load, self.path)
+
+    def test_dict_round_trip(self):
+        modules = catalog.Catalog.from_modules()
+        data = json.loads(json.dumps(modules.to_dict()))
+        loaded = catalog.Catalog.from_dict(data)
+        self.assertSameCatalog(loaded, modules)
+
+        options = lambda: Options(seed=1234, weighted_versions=True, version_ranges={'chrome': VersionRange(120, 125)})
+        expected = ua_generator.generate_many(1000, options=options())
+        catalog.install(loaded)
+        self.assertEqual(ua_generator.generate_many(1000, options=options()), expected)
+
+    def test_reload(self):
+        data = {'chrome': {'versions': [{'version': [200, 0, [1, 10], 2], 'webkit': [537, 36, None, None]}]}}
+        reloaded = catalog.reload(data)
+        self.assertIs(catalog.installed, reloaded)
+        self.assertIn('Chrome/200.0.', ua_generator.generate(platform='linux', browser='chrome').text)
+
+        json_path = os.path.join(self.directory.name, 'catalog.json')
+        with open(json_path, 'w') as file:
+            json.dump({'firefox': {'versions': [{'version': [300, 0, None, None]}]}}, file)
+        catalog.reload(json_path)
+        self.assertIsNone(catalog.entry('chrome'))
+        self.assertIn('Firefox/300.0', ua_generator.generate(platform='linux', browser='firefox').text)
+
+        catalog.dump(self.path)
+        self.assertIsInstance(catalog.reload(self.path), catalog.BinaryCatalog)
+        self.assertEqual(catalog.installed.names(), catalog.Catalog.from_modules().names())
+
+    def test_reload_invalid(self):
+        reloaded = catalog.reload({'chrome': {'versions': [{'version': [200, 0, 1, 2], 'webkit': [537, 36, None, None]}]}})
+        chrome = {'version': [201, 0, 1, 2], 'webkit': [537, 36, None, None]}
+        for data in (
+                {'chrome': {'versions': []}},
+                {'chrome': {'versions': [chrome], 'weights': [1.0, 2.0]}},
+                {'chrome': {'versions': [{'version': [201, 0, 1, 2]}]}},  # Without its WebKit version
+                {'chrome': {'versions': [chrome]}, 'netscape': {'versions': [{'version': [4, 0, None, None]}]}},
+        ):
+            self.assertRaises(exceptions.InvalidArgumentError, catalog.reload, data)
+            # The previous catalog is kept
+            self.assertIs(catalog.installed, reloaded)
+            self.assertIn('Chrome/200.0.1.2 ', ua_generator.generate(platform='linux', browser='chrome').text)
+
+    def test_prepared(self):
+        # A prepared binary catalog has decoded every entry, so it still serves them once the file is closed
+        catalog.dump(self.path)
+        loaded = catalog.load(self.path).prepare()
+        loaded.close()
+        catalog.install(loaded)
+        for _ in range(200):
+            self.assertTrue(ua_generator.generate().text)
+
+    def test_concurrent_reload(self):
+        catalogs = [catalog.Catalog({'chrome': catalog.Entry('chrome', [
+            ChromiumVersion(Version(major=major, minor=0, build=(1, 100), patch=0)) for major in range(start, start + 3)
+        ], weights=(2.0, 3.0))}).prepare() for start in (200, 300)]
+        majors = {str(major) for major in (200, 201, 202, 300, 301, 302)}
+        errors = []
+        stop = threading.Event()
+
+        def generate():
+            options = Options(weighted_versions=True, version_ranges={'chrome': VersionRange(201, 301)})
+            while not stop.is_set():
+                try:
+                    text = ua_generator.generate(platform='linux', browser='chrome', options=options).text
+                    major = text.split('Chrome/')[1].split('.')[0]
+                    if major not in majors:
+                        errors.append(text)
+                except Exception as e:
+                    errors.append(e)
+
+        catalog.reload(catalogs[1])
+        threads = [threading.Thread(target=generate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(500):
+            catalog.reload(catalogs[i % 2])
+        stop.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
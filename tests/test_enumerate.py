@@ -0,0 +1,61 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import itertools
+import unittest
+
+import src.ua_generator as ua_generator
+from src.ua_generator import exceptions
+from src.ua_generator.data.version import VersionRange
+from src.ua_generator.options import Options
+
+
+class TestEnumerate(unittest.TestCase):
+    def test_cardinality(self):
+        # Firefox on Linux: 2 templates, 65 versions
+        self.assertEqual(ua_generator.cardinality(platform='linux', browser='firefox'), 130)
+        # Windows NT 6.1, 6.2, 6.3 and 10.0, under 2 templates
+        self.assertEqual(ua_generator.cardinality(platform='windows', browser='firefox'), 4 * 2 * 65)
+        self.assertEqual(ua_generator.cardinality(platform=('windows', 'linux'), browser='firefox'), 520 + 130)
+        self.assertGreater(ua_generator.cardinality(), 10 ** 12)
+
+    def test_cardinality_options(self):
+        options = Options(version_ranges={'firefox': VersionRange(120, 129)})
+        self.assertLess(ua_generator.cardinality(platform='linux', browser='firefox', options=options), 130)
+
+    def test_enumerate(self):
+        space = ua_generator.enumerate(platform='linux', browser='firefox')
+        texts = list(space)
+        self.assertEqual(len(texts), len(space))
+        self.assertEqual(len(set(texts)), len(texts))
+        for k in range(0, len(space)):
+            self.assertEqual(space[k], texts[k])
+        self.assertEqual(space[-1], texts[-1])
+        self.assertRaises(IndexError, space.__getitem__, len(space))
+
+        for text in ua_generator.generate_many(200, platform='linux', browser='firefox'):
+            self.assertIn(text, texts)
+
+    def test_enumerate_lazy(self):
+        space = ua_generator.enumerate(device='mobile')
+        self.assertEqual(len(space), ua_generator.cardinality(device='mobile'))
+        for text in itertools.islice(space, 100):
+            self.assertTrue(text.startswith('Mozilla/5.0 ('))
+        self.assertIn('Android', space[len(space) // 2])
+        self.assertEqual(space[len(space) // 2], ua_generator.enumerate(device='mobile')[len(space) // 2])
+
+    def test_enumerate_builtin(self):
+        # The module does not shadow the builtin, yet "from ua_generator import enumerate" works
+        self.assertNotIn('enumerate', vars(ua_generator))
+        from src.ua_generator import enumerate as enumerate_space
+        self.assertEqual(len(enumerate_space(platform='linux', browser='firefox')), 130)
+        self.assertRaises(AttributeError, getattr, ua_generator, 'enumerate_all')
+
+    def test_enumerate_invalid(self):
+        self.assertRaises(exceptions.InvalidArgumentError, ua_generator.enumerate, platform='invalid111')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import gc
+import os
+import subprocess
+import sys
+import unittest
+import weakref
+
+import src.ua_generator as ua_generator
+from src.ua_generator import exceptions
+from src.ua_generator.data import catalog
+from src.ua_generator.data.version import Version, ChromiumVersion, VersionRange
+from src.ua_generator.options import Options
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+class TestForKey(unittest.TestCase):
+    def tearDown(self):
+        catalog.install(None)
+
+    def test_same_key(self):
+        for key in ('session-1', 42, b'tenant'):
+            ua = ua_generator.for_key(key)
+            again = ua_generator.for_key(key)
+            self.assertEqual(again.text, ua.text)
+            self.assertEqual(again.ch.brands_full_version_list, ua.ch.brands_full_version_list)
+            self.assertEqual(again.ch.platform_version, ua.ch.platform_version)
+            self.assertEqual(again.ch.bitness, ua.ch.bitness)
+            self.assertEqual(again.headers.get(), ua.headers.get())
+
+    def test_not_cached(self):
+        # The same as generated again, once the cache is cleared
+        texts = [ua_generator.for_key(f'session-{i}').text for i in range(100)]
+        ua_generator._for_key.cache_clear()
+        self.assertEqual([ua_generator.for_key(f'session-{i}').text for i in range(100)], texts)
+        self.assertGreater(len(set(texts)), 50)
+
+    def test_other_process(self):
+        code = 'import src.ua_generator as ua_generator; print(ua_generator.for_key("session-1").text)'
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True,
+                                env={**os.environ, 'PYTHONHASHSEED': '1'})
+        self.assertEqual(result.stdout.strip(), ua_generator.for_key('session-1').text)
+
+    def test_arguments(self):
+        for i in range(50):
+            ua = ua_generator.for_key(i, device='mobile', browser=['chrome', 'edge'])
+            self.assertEqual(ua.device, 'mobile')
+            self.assertIn(ua.browser, ('chrome', 'edge'))
+            self.assertEqual(ua_generator.for_key(i, device='mobile', browser=('chrome', 'edge')).text, ua.text)
+
+    def test_seed(self):
+        texts = [ua_generator.for_key(i).text for i in range(50)]
+        seeded = [ua_generator.for_key(i, options=Options(seed='rotation-2')).text for i in range(50)]
+        self.assertNotEqual(seeded, texts)
+        self.assertEqual([ua_generator.for_key(i, options=Options(seed='rotation-2')).text for i in range(50)], seeded)
+
+    def test_cached_by_values(self):
+        ua_generator._for_key.cache_clear()
+        for _ in range(3):
+            ua_generator.for_key('session-1', options=Options(weighted_versions=True,
+                                                              version_ranges={'chrome': VersionRange(120, 125)}))
+        ua_generator.for_key('session-1')
+        ua_generator.for_key('session-1', options=Options())
+        info = ua_generator._for_key.cache_info()
+        self.assertEqual((info.hits, info.misses), (3, 2))
+
+    def test_key_type(self):
+        # 1 and '1' are different keys, with or without a seed
+        for options in (None, Options(seed='rotation-2')):
+            ints = [ua_generator.for_key(i, options=options).text for i in range(20)]
+            strs = [ua_generator.for_key(str(i), options=options).text for i in range(20)]
+            self.assertNotEqual(ints, strs)
+
+    def test_own_headers(self):
+        ua = ua_generator.for_key('session-1', browser='chrome')
+        ua.headers.accept_ch('Sec-CH-UA-Platform-Version')
+        self.assertIn('sec-ch-ua-platform-version', ua.headers.get())
+        self.assertNotIn('sec-ch-ua-platform-version', ua_generator.for_key('session-1', browser='chrome').headers.get())
+        again = ua_generator.for_key('session-1', browser='chrome')
+        self.assertIsNot(again.headers, ua_generator.for_key('session-1', browser='chrome').headers)
+        self.assertEqual(again.headers.block(), ua_generator.for_key('session-1', browser='chrome').headers.block())
+
+    def test_catalog(self):
+        entries = {'chrome': catalog.Entry('chrome', [ChromiumVersion(Version(major=200, minor=0, build=1, patch=2))])}
+        ua_generator.for_key('session-1', platform='linux', browser='chrome')
+        catalog.install(catalog.Catalog(entries))
+        self.assertIn('Chrome/200.0.1.2 ', ua_generator.for_key('session-1', platform='linux', browser='chrome').text)
+
+    def test_catalog_released(self):
+        # The cached user-agents do not keep a replaced catalog alive
+        installed = catalog.Catalog(
+            {'chrome': catalog.Entry('chrome', [ChromiumVersion(Version(major=200, minor=0, build=1, patch=2))])})
+        catalog.install(installed)
+        ua_generator.for_key('session-1', platform='linux', browser='chrome')
+        reference = weakref.ref(installed)
+        del installed
+        catalog.install(None)
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_invalid(self):
+        self.assertRaises(exceptions.InvalidArgumentError, ua_generator.for_key, None)
+        self.assertRaises(exceptions.InvalidArgumentError, ua_generator.for_key, ('tuple',))
+        self.assertRaises(exceptions.InvalidArgumentError, ua_generator.for_key, 'session-1', browser='netscape')
+
+
+if __name__ == '__main__':
+    unittest.main()
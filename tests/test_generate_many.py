@@ -0,0 +1,86 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import unittest
+from unittest import mock
+
+import src.ua_generator as ua_generator
+from src.ua_generator import exceptions
+from src.ua_generator.data.version import VersionRange
+from src.ua_generator.options import Options
+
+
+class TestGenerateMany(unittest.TestCase):
+    def test_generate_many(self):
+        texts = ua_generator.generate_many(1000)
+        self.assertEqual(len(texts), 1000)
+        for text in texts:
+            self.assertTrue(type(text) is str)
+            self.assertTrue(text.startswith('Mozilla/5.0 ('))
+
+    def test_generate_many_empty(self):
+        self.assertEqual(ua_generator.generate_many(0), [])
+
+    def test_generate_many_2(self):
+        texts = ua_generator.generate_many(100, platform='windows', browser='edge')
+        for text in texts:
+            self.assertIn('Windows NT', text)
+            self.assertIn('Edg/', text)
+
+    def test_generate_many_3(self):
+        texts = ua_generator.generate_many(100, device='mobile', browser='firefox')
+        for text in texts:
+            self.assertTrue('Android' in text or 'iPhone' in text)
+            self.assertTrue('Firefox/' in text or 'FxiOS/' in text)
+
+    def test_generate_many_options(self):
+        options = Options(version_ranges={'chrome': VersionRange(125, 127)})
+        texts = ua_generator.generate_many(100, platform='linux', browser='chrome', options=options)
+        for text in texts:
+            self.assertRegex(text, r'Chrome/12[5-7]\.')
+
+    def test_generate_many_seed(self):
+        # Drawn as generate() draws them
+        for arguments in ({}, {'device': 'mobile'}, {'platform': 'windows', 'browser': ('chrome', 'edge')}):
+            texts = ua_generator.generate_many(200, options=Options(seed=7), **arguments)
+            options = Options(seed=7)
+            self.assertEqual(texts, [ua_generator.generate(options=options, **arguments).text for _ in range(200)])
+
+    def test_generate_many_unique(self):
+        texts = ua_generator.generate_many(1000, unique=True)
+        self.assertEqual(len(texts), 1000)
+        self.assertEqual(len(set(texts)), 1000)
+
+    def test_generate_many_unique_no_space(self):
+        # The index of every user-agent is not built while the draws rarely collide
+        with mock.patch('src.ua_generator.data.space.Space', side_effect=AssertionError):
+            texts = ua_generator.generate_many(1000, platform='windows', unique=True)
+        self.assertEqual(len(set(texts)), 1000)
+
+    def test_generate_many_unique_exhaustive(self):
+        # Every Firefox on Linux user-agent, many more draws would be needed to collect them by chance
+        texts = ua_generator.generate_many(130, platform='linux', browser='firefox', unique=True)
+        self.assertEqual(len(set(texts)), 130)
+        for text in texts:
+            self.assertIn('Linux x86_64; rv:', text)
+
+        self.assertRaises(exceptions.CannotGenerateError, ua_generator.generate_many, 131,
+                          platform='linux', browser='firefox', unique=True)
+
+    def test_generate_many_unique_seed(self):
+        texts_1 = ua_generator.generate_many(500, platform='windows', browser='firefox', options=Options(seed=1), unique=True)
+        texts_2 = ua_generator.generate_many(500, platform='windows', browser='firefox', options=Options(seed=1), unique=True)
+        self.assertEqual(texts_1, texts_2)
+        self.assertEqual(len(set(texts_1)), 500)
+
+    def test_generate_many_invalid(self):
+        def raised_call():
+            ua_generator.generate_many(10, browser=('chrome', 'invalid111'))
+
+        self.assertRaises(exceptions.InvalidArgumentError, raised_call)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import unittest
+
+import src.ua_generator as ua_generator
+from src.ua_generator import exceptions
+from src.ua_generator.data.version import VersionRange
+from src.ua_generator.options import Options
+
+
+class TestGenerateParallel(unittest.TestCase):
+    def test_generate_parallel(self):
+        texts = ua_generator.generate_parallel(1000, workers=2, seed=1)
+        self.assertEqual(len(texts), 1000)
+        for text in texts:
+            self.assertTrue(type(text) is str)
+            self.assertTrue(text.startswith('Mozilla/5.0 ('))
+
+    def test_generate_parallel_deterministic(self):
+        texts_1 = ua_generator.generate_parallel(500, workers=3, seed='abc')
+        texts_2 = ua_generator.generate_parallel(500, workers=3, seed='abc')
+        texts_3 = ua_generator.generate_parallel(500, workers=3, seed='abd')
+        self.assertEqual(texts_1, texts_2)
+        self.assertNotEqual(texts_1, texts_3)
+
+        # A single worker generates the first chunk in the process
+        self.assertEqual(ua_generator.generate_parallel(100, workers=1, seed=5),
+                         ua_generator.generate_many(100, options=Options(seed='5/0')))
+
+    def test_generate_parallel_options(self):
+        options = Options(version_ranges={'chrome': VersionRange(125, 127)}, seed=3)
+        texts = ua_generator.generate_parallel(200, platform='linux', browser='chrome', options=options, workers=2)
+        self.assertEqual(texts, ua_generator.generate_parallel(200, platform='linux', browser='chrome',
+                                                               options=options, workers=2))
+        for text in texts:
+            self.assertRegex(text, r'Chrome/12[5-7]\.')
+
+    def test_generate_parallel_small(self):
+        self.assertEqual(ua_generator.generate_parallel(0, seed=1), [])
+        self.assertEqual(len(ua_generator.generate_parallel(3, workers=8, seed=1)), 3)
+
+    def test_generate_parallel_invalid(self):
+        self.assertRaises(exceptions.InvalidArgumentError, ua_generator.generate_parallel, 10, browser='invalid111')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import unittest
+
+from src.ua_generator import exceptions
+from src.ua_generator.data import registry
+from src.ua_generator.data.generator import Generator
+from src.ua_generator.options import Options
+
+
+class TestGenerator(unittest.TestCase):
+    def test_templates(self):
+        for browser in registry.browsers.names():
+            for platform in registry.browsers[browser].load().renderers:
+                device = registry.platforms[platform].device
+                for i in range(0, 20):
+                    gen = Generator(device=device, platform=platform, browser=browser, options=Options())
+                    self.assertTrue(gen.user_agent.startswith('Mozilla/5.0 ('))
+                    self.assertNotIn('{', gen.user_agent)
+                    self.assertNotIn('}', gen.user_agent)
+
+    def test_template_fields(self):
+        gen = Generator(device='desktop', platform='macos', browser='firefox', options=Options())
+        self.assertIn('Mac OS X ' + gen.platform_version.format(partitions=2, trim_zero=True) + ';', gen.user_agent)
+        self.assertTrue(gen.user_agent.endswith('Firefox/' + gen.browser_version.format(partitions=2)))
+
+    def test_cannot_generate(self):
+        def raised_call():
+            Generator(device='desktop', platform='windows', browser='safari', options=Options())
+
+        self.assertRaises(exceptions.CannotGenerateError, raised_call)
+
+
+if __name__ == '__main__':
+    unittest.main()
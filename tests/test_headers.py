@@ -7,6 +7,7 @@ import unittest
 
 import src.ua_generator as ua_generator
 from src.ua_generator.data import BROWSERS_SUPPORT_CH
+from src.ua_generator.headers import accepted_hints
 
 
 class TestHeaders(unittest.TestCase):
@@ -71,6 +72,106 @@ class TestHeaders(unittest.TestCase):
             self.assertFalse('sec-ch-ua-platform-version' in ua.headers.get())
             self.assertFalse('sec-ch-ua-full-version-list' in ua.headers.get())
 
+    def test_frozen(self):
+        ua = ua_generator.generate(browser=BROWSERS_SUPPORT_CH)
+        frozen = ua.headers.frozen()
+        self.assertIs(ua.headers.frozen(), frozen)
+        self.assertEqual(dict(frozen), ua.headers.get())
+        with self.assertRaises(TypeError):
+            frozen['user-agent'] = 'changed'
+
+        ua.headers.add('sec-ch-ua-bitness')
+        self.assertFalse('sec-ch-ua-bitness' in frozen)
+        self.assertTrue('sec-ch-ua-bitness' in ua.headers.frozen())
+
+    def test_raw(self):
+        for i in range(0, 100):
+            ua = ua_generator.generate()
+            raw = ua.headers.raw()
+            self.assertIs(ua.headers.raw(), raw)
+            self.assertEqual(raw, [(k.encode(), v.encode()) for k, v in ua.headers.get().items()])
+            self.assertEqual(raw[0], (b'user-agent', ua.text.encode()))
+
+    def test_get_changed(self):
+        # The dict of get() may be changed, the encodings follow it
+        ua = ua_generator.generate(browser=BROWSERS_SUPPORT_CH)
+        frozen, raw, block = ua.headers.frozen(), ua.headers.raw(), ua.headers.block()
+        ua.headers.get()['x-custom'] = '1'
+        self.assertEqual(ua.headers.frozen()['x-custom'], '1')
+        self.assertEqual(ua.headers.raw()[-1], (b'x-custom', b'1'))
+        self.assertTrue(ua.headers.block().endswith(b'x-custom: 1\r\n'))
+        self.assertNotIn('x-custom', frozen)
+        self.assertNotIn((b'x-custom', b'1'), raw)
+        self.assertNotIn(b'x-custom', block)
+
+    def test_copy(self):
+        ua = ua_generator.generate(browser=BROWSERS_SUPPORT_CH)
+        ua.headers.accept_ch('Sec-CH-UA-Arch')
+        copy = ua.headers.copy()
+        self.assertEqual(copy.get(), ua.headers.get())
+        self.assertEqual(copy.block(), ua.headers.block())
+        copy.add('sec-ch-ua-bitness')
+        copy.get()['x-custom'] = '1'
+        self.assertNotIn('sec-ch-ua-bitness', ua.headers.get())
+        self.assertNotIn('x-custom', ua.headers.get())
+        self.assertNotIn(b'x-custom', ua.headers.block())
+
+    def test_block(self):
+        ua = ua_generator.generate(browser=BROWSERS_SUPPORT_CH)
+        block = ua.headers.block()
+        self.assertEqual(block, str(ua.headers).replace('\n', '\r\n').encode())
+        self.assertTrue(block.startswith(b'user-agent: ' + ua.text.encode() + b'\r\n'))
+        self.assertIs(ua.headers.block(), block)
+
+        ua.headers.accept_ch('Sec-CH-UA-Arch')
+        self.assertNotEqual(ua.headers.block(), block)
+        self.assertTrue(ua.headers.block().endswith(b'sec-ch-ua-arch: ' + ua.ch.architecture.encode() + b'\r\n'))
+
+    def test_accepted_hints(self):
+        self.assertEqual(accepted_hints('Sec-CH-UA-Arch, sec-ch-ua-model,Sec-CH-Example, SEC-CH-UA-ARCH'),
+                         ('sec-ch-ua-arch', 'sec-ch-ua-model'))
+        self.assertEqual(accepted_hints(''), ())
+        self.assertIs(accepted_hints('Sec-CH-UA-Bitness'), accepted_hints('Sec-CH-UA-Bitness'))
+
+    def test_accept_ch_memoized(self):
+        ua = ua_generator.generate(browser=BROWSERS_SUPPORT_CH)
+        ua.headers.accept_ch('Sec-CH-UA-Platform-Version, Sec-CH-UA-Full-Version-List')
+        headers = ua.headers.get()
+        block = ua.headers.block()
+
+        ua.headers.accept_ch('Sec-CH-UA-Bitness')
+        self.assertFalse('sec-ch-ua-platform-version' in ua.headers.get())
+        ua.headers.accept_ch('sec-ch-ua-platform-version,sec-ch-ua-full-version-list')
+        self.assertEqual(ua.headers.get(), headers)
+        self.assertEqual(ua.headers.block(), block)
+
+        # Adding a header does not change the memoized set
+        ua.headers.add('sec-ch-ua-arch')
+        self.assertTrue('sec-ch-ua-arch' in ua.headers.get())
+        self.assertFalse('sec-ch-ua-arch' in headers)
+        ua.headers.accept_ch('Sec-CH-UA-Platform-Version, Sec-CH-UA-Full-Version-List')
+        self.assertEqual(ua.headers.get(), headers)
+        self.assertFalse('sec-ch-ua-arch' in ua.headers.get())
+
+    def test_accept_ch_memoized_changed(self):
+        # A header set into the dict of get() is not kept by the memoized set
+        ua = ua_generator.generate(browser=BROWSERS_SUPPORT_CH)
+        ua.headers.accept_ch('Sec-CH-UA-Platform-Version')
+        ua.headers.get()['x-custom'] = '1'
+        block = ua.headers.block()
+        ua.headers.accept_ch('Sec-CH-UA-Bitness')
+        ua.headers.accept_ch('Sec-CH-UA-Platform-Version')
+        self.assertNotIn('x-custom', ua.headers.get())
+        self.assertNotIn(b'x-custom', ua.headers.block())
+        self.assertIn(b'x-custom', block)
+
+    def test_accept_ch_not_supported(self):
+        ua = ua_generator.generate(browser='firefox')
+        ua.headers.accept_ch('Sec-CH-UA-Platform-Version')
+        self.assertEqual(list(ua.headers.get()), ['user-agent'])
+        ua.headers.accept_ch('Sec-CH-UA-Platform-Version')
+        self.assertEqual(list(ua.headers.get()), ['user-agent'])
+
 
 if __name__ == '__main__':
     unittest.main()
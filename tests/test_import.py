@@ -0,0 +1,45 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def run(code: str) -> subprocess.CompletedProcess:
+    # A new interpreter, so nothing is imported already
+    return subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+class TestImport(unittest.TestCase):
+    def test_lazy_catalogs(self):
+        # What the import time depends on, rather than a timing: see benchmarks/bench_import.py for the time itself
+        loaded = run('import sys, src.ua_generator; '
+                     'print(" ".join(m for m in sys.modules '
+                     'if ".browsers" in m or ".platforms" in m or m.endswith((".space", ".renderer")) '
+                     'or m.startswith(("concurrent", "asyncio"))))')
+        self.assertEqual(loaded.stdout.strip(), '')
+
+        loaded = run('import sys, src.ua_generator as ua_generator; '
+                     'ua_generator.generate(platform="windows", browser="firefox"); '
+                     'print(" ".join(sorted(m.rsplit(".", 1)[-1] for m in sys.modules '
+                     'if ".browsers." in m or ".platforms." in m)))')
+        self.assertEqual(loaded.stdout.split(), ['firefox', 'windows'])
+
+    def test_lazy_android_vendors(self):
+        # One vendor is drawn, the others are not imported
+        loaded = run('import sys, random; '
+                     'from src.ua_generator.data.platforms import android; '
+                     'from src.ua_generator.options import Options; '
+                     'android.get_version(Options(rng=random.Random(1))); '
+                     'print(sum(m.startswith("src.ua_generator.data.platforms.android.") for m in sys.modules))')
+        self.assertEqual(loaded.stdout.strip(), '1')
+
+
+if __name__ == '__main__':
+    unittest.main()
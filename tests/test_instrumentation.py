@@ -0,0 +1,99 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import pickle
+import unittest
+
+import src.ua_generator as ua_generator
+from src.ua_generator import instrumentation
+from src.ua_generator.options import Options
+
+
+class Recorder(instrumentation.Hook):
+    def __init__(self):
+        self.events = []
+
+    def timing(self, stage: str, seconds: float):
+        self.events.append((stage, seconds))
+
+    def count(self, counter: str, value: int = 1):
+        self.events.append((counter, value))
+
+
+class TestInstrumentation(unittest.TestCase):
+    def tearDown(self):
+        instrumentation.uninstall()
+
+    def test_stages(self):
+        recorder = Recorder()
+        ua = ua_generator.generate(browser='chrome', options=Options(hook=recorder))
+        self.assertEqual([name for name, _ in recorder.events], [
+            instrumentation.RESOLVE, instrumentation.GENERATIONS,
+            instrumentation.PLATFORM_VERSION, instrumentation.BROWSER_VERSION, instrumentation.RENDER,
+        ])
+        self.assertTrue(all(value >= 0 for _, value in recorder.events))
+
+        # Serialized once, on first access
+        recorder.events.clear()
+        _ = ua.ch.brands, ua.ch.brands, ua.ch.platform
+        self.assertEqual([name for name, _ in recorder.events], [instrumentation.CLIENT_HINTS] * 2)
+
+    def test_stats(self):
+        stats = instrumentation.Stats()
+        ua_generator.generate_many(100, options=Options(hook=stats))
+        self.assertEqual(stats.counters, {instrumentation.GENERATIONS: 100})
+        for stage in (instrumentation.RESOLVE, instrumentation.PLATFORM_VERSION, instrumentation.BROWSER_VERSION,
+                      instrumentation.RENDER):
+            self.assertEqual(stats.calls[stage], 100)
+            self.assertGreater(stats.seconds[stage], 0.0)
+
+    def test_fallbacks(self):
+        stats = instrumentation.Stats()
+        ua_generator.generate_many(10, platform='windows', browser='safari', options=Options(hook=stats))
+        self.assertEqual(stats.counters[instrumentation.FALLBACKS], 10)
+
+    def test_generate_parallel(self):
+        # Each worker adds up its own stats, which are merged into the hook
+        stats = instrumentation.Stats()
+        options = Options(seed=1, hook=stats)
+        texts = ua_generator.generate_parallel(100, options=options, workers=2)
+        self.assertEqual(texts, ua_generator.generate_parallel(100, options=Options(seed=1), workers=2))
+        self.assertIs(options.hook, stats)
+        self.assertEqual(stats.counters[instrumentation.GENERATIONS], 100)
+        self.assertEqual(stats.calls[instrumentation.RENDER], 100)
+
+        recorder = Recorder()
+        ua_generator.generate_parallel(100, options=Options(seed=1, hook=recorder), workers=2)
+        self.assertEqual(sum(value for name, value in recorder.events if name == instrumentation.GENERATIONS), 100)
+
+    def test_stats_merge(self):
+        stats, other = instrumentation.Stats(), instrumentation.Stats()
+        stats.timing(instrumentation.RENDER, 1.0)
+        other.timing(instrumentation.RENDER, 2.0)
+        other.count(instrumentation.GENERATIONS, 3)
+        stats.merge(pickle.loads(pickle.dumps(other)))
+        self.assertEqual(stats.seconds, {instrumentation.RENDER: 3.0})
+        self.assertEqual(stats.calls, {instrumentation.RENDER: 2})
+        self.assertEqual(stats.counters, {instrumentation.GENERATIONS: 3})
+
+    def test_installed(self):
+        stats = instrumentation.Stats()
+        instrumentation.install(stats)
+        ua_generator.generate()
+        self.assertEqual(stats.counters[instrumentation.GENERATIONS], 1)
+
+        # The hook of the options comes first
+        own = instrumentation.Stats()
+        ua_generator.generate(options=Options(hook=own))
+        self.assertEqual(stats.counters[instrumentation.GENERATIONS], 1)
+        self.assertEqual(own.counters[instrumentation.GENERATIONS], 1)
+
+        instrumentation.uninstall()
+        ua_generator.generate()
+        self.assertEqual(stats.counters[instrumentation.GENERATIONS], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
+import random
 import unittest
 
 import src.ua_generator as ua_generator
@@ -30,6 +31,37 @@ class TestOptions(unittest.TestCase):
             ua = ua_generator.generate(browser='chrome', options=options)
             self.assertIn(ua.generator.browser_version.major, (125, 126, 127))
 
+    def test_seed(self):
+        options_1 = Options(seed=1234)
+        options_2 = Options(seed=1234)
+        self.assertEqual(options_1.seed, 1234)
+        for i in range(0, 100):
+            ua_1 = ua_generator.generate(options=options_1)
+            ua_2 = ua_generator.generate(options=options_2)
+            self.assertEqual(ua_1.text, ua_2.text)
+            self.assertEqual(ua_1.ch.platform_version, ua_2.ch.platform_version)
+
+    def test_seed_many(self):
+        texts_1 = ua_generator.generate_many(500, options=Options(seed='abc'))
+        texts_2 = ua_generator.generate_many(500, options=Options(seed='abc'))
+        texts_3 = ua_generator.generate_many(500, options=Options(seed='abd'))
+        self.assertEqual(texts_1, texts_2)
+        self.assertNotEqual(texts_1, texts_3)
+
+    def test_rng(self):
+        rng = random.Random(99)
+        options = Options(rng=rng)
+        self.assertIs(options.rng, rng)
+        texts_1 = ua_generator.generate_many(100, browser='chrome', options=options)
+
+        rng.seed(99)
+        texts_2 = ua_generator.generate_many(100, browser='chrome', options=options)
+        self.assertEqual(texts_1, texts_2)
+
+    def test_rng_default(self):
+        self.assertIs(Options().rng, random)
+        self.assertIsNone(Options().seed)
+
 
 if __name__ == '__main__':
     unittest.main()
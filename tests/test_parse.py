@@ -0,0 +1,71 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import unittest
+
+import src.ua_generator as ua_generator
+from src.ua_generator.data import registry
+from src.ua_generator.options import Options
+
+
+class TestParse(unittest.TestCase):
+    def test_round_trip(self):
+        options = Options(seed=1234)
+        for browser in registry.browsers.names():
+            for platform in registry.platforms.names():
+                if not registry.browsers[browser].supports(platform):
+                    continue
+                for _ in range(0, 50):
+                    ua = ua_generator.generate(platform=platform, browser=browser, options=options)
+                    parsed = ua_generator.parse(ua.text)
+                    self.assertIsNotNone(parsed, ua.text)
+                    self.assertEqual(parsed.text, ua.text)
+                    self.assertEqual(parsed.device, ua.device)
+                    self.assertEqual(parsed.platform, platform)
+                    self.assertEqual(parsed.browser, browser)
+                    self.assertEqual(parsed.ch.brands, ua.ch.brands)
+                    self.assertEqual(parsed.ch.brands_full_version_list, ua.ch.brands_full_version_list)
+                    self.assertEqual(parsed.ch.mobile, ua.ch.mobile)
+                    self.assertEqual(parsed.ch.platform, ua.ch.platform)
+                    self.assertEqual(parsed.ch.bitness, ua.ch.bitness)
+                    self.assertEqual(parsed.ch.architecture, ua.ch.architecture)
+                    self.assertEqual(parsed.headers.get()['user-agent'], ua.text)
+
+    def test_versions(self):
+        # Versions the text shows in full; Linux has no version in the text, Firefox on macOS shows 2 parts
+        for ua in ua_generator.stream(platform=('macos', 'ios'), browser=('chrome', 'safari'), limit=200, records=True):
+            parsed = ua_generator.parse(ua.text)
+            self.assertEqual(parsed.ch.platform_version, ua.ch.platform_version)
+            self.assertEqual(parsed.generator.browser_version, ua.generator.browser_version)
+
+    def test_android(self):
+        for ua in ua_generator.stream(platform='android', browser=('chrome', 'edge'), limit=200, records=True):
+            parsed = ua_generator.parse(ua.text)
+            self.assertEqual(parsed.generator.platform_version.major, ua.generator.platform_version.major)
+            self.assertEqual(parsed.generator.platform_version.platform_model, ua.generator.platform_version.platform_model)
+            self.assertEqual(parsed.generator.platform_version.build_number, ua.generator.platform_version.build_number)
+            self.assertEqual(parsed.ch.model, ua.ch.model)
+
+    def test_windows(self):
+        # Windows 10 and 11 are both "Windows NT 10.0"
+        parsed = ua_generator.parse('Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:115.0.2) Gecko/20100101 Firefox/115.0.2')
+        self.assertEqual(parsed.platform, 'windows')
+        self.assertEqual(parsed.browser, 'firefox')
+        self.assertEqual(parsed.ch.wow64, '?1')
+        self.assertEqual(str(parsed.generator.browser_version), '115.0.2')
+
+    def test_unknown(self):
+        self.assertIsNone(ua_generator.parse(''))
+        self.assertIsNone(ua_generator.parse('curl/8.4.0'))
+        self.assertIsNone(ua_generator.parse('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                                             '(KHTML, like Gecko) Chrome/1.2.3.4 Safari/537.36'))
+        self.assertIsNone(ua_generator.parse('Mozilla/5.0 (Android 13; Mobile; rv:128.0) Gecko/127.0 Firefox/128.0'))
+        self.assertIsNone(ua_generator.parse('Mozilla/5.0 (Linux; Android 13; Not A Model; Build/TQ3A.230805.001) '
+                                             'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.144 '
+                                             'Mobile Safari/537.36'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import random
+import unittest
+
+import src.ua_generator as ua_generator
+from src.ua_generator import exceptions
+from src.ua_generator.data import registry
+from src.ua_generator.options import Options
+from src.ua_generator.plan import Combinations, Plan
+
+
+class TestPlan(unittest.TestCase):
+    def test_combinations(self):
+        combinations = Plan().combinations
+        # Safari is only valid on macOS and iOS
+        self.assertEqual(len(combinations), 3 * 3 + 2 * 4)
+        self.assertAlmostEqual(sum(combinations.weights), 1.0)
+        self.assertFalse(combinations.fallback)
+        for device, platform, browser in combinations.triples:
+            self.assertEqual(registry.platforms[platform].device, device)
+            self.assertTrue(registry.browsers[browser].supports(platform))
+
+    def test_no_fallback(self):
+        # Safari is never rewritten to Chrome, so Chrome is not skewed on macOS
+        rng = random.Random(1)
+        plan = Plan(device='desktop', browser=('safari', 'chrome'), options=Options(rng=rng))
+        counts = {}
+        for i in range(0, 20000):
+            triple = plan.resolve()
+            counts[triple] = counts.get(triple, 0) + 1
+        self.assertEqual(set(counts), {('desktop', 'windows', 'chrome'), ('desktop', 'linux', 'chrome'),
+                                       ('desktop', 'macos', 'chrome'), ('desktop', 'macos', 'safari')})
+        self.assertAlmostEqual(counts[('desktop', 'macos', 'safari')] / 20000, 1 / 6, delta=0.02)
+        self.assertAlmostEqual(counts[('desktop', 'macos', 'chrome')] / 20000, 1 / 6, delta=0.02)
+
+    def test_platform_marginals(self):
+        # The requested platforms are equally likely, whatever their device types
+        combinations = Plan(platform=('windows', 'macos', 'ios')).combinations
+        shares = {}
+        for (device, platform, browser), weight in zip(combinations.triples, combinations.weights):
+            shares[platform] = shares.get(platform, 0.0) + weight
+        for share in shares.values():
+            self.assertAlmostEqual(share, 1 / 3)
+
+    def test_fallback(self):
+        combinations = Plan(platform=('windows', 'linux'), browser='safari').combinations
+        self.assertTrue(combinations.fallback)
+        self.assertEqual(set(browser for _, _, browser in combinations.triples), {'chrome'})
+
+    def test_market_share(self):
+        options = Options(market_share={'mobile': 0.0, 'windows': 8.0, 'chrome': 3.0})
+        combinations = Plan(options=options).combinations
+        shares = {}
+        for (device, platform, browser), weight in zip(combinations.triples, combinations.weights):
+            self.assertEqual(device, 'desktop')
+            shares[platform] = shares.get(platform, 0.0) + weight
+            shares[browser] = shares.get(browser, 0.0) + weight
+        self.assertAlmostEqual(shares['windows'], 0.8)
+        self.assertAlmostEqual(shares['safari'], 0.1 / 6)
+
+        for i in range(0, 100):
+            ua = ua_generator.generate(options=options)
+            self.assertEqual(ua.device, 'desktop')
+
+    def test_no_combination(self):
+        self.assertRaises(exceptions.CannotGenerateError, Combinations, None, ('windows',), ('chrome',), (('chrome', 0.0),))
+
+    def test_cache(self):
+        self.assertIs(Plan(device='mobile').combinations, Plan(device='mobile').combinations)
+        self.assertIsNot(Plan(device='mobile').combinations,
+                         Plan(device='mobile', options=Options(market_share={'ios': 2.0})).combinations)
+
+
+if __name__ == '__main__':
+    unittest.main()
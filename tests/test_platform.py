@@ -3,9 +3,14 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
+import random
+import re
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import src.ua_generator as ua_generator
+from src.ua_generator.data.platforms.android import android_samsung, android_pixel, android_xiaomi, android_oppo
+from src.ua_generator.options import Options
 
 
 class TestPlatform(unittest.TestCase):
@@ -58,6 +63,29 @@ class TestPlatform(unittest.TestCase):
             self.assertNotEqual(ua.device, 'mobile')
             self.assertEqual(ua.platform, 'macos')
 
+    def test_android_catalog(self):
+        # Sampling never changes the catalog, so the build numbers keep varying
+        build_numbers = set()
+        for i in range(0, 200):
+            ua = ua_generator.generate(platform='android')
+            build_numbers.add(ua.generator.platform_version.build_number)
+            self.assertNotIn('{', ua.text)
+        self.assertTrue(len(build_numbers) > 100)
+
+        for vendor in (android_samsung, android_pixel, android_xiaomi, android_oppo):
+            for version in vendor.versions:
+                self.assertIsNone(version.platform_model)
+                for build_number in version.build_numbers:
+                    self.assertTrue(re.search(r'\{[dv]}', build_number), build_number)
+
+    def test_android_threads(self):
+        def generate(seed):
+            return ua_generator.generate_many(200, platform='android', options=Options(rng=random.Random(seed)))
+
+        expected = [generate(seed) for seed in range(0, 16)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self.assertEqual(list(executor.map(generate, range(0, 16))), expected)
+
 
 if __name__ == '__main__':
     unittest.main()
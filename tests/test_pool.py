@@ -0,0 +1,206 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import asyncio
+import gc
+import threading
+import time
+import unittest
+import weakref
+
+import src.ua_generator as ua_generator
+from src.ua_generator import exceptions
+from src.ua_generator.options import Options
+from src.ua_generator.pool import UserAgentPool, AsyncUserAgentPool
+from src.ua_generator.user_agent import UserAgent
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+class TestPool(unittest.TestCase):
+    def test_records(self):
+        with UserAgentPool(device='mobile', browser='chrome', size=32) as pool:
+            self.assertEqual(len(pool), 32)
+            for _ in range(100):
+                ua = pool.next()
+                self.assertTrue(type(ua) is UserAgent)
+                self.assertEqual(ua.device, 'mobile')
+                self.assertEqual(ua.browser, 'chrome')
+                self.assertEqual(ua.headers.get()['user-agent'], ua.text)
+
+    def test_strings(self):
+        with UserAgentPool(platform='windows', browser='edge', size=16, records=False) as pool:
+            for text in [next(pool) for _ in range(50)]:
+                self.assertTrue(type(text) is str)
+                self.assertIn('Edg/', text)
+
+    def test_refill(self):
+        with UserAgentPool(size=64, batch=8, low_water=48, records=False) as pool:
+            for _ in range(20):
+                pool.next()
+            self.assertTrue(wait_for(lambda: len(pool) == 64))
+
+    def test_filled_by_thread(self):
+        # Built with one batch, the thread generates the rest
+        with UserAgentPool(size=512, batch=16, records=False) as pool:
+            self.assertGreaterEqual(len(pool), 16)
+            self.assertTrue(wait_for(lambda: len(pool) == 512))
+
+    def test_each_served_once(self):
+        with UserAgentPool(size=8, low_water=0, options=Options(seed=1234), records=False) as pool:
+            served = [pool.next() for _ in range(8)]
+            self.assertEqual(served, ua_generator.generate_many(8, options=Options(seed=1234)))
+            self.assertEqual(len(pool), 0)
+            self.assertTrue(pool.next())  # Generated by next(), as the ring is empty
+            self.assertEqual(pool.misses, 1)
+
+    def test_reuse(self):
+        with UserAgentPool(size=4, low_water=0, reuse=3, records=False) as pool:
+            served = [pool.next() for _ in range(12)]
+            self.assertEqual(len(pool), 0)
+            self.assertEqual(pool.misses, 0)
+            self.assertEqual(served[0:4] * 3, served)
+
+    def test_threads(self):
+        errors = []
+        with UserAgentPool(size=128, batch=16, records=False) as pool:
+            def take():
+                for _ in range(2000):
+                    if not pool.next().startswith('Mozilla/5.0 ('):
+                        errors.append(True)
+
+            threads = [threading.Thread(target=take) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(errors, [])
+
+    def test_misses_threads(self):
+        # Every miss is counted, whichever thread takes it
+        pool = UserAgentPool(size=1, low_water=0, records=False)
+        pool.close()
+        pool.next()
+        threads = [threading.Thread(target=lambda: [pool.next() for _ in range(500)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(pool.misses, 2000)
+
+    def test_close(self):
+        pool = UserAgentPool(size=8, low_water=8, records=False)
+        pool.close()
+        for _ in range(4):
+            self.assertTrue(pool.next())
+        time.sleep(0.05)
+        self.assertEqual(len(pool), 4)  # Not refilled
+
+    def test_collected(self):
+        # A pool which is not closed is collected, and its thread stops
+        count = lambda: sum(thread.name == 'ua-generator-pool' for thread in threading.enumerate())
+        running = count()
+        pool = UserAgentPool(size=8, low_water=8, records=False)
+        pool.next()
+        self.assertEqual(count(), running + 1)
+        reference = weakref.ref(pool)
+        del pool
+        gc.collect()
+        self.assertIsNone(reference())
+        self.assertTrue(wait_for(lambda: count() == running))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, UserAgentPool, size=0)
+        self.assertRaises(ValueError, UserAgentPool, batch=0)
+        self.assertRaises(ValueError, UserAgentPool, reuse=0)
+        self.assertRaises(exceptions.InvalidArgumentError, UserAgentPool, browser='netscape')
+
+
+class TestAsyncPool(unittest.TestCase):
+    def test_get(self):
+        async def run():
+            async with AsyncUserAgentPool(device='mobile', browser='chrome', size=32, batch=8) as pool:
+                for _ in range(100):
+                    ua = await pool.get()
+                    self.assertTrue(type(ua) is UserAgent)
+                    self.assertEqual(ua.device, 'mobile')
+                    self.assertEqual(ua.headers.get()['user-agent'], ua.text)
+
+        asyncio.run(run())
+
+    def test_async_for(self):
+        async def run():
+            texts = []
+            async with AsyncUserAgentPool(platform='linux', browser='firefox', size=16, records=False) as pool:
+                async for text in pool:
+                    texts.append(text)
+                    if len(texts) == 50:
+                        break
+            return texts
+
+        texts = asyncio.run(run())
+        self.assertEqual(len(texts), 50)
+        for text in texts:
+            self.assertIn('Firefox/', text)
+
+    def test_concurrent_consumers(self):
+        async def run():
+            async with AsyncUserAgentPool(size=16, batch=4, records=False) as pool:
+                texts = await asyncio.gather(*(pool.get() for _ in range(500)))
+                self.assertLessEqual(len(pool), pool.size)
+                return texts
+
+        texts = asyncio.run(run())
+        self.assertEqual(len(texts), 500)
+        self.assertTrue(all(text.startswith('Mozilla/5.0 (') for text in texts))
+
+    def test_bounded(self):
+        async def run():
+            async with AsyncUserAgentPool(size=32, batch=8, records=False) as pool:
+                await pool.get()
+                for _ in range(200):
+                    await asyncio.sleep(0.001)
+                    self.assertLessEqual(len(pool), 32)
+                    if len(pool) == 32:
+                        break
+                self.assertEqual(len(pool), 32)  # Filled up to its size, not beyond
+
+        asyncio.run(run())
+
+    def test_same_seed(self):
+        async def run():
+            async with AsyncUserAgentPool(size=8, options=Options(seed=1234), records=False) as pool:
+                return [await pool.get() for _ in range(8)]
+
+        self.assertEqual(asyncio.run(run()), ua_generator.generate_many(8, options=Options(seed=1234)))
+
+    def test_close(self):
+        async def run():
+            pool = AsyncUserAgentPool(size=8, records=False)
+            self.assertTrue(await pool.get())
+            await pool.aclose()
+            left = [text async for text in pool]
+            self.assertEqual(len(pool), 0)
+            self.assertLessEqual(len(left), 8)
+            with self.assertRaises(RuntimeError):
+                await pool.get()
+
+        asyncio.run(run())
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, AsyncUserAgentPool, size=0)
+        self.assertRaises(ValueError, AsyncUserAgentPool, batch=0)
+        self.assertRaises(exceptions.InvalidArgumentError, AsyncUserAgentPool, browser='netscape')
+
+
+if __name__ == '__main__':
+    unittest.main()
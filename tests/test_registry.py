@@ -0,0 +1,81 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import subprocess
+import sys
+import types
+import unittest
+
+import src.ua_generator as ua_generator
+from src.ua_generator import exceptions
+from src.ua_generator.data import registry
+from src.ua_generator.data.renderer import Renderer, chromium_fields
+from src.ua_generator.data.version import Version, ChromiumVersion
+
+
+class TestRegistry(unittest.TestCase):
+    def test_names(self):
+        self.assertEqual(registry.platforms.names(), ('windows', 'macos', 'ios', 'linux', 'android'))
+        self.assertEqual(registry.platforms.names('desktop'), ('windows', 'macos', 'linux'))
+        self.assertEqual(registry.platforms.names('mobile'), ('ios', 'android'))
+        self.assertEqual(registry.browsers.names(), ('chrome', 'edge', 'firefox', 'safari'))
+
+    def test_providers(self):
+        self.assertEqual(registry.platforms['macos'].ch_platform, 'macOS')
+        self.assertTrue(registry.platforms['windows'].wow64)
+        self.assertTrue(registry.browsers['chrome'].supports_ch)
+        self.assertFalse(registry.browsers['firefox'].supports_ch)
+        self.assertTrue(registry.browsers['safari'].supports('ios'))
+        self.assertFalse(registry.browsers['safari'].supports('android'))
+        self.assertIsNone(registry.browsers['safari'].renderer('windows'))
+
+    def test_not_found(self):
+        def raised_call():
+            return registry.browsers['invalid111']
+
+        self.assertRaises(exceptions.InvalidArgumentError, raised_call)
+
+    def test_lazy_loading(self):
+        code = ('import sys; import src.ua_generator; '
+                'print(any(name.startswith("src.ua_generator.data.browsers.") or '
+                'name.startswith("src.ua_generator.data.platforms.") for name in sys.modules))')
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), 'False')
+
+    def test_register(self):
+        module = types.ModuleType('test_registry_opera')
+        module.get_version = lambda options: ChromiumVersion(Version(major=117, minor=0, build=5524, patch=11))
+        module.renderers = {
+            'windows': Renderer((
+                'Mozilla/5.0 (Windows NT {windows}; Win64; x64) AppleWebKit/{webkit} (KHTML, like Gecko) Chrome/{chrome} Safari/{webkit} OPR/{chrome}',
+            ), chromium_fields),
+        }
+        sys.modules[module.__name__] = module
+        registry.browsers.register(registry.BrowserProvider('opera', module.__name__, brands=('Chromium', 'Opera'), platforms=('windows',)))
+
+        try:
+            ua = ua_generator.generate(platform='windows', browser='opera')
+            self.assertEqual(ua.platform, 'windows')
+            self.assertTrue(ua.text.endswith('OPR/117.0.5524.11'))
+            self.assertIn('"Opera";v="117"', ua.ch.brands)
+            self.assertIn('sec-ch-ua', ua.headers.get())
+        finally:
+            registry.browsers.unregister('opera')
+            del sys.modules[module.__name__]
+
+        self.assertNotIn('opera', registry.browsers)
+
+    def test_renderer(self):
+        version = ChromiumVersion(Version(major=117, minor=0, build=5524, patch=11))
+        renderer = Renderer(('{chrome}', 'Chrome/{chrome} ({webkit})', 'No {{fields}}'), chromium_fields)
+        rendered = [renderer.render_template(index, registry.platforms['linux'], None, version) for index in range(3)]
+        self.assertEqual(rendered, ['117.0.5524.11', 'Chrome/117.0.5524.11 (537.36)', 'No {fields}'])
+        self.assertEqual(renderer.keys, (frozenset({'chrome'}), frozenset({'chrome', 'webkit'}), frozenset()))
+        for template in ('Chrome/{chrome:>20}', 'Chrome/{chrome!r}', 'Chrome/{}'):
+            self.assertRaises(ValueError, Renderer, (template,), chromium_fields)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import itertools
+import unittest
+
+import src.ua_generator as ua_generator
+from src.ua_generator.data import registry
+from src.ua_generator.data.platforms import android
+from src.ua_generator.data.space import Concat, Mapped, Product, Space
+from src.ua_generator.data.version import VersionRange
+from src.ua_generator.options import Options
+from src.ua_generator.plan import Plan
+
+
+class TestSpace(unittest.TestCase):
+    def test_product(self):
+        product = Product(('ab', range(0, 3), ('x',)))
+        self.assertEqual(len(product), 6)
+        self.assertEqual([product[i] for i in range(0, 6)], list(itertools.product('ab', range(0, 3), ('x',))))
+        self.assertEqual(product[-1], ('b', 2, 'x'))
+        self.assertRaises(IndexError, product.__getitem__, 6)
+
+    def test_concat(self):
+        concat = Concat(('ab', '', Mapped(range(0, 3), str), 'c'))
+        self.assertEqual(len(concat), 6)
+        self.assertEqual([concat[i] for i in range(0, 6)], ['a', 'b', '0', '1', '2', 'c'])
+        self.assertRaises(IndexError, concat.__getitem__, 6)
+        self.assertEqual(len(Concat(())), 0)
+
+    def test_exact(self):
+        # No duplicates, and every generated user-agent is listed
+        for platform in ('windows', 'linux', 'macos', 'ios', 'android'):
+            for browser in ('edge', 'firefox', 'safari'):
+                space = Space(Plan(platform=platform, browser=browser))
+                if not registry.browsers[browser].supports(platform) or len(space) > 20000:
+                    continue
+                texts = set(space)
+                self.assertEqual(len(texts), len(space))
+                for text in ua_generator.generate_many(500, platform=platform, browser=browser):
+                    self.assertIn(text, texts)
+
+    def test_version_ranges(self):
+        options = Options(version_ranges={'edge': VersionRange(125, 127), 'macos': VersionRange(14)})
+        texts = set(Space(Plan(platform='macos', browser='edge', options=options)))
+        for text in ua_generator.generate_many(500, platform='macos', browser='edge', options=options):
+            self.assertIn(text, texts)
+        self.assertLess(len(texts), len(Space(Plan(platform='macos', browser='edge'))))
+
+    def test_android(self):
+        # Each vendor: the build dates and numbers of each template, for each of its models
+        expected = 0
+        for vendor in android.vendors:
+            builds = 0
+            for major in set(version.major for version in vendor.versions):
+                templates = set(template for version in vendor.versions if version.major == major
+                                for template in version.build_numbers)
+                builds += len(templates) * (vendor.years[1] - vendor.years[0] + 1) * 13 * 30 * 255
+            expected += builds * len(set(vendor.platform_models))
+        self.assertEqual(len(android.space(('android', 'build', 'model'), Options())), expected)
+        self.assertEqual(len(android.space(('android',), Options())), 8)
+
+        space = android.space(('android', 'build', 'model'), Options())
+        for index in (0, 1, len(space) // 3, len(space) - 1):
+            version = space[index]
+            self.assertRegex(version.build_number, r'^[A-Z0-9]{4}\.\d{6}\.\d{1,3}$')
+            self.assertIsNotNone(version.platform_model)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import itertools
+import unittest
+
+import src.ua_generator as ua_generator
+from src.ua_generator import exceptions
+from src.ua_generator.options import Options
+from src.ua_generator.user_agent import UserAgent
+
+
+class TestStream(unittest.TestCase):
+    def test_stream(self):
+        texts = list(itertools.islice(ua_generator.stream(), 1000))
+        self.assertEqual(len(texts), 1000)
+        for text in texts:
+            self.assertTrue(type(text) is str)
+            self.assertTrue(text.startswith('Mozilla/5.0 ('))
+
+    def test_stream_limit(self):
+        self.assertEqual(len(list(ua_generator.stream(limit=100))), 100)
+        self.assertEqual(list(ua_generator.stream(limit=0)), [])
+
+    def test_stream_filters(self):
+        for text in ua_generator.stream(platform='windows', browser='edge', limit=100):
+            self.assertIn('Windows NT', text)
+            self.assertIn('Edg/', text)
+
+    def test_stream_records(self):
+        for ua in ua_generator.stream(device='mobile', browser='chrome', limit=100, records=True):
+            self.assertTrue(type(ua) is UserAgent)
+            self.assertEqual(ua.device, 'mobile')
+            self.assertEqual(ua.browser, 'chrome')
+            self.assertEqual(ua.headers.get()['user-agent'], ua.text)
+            self.assertEqual(ua.ch.mobile, '?1')
+
+    def test_stream_seed(self):
+        texts_1 = list(ua_generator.stream(limit=200, options=Options(seed=7)))
+        texts_2 = ua_generator.generate_many(200, options=Options(seed=7))
+        self.assertEqual(texts_1, texts_2)
+
+    def test_stream_invalid(self):
+        # The arguments are validated on the call, before the first item
+        self.assertRaises(exceptions.InvalidArgumentError, ua_generator.stream, browser='invalid111')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Farabee User-Agent Generator
+Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
+License: Apache License 2.0 
+"""
+import random
+import unittest
+
+from src.ua_generator.data.table import AliasTable, VersionTable
+from src.ua_generator.exceptions import InvalidArgumentError
+
+
+class TestVersionTable(unittest.TestCase):
+    def test_choice(self):
+        versions = list(range(0, 10))
+        table = VersionTable()
+        for i in range(0, 100):
+            self.assertIn(table.choice(versions, random), versions)
+
+    def test_choice_weighted(self):
+        versions = list(range(0, 10))
+        table = VersionTable(weights=(8.0, 9.0, 10.0))
+        weights = [1.0] * 7 + [8.0, 9.0, 10.0]
+
+        # The same draws as random.choices()
+        rng_1 = random.Random(5)
+        rng_2 = random.Random(5)
+        for i in range(0, 1000):
+            self.assertEqual(table.choice(versions, rng_1, weighted=True), rng_2.choices(versions, weights=weights, k=1)[0])
+            self.assertEqual(table.choice(versions, rng_1), rng_2.choices(versions, k=1)[0])
+
+    def test_choice_weighted_latest(self):
+        versions = list(range(0, 10))
+        table = VersionTable(weights=(10.0,))
+        rng = random.Random(1)
+        counts = [0] * 10
+        for i in range(0, 10000):
+            counts[table.choice(versions, rng, weighted=True)] += 1
+        self.assertTrue(counts[9] > 4 * max(counts[:9]))
+
+    def test_invalid(self):
+        self.assertRaises(InvalidArgumentError, VersionTable().choice, [], random)
+        self.assertRaises(InvalidArgumentError, VersionTable(weights=(1.0, 2.0, 3.0)).choice, [1, 2], random)
+
+    def test_rebuild(self):
+        table = VersionTable(weights=(1000.0,))
+        rng = random.Random(2)
+        versions = ['a', 'b']
+        self.assertIn(table.choice(versions, rng, weighted=True), versions)
+
+        # Replaced table
+        versions = ['c', 'd', 'e']
+        self.assertEqual(set(table.choice(versions, rng, weighted=True) for i in range(0, 100)) - set(versions), set())
+
+        # Grown table, the new latest version weighs the most
+        versions.append('f')
+        self.assertEqual(sum(table.choice(versions, rng, weighted=True) == 'f' for i in range(0, 100)) > 90, True)
+
+
+class TestAliasTable(unittest.TestCase):
+    def test_choice(self):
+        table = AliasTable(['a', 'b', 'c'], [1.0, 2.0, 7.0])
+        rng = random.Random(3)
+        counts = {'a': 0, 'b': 0, 'c': 0}
+        for i in range(0, 20000):
+            counts[table.choice(rng)] += 1
+        self.assertAlmostEqual(counts['a'] / 20000, 0.1, delta=0.02)
+        self.assertAlmostEqual(counts['b'] / 20000, 0.2, delta=0.02)
+        self.assertAlmostEqual(counts['c'] / 20000, 0.7, delta=0.02)
+
+    def test_zero_weight(self):
+        table = AliasTable(['a', 'b'], [0.0, 1.0])
+        for i in range(0, 1000):
+            self.assertEqual(table.choice(random), 'b')
+
+    def test_empty(self):
+        self.assertRaises(ValueError, AliasTable, [], [])
+        self.assertRaises(ValueError, AliasTable, ['a'], [1.0, 2.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -59,6 +59,17 @@ class TestUserAgent(unittest.TestCase):
             ua = ua_generator.generate()
             self.assertNotRegex(ua.text, brackets)
 
+    def test_user_agent_lazy(self):
+        ua = ua_generator.generate(browser='chrome')
+        self.assertIsNone(ua._UserAgent__ch)
+        self.assertIsNone(ua._UserAgent__headers)
+
+        headers = ua.headers
+        self.assertIs(ua.headers, headers)
+        self.assertIs(ua.ch, ua.ch)
+        self.assertEqual(headers.get()['user-agent'], ua.text)
+        self.assertEqual(headers.get()['sec-ch-ua'], ua.ch.brands)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,8 @@ Farabee User-Agent Generator
 Copyright: 2025 Dipto Farabee (github.com/Dipto-Farabee)
 License: Apache License 2.0 
 """
+import pickle
+import random
 import unittest
 
 from src.ua_generator.data.version import Version, WindowsVersion, AndroidVersion, ChromiumVersion
@@ -113,6 +115,46 @@ class TestVersion(unittest.TestCase):
         version = Version(build=(90, 100))
         self.assertTrue(version.build >= 90 and version.build <= 100)
 
+    def test_version_sample(self):
+        version = Version(major=1, minor=2, build=(0, 100))
+        self.assertEqual(version.ranges, (1, 2, (0, 100), None))
+        builds = set()
+        for i in range(0, 100):
+            sample = version.sample(random.Random(i))
+            self.assertIsNot(sample, version)
+            self.assertEqual((sample.major, sample.minor, sample.patch), (1, 2, None))
+            self.assertTrue(0 <= sample.build < 100)
+            self.assertEqual(sample.build, version.sample(random.Random(i)).build)
+            builds.add(sample.build)
+        self.assertTrue(len(builds) > 1)
+
+    def test_version_sample_2(self):
+        version = Version(major=1, minor=2)
+        self.assertIsNone(version.ranges)
+        self.assertIs(version.sample(random.Random()), version)
+
+    def test_version_sample_nested(self):
+        version = WindowsVersion(Version(major=10, minor=0), ch_platform=Version(major=(13, 15)))
+        sample = version.sample(random.Random())
+        self.assertEqual(sample.format(), '10.0')
+        self.assertIn(sample.ch_platform.major, (13, 14))
+
+        version = ChromiumVersion(Version(major=120, minor=0, build=6099, patch=(0, 255)))
+        sample = version.sample(random.Random())
+        self.assertIsInstance(sample, ChromiumVersion)
+        self.assertIs(sample.webkit, version.webkit)
+        self.assertTrue(0 <= sample.patch < 255)
+
+    def test_version_sample_nested_2(self):
+        version = ChromiumVersion(Version(major=120, minor=0, build=6099, patch=(0, 255)),
+                                  webkit=Version(major=537, minor=(30, 40)))
+        sample = version.sample(random.Random(3))
+        again = version.sample(random.Random(3))
+        self.assertEqual((sample.patch, sample.webkit.minor), (again.patch, again.webkit.minor))
+        self.assertIsNone(sample.ranges)
+        self.assertIsNone(sample.webkit.ranges)
+        self.assertIs(sample.sample(random.Random()), sample)  # Nothing left to draw
+
     def test_version_windows(self):
         version = WindowsVersion(version=Version(major=10, minor=0), ch_platform=Version(major=1, minor=2))
         self.assertEqual(version.format(partitions=4), '10.0.0.0')
@@ -135,6 +177,18 @@ class TestVersion(unittest.TestCase):
         version = AndroidVersion(version=Version(), build_numbers='foo')
         self.assertEqual(version.build_number, 'foo')
 
+    def test_version_android_sample(self):
+        version = AndroidVersion(Version(major=14, minor=0), build_numbers=('UP1A.{d}.{v}', 'UD1A.{d}.{v}'))
+        rng = random.Random(2)
+        for i in range(0, 100):
+            sample = version.sample(rng, years=(22, 25), platform_models=('Pixel 8', 'Pixel 8a'))
+            self.assertIsNot(sample, version)
+            self.assertEqual(sample, version)
+            self.assertRegex(sample.build_number, r'^U[PD]1A\.(2[2-5])\d{4}\.\d{1,3}$')
+            self.assertIn(sample.platform_model, ('Pixel 8', 'Pixel 8a'))
+        self.assertEqual(version.build_numbers, ('UP1A.{d}.{v}', 'UD1A.{d}.{v}'))
+        self.assertIsNone(version.platform_model)
+
     def test_version_chromium(self):
         version = ChromiumVersion(Version(major=1, minor=2, build=3, patch=4), webkit=Version(537, 36))
         self.assertEqual(version.format(partitions=4), '1.2.3.4')
@@ -160,6 +214,34 @@ class TestVersion(unittest.TestCase):
         self.assertTrue(version_1 <= version_2)
         self.assertTrue(version_1 >= version_2)
 
+    def test_version_hash(self):
+        self.assertEqual(hash(Version(major=1, minor=0)), hash(Version(major=1, minor=0, build=0)))
+        self.assertEqual(len({Version(major=1, minor=0), Version(major=1), Version(major=2)}), 2)
+        self.assertFalse(Version(major=1) == (1, 0, 0, 0))
+
+    def test_version_slots(self):
+        for version in (Version(major=1), ChromiumVersion(Version(major=1)), AndroidVersion(Version(major=1)),
+                        WindowsVersion(Version(major=1), ch_platform=Version(major=0))):
+            self.assertFalse(hasattr(version, '__dict__'))
+
+    def test_version_read_only(self):
+        # A version is hashed, so its parts cannot be changed
+        version = Version(major=1, minor=2)
+        versions = {version}
+        for name in ('major', 'build', 'ranges'):
+            self.assertRaises(AttributeError, setattr, version, name, 3)
+        self.assertRaises(AttributeError, setattr, ChromiumVersion(version), 'webkit', version)
+        self.assertIn(Version(major=1, minor=2), versions)
+        self.assertFalse(version == (1, 2, None, None, None))
+
+    def test_version_pickle(self):
+        version = WindowsVersion(Version(major=10, minor=0), ch_platform=Version(major=(13, 15)))
+        copy = pickle.loads(pickle.dumps(version))
+        self.assertEqual(copy, version)
+        self.assertEqual(copy.ch_platform, version.ch_platform)
+        self.assertEqual(copy.ch_platform.ranges, version.ch_platform.ranges)
+        self.assertIsNone(copy.build)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,6 +6,7 @@ License: Apache License 2.0
 import unittest
 
 import src.ua_generator as ua_generator
+from src.ua_generator.data.table import VersionTable
 from src.ua_generator.data.version import Version, VersionRange
 from src.ua_generator.options import Options
 
@@ -134,6 +135,55 @@ class TestVersionRange(unittest.TestCase):
             self.assertIsNotNone(ua.generator.browser_version)
             self.assertTrue(ua.generator.browser_version.major <= chrome_max)
 
+    def test_version_range_full_precision(self):
+        version_range = VersionRange(Version(major=120, minor=0, build=6099), Version(major=124, minor=0, build=6367))
+        options = Options(version_ranges={'chrome': version_range})
+        majors = set()
+        for i in range(0, 200):
+            ua = ua_generator.generate(browser='chrome', options=options)
+            version = ua.generator.browser_version
+            self.assertTrue((120, 0, 6099) <= (version.major, version.minor, version.build) <= (124, 0, 6367))
+            majors.add(version.major)
+        self.assertEqual(majors, {120, 121, 122, 123, 124})
+
+    def test_version_range_full_precision_2(self):
+        # 124.0.6367.x is above 124.0.6000.0
+        options = Options(version_ranges={'chrome': VersionRange(min_version=120, max_version=Version(major=124, minor=0, build=6000, patch=0))})
+        for i in range(0, 100):
+            ua = ua_generator.generate(browser='chrome', options=options)
+            self.assertTrue(120 <= ua.generator.browser_version.major <= 123)
+
+    def test_version_range_filter(self):
+        versions = [Version(major=1, minor=0, build=(0, 3)), Version(major=1, minor=1), Version(major=2, minor=0)]
+        self.assertEqual(VersionRange(1, 1).filter(versions), versions[:2])
+        self.assertEqual(VersionRange(Version(major=1, minor=0, build=1), 2).filter(versions), versions[1:])
+        self.assertEqual(VersionRange(max_version=Version(major=1, minor=0, build=2)).filter(versions), versions[:1])
+        self.assertEqual(VersionRange(max_version=Version(major=1, minor=0, build=1)).filter(versions), [])
+        self.assertEqual(VersionRange().filter(versions), [])
+
+    def test_version_range_table(self):
+        versions = [Version(major=1, minor=0, build=(0, 3)), Version(major=1, minor=1), Version(major=2, minor=0)]
+        table = VersionTable()
+        for version_range in (VersionRange(1, 1), VersionRange(Version(major=1, minor=0, build=1), 2),
+                              VersionRange(max_version=Version(major=1, minor=0, build=2)), VersionRange(3, 4)):
+            self.assertEqual(table.filter(versions, version_range), version_range.filter(versions))
+
+        # Cached for the same range
+        version_range = VersionRange(1, 1)
+        self.assertIs(table.filter(versions, version_range), table.filter(versions, version_range))
+        self.assertIs(table.filter(versions, version_range), table.filter(versions, VersionRange(1, 1)))
+
+        # Rebuilt for a changed table
+        versions.append(Version(major=1, minor=2))
+        self.assertEqual(table.filter(versions, version_range), [versions[0], versions[1], versions[3]])
+
+    def test_version_range_table_overlapping(self):
+        # The first version starts below the second one, but may be sampled above the range
+        versions = [Version(major=1, minor=0, build=(0, 6)), Version(major=1, minor=0, build=1)]
+        version_range = VersionRange(1, Version(major=1, minor=0, build=2))
+        self.assertEqual(version_range.filter(versions), versions[1:])
+        self.assertEqual(VersionTable().filter(versions, version_range), version_range.filter(versions))
+
     def test_version_range_invalid(self):
         # MUST be INVALID version range
         edge_min = 1